@@ -26,3 +26,10 @@ LOG_LEVEL = os.getenv("LOG_LEVEL", "INFO")
 REDIS_HOST = os.getenv("REDIS_HOST", "localhost")
 REDIS_PORT = os.getenv("REDIS_PORT", "6379")
 REDIS_URL = f"redis://{REDIS_HOST}:{REDIS_PORT}"
+WS_CLIENT_QUEUE_SIZE = int(os.getenv("WS_CLIENT_QUEUE_SIZE", "256"))
+WS_HISTORY_LENGTH = int(os.getenv("WS_HISTORY_LENGTH", "1000"))
+READ_MODEL_TTL_SECONDS = int(os.getenv("READ_MODEL_TTL_SECONDS", "600"))
+EXPORT_WORKERS = int(os.getenv("EXPORT_WORKERS", str(os.cpu_count() or 2)))
+EXPORT_JOB_TTL_SECONDS = int(os.getenv("EXPORT_JOB_TTL_SECONDS", "3600"))
+EXPORT_JOB_HEARTBEAT_SECONDS = int(os.getenv("EXPORT_JOB_HEARTBEAT_SECONDS", "15"))
+EXPORT_JOB_STALE_SECONDS = int(os.getenv("EXPORT_JOB_STALE_SECONDS", "60"))
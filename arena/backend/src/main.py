@@ -10,6 +10,10 @@ from src.dependencies.auth import get_current_user
 from src.middleware import add_cors_middleware
 from src.routers import routers
 from src.services.broadcast import broadcast
+from src.services.export_jobs import export_jobs
+from src.services.read_models import cache as read_model_cache
+from src.services.tournament_feed import feed
+from src.services.ws_hub import hub
 
 
 @asynccontextmanager
@@ -18,7 +22,11 @@ async def lifespan(_app: FastAPI) -> AsyncGenerator[None, None]:
     try:
         yield
     finally:
+        await hub.close()
         await broadcast.disconnect()
+        await feed.close()
+        await read_model_cache.close()
+        await export_jobs.close()
 
 
 app = FastAPI(lifespan=lifespan)
@@ -12,6 +12,7 @@ from src.schemas import (
     AthleteUpdate,
     PaginatedAthletesResponse,
 )
+from src.services.read_models import athlete_tournament_ids, invalidate_tournament_read_models
 
 router = APIRouter(prefix="/athletes", tags=["Athletes"], dependencies=[Depends(get_current_user)])
 
@@ -180,7 +181,10 @@ async def update_athlete(id: int, athlete_update: AthleteUpdate, db: AsyncSessio
         links = [AthleteCoachLink(athlete_id=id, coach_id=coach_id) for coach_id in athlete_update.coaches_id]
         db.add_all(links)
 
+    tournament_ids = await athlete_tournament_ids(db, id)
     await db.commit()
+    for tournament_id in tournament_ids:
+        await invalidate_tournament_read_models(tournament_id)
 
     result = await db.execute(
         select(Athlete)
@@ -200,6 +204,9 @@ async def delete_athlete(id: int, db: AsyncSession = Depends(get_db)) -> None:
     if not athlete:
         raise HTTPException(status_code=404, detail="Athlete not found")
 
+    tournament_ids = await athlete_tournament_ids(db, id)
     await db.delete(athlete)
     await db.commit()
+    for tournament_id in tournament_ids:
+        await invalidate_tournament_read_models(tournament_id)
     # No response body for 204 No Content
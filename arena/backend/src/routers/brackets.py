@@ -1,4 +1,4 @@
-from fastapi import APIRouter, Body, Depends, HTTPException
+from fastapi import APIRouter, Body, Depends, HTTPException, Response
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
 
@@ -16,16 +16,13 @@ from src.schemas import (
     ParticipantMoveSchema,
     ParticipantReorderSchema,
 )
+from src.services.bracket_projection import render_bracket_matches
 from src.services.brackets import create_bracket as create_bracket_service
 from src.services.brackets import delete_bracket as delete_bracket_service
 from src.services.brackets import get_all_brackets as get_all_brackets_service
 from src.services.brackets import get_bracket as get_bracket_service
-from src.services.brackets import get_bracket_matches as get_bracket_matches_service
 from src.services.brackets import move_participant as move_participant_service
-from src.services.brackets import (
-    regenerate_bracket_matches,
-    regenerate_round_bracket_matches,
-)
+from src.services.brackets import regenerate_bracket_matches, regenerate_round_bracket_matches
 from src.services.brackets import reorder_participants as reorder_participants_service
 from src.services.brackets import start_bracket as start_bracket_service
 from src.services.brackets import update_bracket as update_bracket_service
@@ -61,9 +58,8 @@ async def update_bracket(
 
 
 @router.get("/{bracket_id}/matches", response_model=list[BracketMatchResponse])
-async def get_bracket_matches(bracket_id: int, db: AsyncSession = Depends(get_db)) -> list[BracketMatchResponse]:
-    matches = await get_bracket_matches_service(db, bracket_id)
-    return [BracketMatchResponse.model_validate(match) for match in matches]
+async def get_bracket_matches(bracket_id: int, db: AsyncSession = Depends(get_db)) -> Response:
+    return Response(content=await render_bracket_matches(db, bracket_id), media_type="application/json")
 
 
 @router.post("/{bracket_id}/regenerate", dependencies=[Depends(get_current_user)])
@@ -1,4 +1,4 @@
-from fastapi import APIRouter, Body, Depends, File, HTTPException, Query, UploadFile
+from fastapi import APIRouter, Body, Depends, File, HTTPException, Query, Request, Response, UploadFile
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.database import get_db
@@ -9,6 +9,8 @@ from src.schemas import (
     ApplicationResponse,
     BracketMatchesFull,
     BracketResponse,
+    CompetitorImportResponse,
+    ExportJobResponse,
     PaginatedTournamentResponse,
     TimetableEntryResponse,
     TimetableReplace,
@@ -18,21 +20,25 @@ from src.schemas import (
     TournamentUpdate,
 )
 from src.services.import_competitors import import_competitors_from_cbr
+from src.services.read_models import cached_tournament_read_model
 from src.services.tournaments import approve_all_applications as approve_all_applications_service
 from src.services.tournaments import approve_application as approve_application_service
 from src.services.tournaments import create_tournament as create_tournament_service
 from src.services.tournaments import delete_tournament as delete_tournament_service
 from src.services.tournaments import generate_brackets_export_file as generate_brackets_export_file_service
 from src.services.tournaments import get_applications as get_applications_service
-from src.services.tournaments import get_matches_for_tournament_full as get_matches_for_tournament_full_service
+from src.services.tournaments import get_export_job as get_export_job_service
 from src.services.tournaments import get_participant_count_per_coach as get_participant_count_per_coach_service
 from src.services.tournaments import get_tournament as get_tournament_service
-from src.services.tournaments import get_tournament_bootstrap_snapshot as get_tournament_bootstrap_snapshot_service
-from src.services.tournaments import get_tournament_brackets as get_tournament_brackets_service
 from src.services.tournaments import list_timetable_entries as list_timetable_entries_service
 from src.services.tournaments import list_tournaments as list_tournaments_service
 from src.services.tournaments import regenerate_tournament as regenerate_tournament_service
 from src.services.tournaments import remove_competitor as remove_competitor_service
+from src.services.tournaments import (
+    render_matches_for_tournament_full,
+    render_tournament_bootstrap_snapshot,
+    render_tournament_brackets,
+)
 from src.services.tournaments import replace_timetable_entries as replace_timetable_entries_service
 from src.services.tournaments import start_tournament as start_tournament_service
 from src.services.tournaments import submit_application as submit_application_service
@@ -76,9 +82,12 @@ async def get_tournament(id: int, db: AsyncSession = Depends(get_db)) -> Tournam
 )
 async def get_tournament_bootstrap_snapshot(
     tournament_id: int,
+    request: Request,
     db: AsyncSession = Depends(get_db),
-) -> TournamentBootstrapSnapshot:
-    return await get_tournament_bootstrap_snapshot_service(db, tournament_id)
+) -> Response:
+    return await cached_tournament_read_model(
+        request, db, tournament_id, "bootstrap", lambda: render_tournament_bootstrap_snapshot(db, tournament_id)
+    )
 
 
 @router.post("", response_model=TournamentResponse, dependencies=[Depends(get_current_user)])
@@ -103,11 +112,14 @@ async def delete_tournament(id: int, db: AsyncSession = Depends(get_db)) -> None
 @router.get("/{tournament_id}/brackets", response_model=list[BracketResponse])
 async def get_all_brackets(
     tournament_id: int,
+    request: Request,
     sorted: bool = Query(True, description="Sort brackets by category and id"),
     db: AsyncSession = Depends(get_db),
-) -> list[BracketResponse]:
-    brackets = await get_tournament_brackets_service(db, tournament_id, sorted)
-    return [BracketResponse.model_validate(bracket) for bracket in brackets]
+) -> Response:
+    view = "brackets_sorted" if sorted else "brackets"
+    return await cached_tournament_read_model(
+        request, db, tournament_id, view, lambda: render_tournament_brackets(db, tournament_id, sorted)
+    )
 
 
 # CLI ONLY
@@ -124,10 +136,11 @@ async def get_participant_count_per_coach(
     dependencies=[Depends(get_current_user)],
 )
 async def get_matches_for_tournament_full(
-    tournament_id: int, db: AsyncSession = Depends(get_db)
-) -> list[BracketMatchesFull]:
-    brackets = await get_matches_for_tournament_full_service(db, tournament_id)
-    return [BracketMatchesFull.model_validate(bracket) for bracket in brackets]
+    tournament_id: int, request: Request, db: AsyncSession = Depends(get_db)
+) -> Response:
+    return await cached_tournament_read_model(
+        request, db, tournament_id, "matches_full", lambda: render_matches_for_tournament_full(db, tournament_id)
+    )
 
 
 @router.post("/{tournament_id}/regenerate", dependencies=[Depends(get_current_user)])
@@ -136,20 +149,35 @@ async def regenerate_tournament(tournament_id: int, db: AsyncSession = Depends(g
     return {"status": "ok"}
 
 
-@router.get("/{tournament_id}/export_file", dependencies=[Depends(get_current_user)])
-async def generate_brackets_export_file(tournament_id: int, db: AsyncSession = Depends(get_db)) -> dict[str, str]:
+@router.get("/{tournament_id}/export_file", response_model=ExportJobResponse, dependencies=[Depends(get_current_user)])
+async def generate_brackets_export_file(tournament_id: int, db: AsyncSession = Depends(get_db)) -> ExportJobResponse:
     return await generate_brackets_export_file_service(db, tournament_id)
 
 
-@router.post("/{tournament_id}/import", dependencies=[Depends(get_current_user)])
+@router.get(
+    "/{tournament_id}/export_jobs/{job_id}",
+    response_model=ExportJobResponse,
+    dependencies=[Depends(get_current_user)],
+)
+async def get_export_job(tournament_id: int, job_id: str) -> ExportJobResponse:
+    return await get_export_job_service(tournament_id, job_id)
+
+
+@router.post(
+    "/{tournament_id}/import",
+    response_model=CompetitorImportResponse,
+    dependencies=[Depends(get_current_user)],
+)
 async def import_competitors(
     tournament_id: int,
     file: UploadFile = File(...),
     db: AsyncSession = Depends(get_db),
-) -> dict[str, str]:
+) -> CompetitorImportResponse:
     try:
         content = await file.read()
         return await import_competitors_from_cbr(db, tournament_id, content)
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"An error occurred while importing competitors: {str(e)}")
 
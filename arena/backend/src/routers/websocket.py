@@ -1,19 +1,46 @@
-from fastapi import APIRouter, WebSocket
+import json
+from typing import Any
+
+from fastapi import APIRouter, Depends, WebSocket
 from starlette.websockets import WebSocketDisconnect
 
-from src.services.broadcast import broadcast
+from src.dependencies.auth import get_current_user
+from src.services.tournament_feed import feed, tournament_channel
+from src.services.ws_hub import hub
 
 router = APIRouter(tags=["WebSocket"])
 
+# 1013 "Try Again Later": the client fell too far behind and should reconnect and refetch.
+SLOW_CONSUMER_CLOSE_CODE = 1013
+
 
 @router.websocket("/ws/tournament/{tournament_id}")
-async def websocket_endpoint(websocket: WebSocket, tournament_id: int) -> None:
+async def websocket_endpoint(websocket: WebSocket, tournament_id: int, since: int | None = None) -> None:
     await websocket.accept()
     try:
-        async with broadcast.subscribe(channel=f"tournament:{tournament_id}") as subscriber:
-            async for event in subscriber:  # type: ignore
-                if event is None:
-                    continue
-                await websocket.send_text(event.message)
+        async with hub.connect(tournament_channel(tournament_id)) as client:
+            if since is None:
+                current = await feed.current_seq(tournament_id)
+                await websocket.send_text(json.dumps({"type": "sequence", "seq": current}))
+            else:
+                history = await feed.history_since(tournament_id, since)
+                if history is None:
+                    current = await feed.current_seq(tournament_id)
+                    client.resume_from(current)
+                    await websocket.send_text(json.dumps({"type": "resync", "seq": current}))
+                else:
+                    client.resume_from(since + len(history))
+                    for missed in history:
+                        await websocket.send_text(missed)
+
+            while (message := await client.receive()) is not None:
+                await websocket.send_text(message)
+            if client.overflowed:
+                await websocket.close(code=SLOW_CONSUMER_CLOSE_CODE)
     except WebSocketDisconnect:
         pass
+
+
+@router.get("/ws/stats", dependencies=[Depends(get_current_user)])
+async def websocket_stats() -> dict[str, Any]:
+    return hub.stats()
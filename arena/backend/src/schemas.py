@@ -1,6 +1,6 @@
 import uuid
 from datetime import UTC, date, datetime, time
-from typing import Any, Optional
+from typing import Any, Literal, Optional
 
 from pydantic import AliasPath, BaseModel, ConfigDict, Field, computed_field
 
@@ -363,6 +363,17 @@ class MatchUpdate(BaseModel):
     status: str | None
 
 
+class BracketVersionUpdate(BaseModel):
+    bracket_id: int
+    version: int
+
+
+class MatchBatchUpdate(BaseModel):
+    type: Literal["match_batch"] = "match_batch"
+    matches: list[MatchUpdate]
+    brackets: list[BracketVersionUpdate]
+
+
 class SyncConflict(BaseModel):
     seq: int
     reason: str
@@ -398,3 +409,25 @@ class SyncUpsertsResponse(BaseModel):
     duplicates: list[int]
     conflicts: list[SyncConflict]
     last_applied_seq: int
+
+
+class ExportJobResponse(BaseModel):
+    job_id: Optional[str] = None
+    tournament_id: int
+    status: Literal["queued", "running", "finished", "failed"]
+    filename: Optional[str] = None
+    detail: Optional[str] = None
+    updated_at: Optional[datetime] = None
+
+
+class CompetitorImportResponse(BaseModel):
+    status: str
+    message: str
+    competitors: int
+    coaches_created: int
+    categories_created: int
+    athletes_created: int
+    coach_links_created: int
+    brackets_created: int
+    participants_created: int
+    timings_ms: dict[str, float]
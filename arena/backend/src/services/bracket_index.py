@@ -0,0 +1,82 @@
+from champion_domain import BracketIndex, BracketPlacements, PlacementMatchInput, compute_bracket_placements
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.models import Bracket, BracketMatch, Match, MatchStage, MatchStatus
+
+
+def match_placement_input(match: Match, round_number: int, position: int | None) -> PlacementMatchInput:
+    return PlacementMatchInput(
+        round_number=round_number,
+        stage=match.stage,
+        status=match.status,
+        winner_id=match.winner_id,
+        athlete1_id=match.athlete1_id,
+        athlete2_id=match.athlete2_id,
+        repechage_side=match.repechage_side,
+        repechage_step=match.repechage_step,
+        position=position,
+    )
+
+
+def bracket_placements(bracket: Bracket) -> BracketPlacements:
+    return BracketPlacements(
+        place_1_id=bracket.place_1_id,
+        place_2_id=bracket.place_2_id,
+        place_3_a_id=bracket.place_3_a_id,
+        place_3_b_id=bracket.place_3_b_id,
+    )
+
+
+def apply_bracket_placements(bracket: Bracket, placements: BracketPlacements) -> None:
+    bracket.place_1_id = placements.place_1_id
+    bracket.place_2_id = placements.place_2_id
+    bracket.place_3_a_id = placements.place_3_a_id
+    bracket.place_3_b_id = placements.place_3_b_id
+
+
+async def load_bracket_index(db: AsyncSession, bracket_id: int) -> BracketIndex[PlacementMatchInput]:
+    rows = (
+        await db.execute(
+            select(
+                BracketMatch.round_number,
+                BracketMatch.position,
+                Match.stage,
+                Match.status,
+                Match.winner_id,
+                Match.athlete1_id,
+                Match.athlete2_id,
+                Match.repechage_side,
+                Match.repechage_step,
+            )
+            .join(Match, Match.id == BracketMatch.match_id)
+            .where(BracketMatch.bracket_id == bracket_id)
+        )
+    ).all()
+    return BracketIndex(
+        (
+            PlacementMatchInput(
+                round_number=row.round_number,
+                stage=row.stage,
+                status=row.status,
+                winner_id=row.winner_id,
+                athlete1_id=row.athlete1_id,
+                athlete2_id=row.athlete2_id,
+                repechage_side=row.repechage_side,
+                repechage_step=row.repechage_step,
+                position=row.position,
+            )
+            for row in rows
+        ),
+        repechage_stage_value=MatchStage.REPECHAGE.value,
+        finished_status_value=MatchStatus.FINISHED.value,
+    )
+
+
+async def recompute_bracket_placements(db: AsyncSession, bracket_id: int) -> None:
+    bracket = await db.get(Bracket, bracket_id)
+    if bracket is None:
+        return
+
+    placements = compute_bracket_placements(index=await load_bracket_index(db, bracket_id))
+    apply_bracket_placements(bracket, placements)
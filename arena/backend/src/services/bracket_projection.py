@@ -0,0 +1,175 @@
+from collections import defaultdict
+from collections.abc import Iterable, Sequence
+from typing import Any, cast
+
+from pydantic_core import to_json
+from sqlalchemy import Row, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.sql.elements import ColumnElement
+
+from src.models import Athlete, AthleteCoachLink, Bracket, BracketMatch, Category, Coach, Match
+
+# Keys follow the BracketMatchResponse / BracketMatchesFull field order so the JSON stays byte-compatible.
+
+_BRACKET_MATCH_COLUMNS = (
+    BracketMatch.bracket_id,
+    BracketMatch.id,
+    BracketMatch.round_number,
+    BracketMatch.position,
+    BracketMatch.next_slot,
+    Match.id.label("match_id"),
+    Match.round_type,
+    Match.stage,
+    Match.repechage_side,
+    Match.repechage_step,
+    Match.athlete1_id,
+    Match.athlete2_id,
+    Match.winner_id,
+    Match.score_athlete1,
+    Match.score_athlete2,
+    Match.status,
+    Match.started_at,
+    Match.ended_at,
+)
+
+
+async def _load_athletes(db: AsyncSession, athlete_ids: Iterable[int | None]) -> dict[int, dict[str, Any]]:
+    ids = {athlete_id for athlete_id in athlete_ids if athlete_id is not None}
+    if not ids:
+        return {}
+
+    coaches: defaultdict[int, list[str]] = defaultdict(list)
+    coach_rows = await db.execute(
+        select(AthleteCoachLink.athlete_id, Coach.last_name)
+        .join(Coach, Coach.id == AthleteCoachLink.coach_id)
+        .where(AthleteCoachLink.athlete_id.in_(ids))
+        .order_by(AthleteCoachLink.id)
+    )
+    for athlete_id, coach_last_name in coach_rows.all():
+        coaches[athlete_id].append(coach_last_name)
+
+    athlete_rows = await db.execute(
+        select(Athlete.id, Athlete.first_name, Athlete.last_name).where(Athlete.id.in_(ids))
+    )
+    return {
+        athlete_id: {
+            "id": athlete_id,
+            "first_name": first_name,
+            "last_name": last_name,
+            "coaches_last_name": coaches.get(athlete_id, []),
+        }
+        for athlete_id, first_name, last_name in athlete_rows.all()
+    }
+
+
+async def _load_bracket_match_rows(db: AsyncSession, *criteria: ColumnElement[bool]) -> Sequence[Row[Any]]:
+    result = await db.execute(
+        select(*_BRACKET_MATCH_COLUMNS)
+        .join(Match, Match.id == BracketMatch.match_id)
+        .where(*criteria)
+        .order_by(BracketMatch.bracket_id, BracketMatch.round_number, BracketMatch.position)
+    )
+    return cast(Sequence[Row[Any]], result.all())
+
+
+def _athlete(athletes: dict[int, dict[str, Any]], athlete_id: int | None) -> dict[str, Any] | None:
+    return athletes.get(athlete_id) if athlete_id is not None else None
+
+
+def _bracket_match(row: Row[Any], athletes: dict[int, dict[str, Any]]) -> dict[str, Any]:
+    return {
+        "id": row.id,
+        "round_number": row.round_number,
+        "position": row.position,
+        "match": {
+            "id": row.match_id,
+            "round_type": row.round_type,
+            "stage": row.stage,
+            "repechage_side": row.repechage_side,
+            "repechage_step": row.repechage_step,
+            "athlete1": _athlete(athletes, row.athlete1_id),
+            "athlete2": _athlete(athletes, row.athlete2_id),
+            "winner": _athlete(athletes, row.winner_id),
+            "score_athlete1": row.score_athlete1,
+            "score_athlete2": row.score_athlete2,
+            "status": row.status,
+            "started_at": row.started_at,
+            "ended_at": row.ended_at,
+        },
+        "next_slot": row.next_slot,
+    }
+
+
+def _match_athlete_ids(rows: Iterable[Row[Any]]) -> Iterable[int | None]:
+    for row in rows:
+        yield row.athlete1_id
+        yield row.athlete2_id
+        yield row.winner_id
+
+
+async def render_bracket_matches(db: AsyncSession, bracket_id: int) -> bytes:
+    rows = await _load_bracket_match_rows(db, BracketMatch.bracket_id == bracket_id)
+    athletes = await _load_athletes(db, _match_athlete_ids(rows))
+    return to_json([_bracket_match(row, athletes) for row in rows])
+
+
+async def render_tournament_bracket_matches(db: AsyncSession, tournament_id: int) -> bytes:
+    bracket_rows = (
+        await db.execute(
+            select(
+                Bracket.id,
+                Bracket.type,
+                Bracket.group_id,
+                Bracket.status,
+                Bracket.state,
+                Bracket.version,
+                Bracket.place_1_id,
+                Bracket.place_2_id,
+                Bracket.place_3_a_id,
+                Bracket.place_3_b_id,
+                Category.name.label("category"),
+            )
+            .join(Category, Category.id == Bracket.category_id)
+            .where(Bracket.tournament_id == tournament_id)
+            .order_by(Bracket.id)
+        )
+    ).all()
+    if not bracket_rows:
+        return to_json([])
+
+    match_rows = await _load_bracket_match_rows(db, BracketMatch.bracket_id.in_([row.id for row in bracket_rows]))
+    place_ids = (
+        athlete_id
+        for row in bracket_rows
+        for athlete_id in (row.place_1_id, row.place_2_id, row.place_3_a_id, row.place_3_b_id)
+    )
+    athletes = await _load_athletes(db, [*place_ids, *_match_athlete_ids(match_rows)])
+
+    matches_by_bracket: defaultdict[int, list[dict[str, Any]]] = defaultdict(list)
+    for row in match_rows:
+        matches_by_bracket[row.bracket_id].append(_bracket_match(row, athletes))
+
+    return to_json(
+        [
+            {
+                "category": row.category,
+                "type": row.type,
+                "group_id": row.group_id,
+                "display_name": (
+                    f"{row.category} (Group {row.group_id})"
+                    if row.group_id is not None and row.group_id != 1
+                    else row.category
+                ),
+                "status": row.status,
+                "state": row.state,
+                "version": row.version,
+                "place_1": _athlete(athletes, row.place_1_id),
+                "place_2": _athlete(athletes, row.place_2_id),
+                "place_3_a": _athlete(athletes, row.place_3_a_id),
+                "place_3_b": _athlete(athletes, row.place_3_b_id),
+                "bracket_id": row.id,
+                "matches": matches_by_bracket.get(row.id, []),
+            }
+            for row in bracket_rows
+        ]
+    )
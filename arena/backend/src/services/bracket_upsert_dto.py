@@ -40,6 +40,7 @@ class StructureMatchDTO(BaseModel):
 
 
 class BracketStructureSnapshotDTO(BaseModel):
+    type: str | None = None
     status: str | None = None
     participants: list[StructureParticipantDTO]
     matches: list[StructureMatchDTO]
@@ -81,6 +82,7 @@ def parse_structure_payload_dto(
                 ended_at=item.ended_at,
             ),
             main_rounds=main_rounds,
+            bracket_type=snapshot.type,
         )
         for item in snapshot.matches
     ]
@@ -1,17 +1,22 @@
+from collections.abc import Iterable, Sequence
 from datetime import UTC, datetime
-from typing import Optional
+from typing import Any, Optional
+from uuid import UUID, uuid4
 
 from champion_domain import (
     IMMUTABLE_BRACKET_STATES,
+    SUPPORTED_BRACKET_TYPES,
+    BracketPlanRequest,
     SeededParticipant,
     bump_bracket_version,
     derive_bracket_state_from_status,
     is_bracket_structurally_mutable,
     plan_bracket_matches,
+    plan_tournament_brackets,
 )
 from champion_domain.use_cases import PlannedMatch
 from fastapi import HTTPException
-from sqlalchemy import delete, select, update
+from sqlalchemy import delete, insert, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import joinedload, selectinload
 
@@ -37,6 +42,7 @@ from src.schemas import (
     ParticipantMoveSchema,
     ParticipantReorderSchema,
 )
+from src.services.read_models import invalidate_tournament_read_models
 
 
 async def _ensure_bracket_editable(db: AsyncSession, bracket_id: int) -> Bracket:
@@ -56,43 +62,84 @@ async def _reset_and_clear_bracket_structure(db: AsyncSession, bracket_id: int)
     bracket.place_3_b_id = None
     bump_bracket_version(bracket)
 
+    await _delete_bracket_matches(db, [bracket_id])
+    return bracket
+
+
+async def _delete_bracket_matches(db: AsyncSession, bracket_ids: Sequence[int]) -> None:
     await db.execute(
-        delete(Match).where(Match.id.in_(select(BracketMatch.match_id).where(BracketMatch.bracket_id == bracket_id)))
+        delete(Match).where(Match.id.in_(select(BracketMatch.match_id).where(BracketMatch.bracket_id.in_(bracket_ids))))
     )
-    await db.execute(delete(BracketMatch).where(BracketMatch.bracket_id == bracket_id))
-    return bracket
+    await db.execute(delete(BracketMatch).where(BracketMatch.bracket_id.in_(bracket_ids)))
+
 
+async def _reset_brackets_structure(db: AsyncSession, bracket_ids: Sequence[int]) -> None:
+    await db.execute(
+        update(Bracket)
+        .where(Bracket.id.in_(bracket_ids))
+        .values(
+            place_1_id=None,
+            place_2_id=None,
+            place_3_a_id=None,
+            place_3_b_id=None,
+            version=Bracket.version + 1,
+        )
+    )
+    await _delete_bracket_matches(db, bracket_ids)
 
-async def generate_all_rounds(
-    db: AsyncSession, bracket_id: int, planned_matches: list[PlannedMatch]
-) -> list[BracketMatch]:
-    created: list[BracketMatch] = []
+
+def _planned_match_rows(
+    bracket_id: int, planned_matches: Sequence[PlannedMatch], now: datetime
+) -> tuple[list[dict[str, Any]], list[dict[str, Any]]]:
+    match_rows: list[dict[str, Any]] = []
+    bracket_match_rows: list[dict[str, Any]] = []
 
     for planned in planned_matches:
+        match_id = uuid4()
         is_bye_win = planned.status == MatchStatus.FINISHED.value and planned.winner_id is not None
-        match = Match(
-            athlete1_id=planned.athlete1_id,
-            athlete2_id=planned.athlete2_id,
-            winner_id=planned.winner_id,
-            round_type=planned.round_type,
-            stage=MatchStage.MAIN.value,
-            status=planned.status,
-            ended_at=datetime.now(UTC) if is_bye_win else None,
+        match_rows.append(
+            {
+                "id": match_id,
+                "athlete1_id": planned.athlete1_id,
+                "athlete2_id": planned.athlete2_id,
+                "winner_id": planned.winner_id,
+                "round_type": planned.round_type,
+                "stage": MatchStage.MAIN.value,
+                "status": planned.status,
+                "ended_at": now if is_bye_win else None,
+            }
         )
-        db.add(match)
-        await db.flush()
-
-        bracket_match = BracketMatch(
-            bracket_id=bracket_id,
-            round_number=planned.round_number,
-            position=planned.position,
-            match_id=match.id,
-            next_slot=planned.next_slot,
+        bracket_match_rows.append(
+            {
+                "id": uuid4(),
+                "bracket_id": bracket_id,
+                "round_number": planned.round_number,
+                "position": planned.position,
+                "match_id": match_id,
+                "next_slot": planned.next_slot,
+            }
         )
-        db.add(bracket_match)
-        created.append(bracket_match)
 
-    return created
+    return match_rows, bracket_match_rows
+
+
+async def insert_planned_brackets(db: AsyncSession, plans: Iterable[tuple[int, Sequence[PlannedMatch]]]) -> list[UUID]:
+    now = datetime.now(UTC)
+    match_rows: list[dict[str, Any]] = []
+    bracket_match_rows: list[dict[str, Any]] = []
+    for bracket_id, planned_matches in plans:
+        matches, bracket_matches = _planned_match_rows(bracket_id, planned_matches, now)
+        match_rows.extend(matches)
+        bracket_match_rows.extend(bracket_matches)
+
+    if match_rows:
+        await db.execute(insert(Match), match_rows)
+        await db.execute(insert(BracketMatch), bracket_match_rows)
+    return [row["id"] for row in bracket_match_rows]
+
+
+async def generate_all_rounds(db: AsyncSession, bracket_id: int, planned_matches: Sequence[PlannedMatch]) -> list[UUID]:
+    return await insert_planned_brackets(db, [(bracket_id, planned_matches)])
 
 
 async def regenerate_bracket_matches(
@@ -114,6 +161,7 @@ async def regenerate_bracket_matches(
             if tournament is not None:
                 tournament.export_last_updated_at = datetime.now(UTC)
             await db.commit()
+            await invalidate_tournament_read_models(tournament_id)
         return None
 
     planned_matches = plan_bracket_matches(
@@ -129,25 +177,27 @@ async def regenerate_bracket_matches(
         if tournament is not None:
             tournament.export_last_updated_at = datetime.now(UTC)
         await db.commit()
+        await invalidate_tournament_read_models(tournament_id)
     return None
 
 
 async def regenerate_round_bracket_matches(
     db: AsyncSession, bracket_id: int, tournament_id: int, commit: bool = True
-) -> Optional[list[BracketMatch]]:
+) -> Optional[list[UUID]]:
     await _reset_and_clear_bracket_structure(db, bracket_id)
 
     result = await db.execute(
         select(BracketParticipant).filter_by(bracket_id=bracket_id).order_by(BracketParticipant.seed)
     )
     participants = result.scalars().all()
-    matches: list[BracketMatch] = []
+    matches: list[UUID] = []
     if len(participants) < 2:
         if commit:
             tournament = await db.get(Tournament, tournament_id)
             if tournament is not None:
                 tournament.export_last_updated_at = datetime.now(UTC)
             await db.commit()
+            await invalidate_tournament_read_models(tournament_id)
         return None if commit else matches
 
     planned_matches = plan_bracket_matches(
@@ -163,6 +213,7 @@ async def regenerate_round_bracket_matches(
         if tournament is not None:
             tournament.export_last_updated_at = datetime.now(UTC)
         await db.commit()
+        await invalidate_tournament_read_models(tournament_id)
         return None
     else:
         return matches
@@ -172,23 +223,39 @@ async def regenerate_tournament_brackets(db: AsyncSession, tournament_id: int) -
     result = await db.execute(
         select(Bracket.id, Bracket.type, Bracket.state).where(Bracket.tournament_id == tournament_id)
     )
-    brackets = result.all()
 
-    for bracket_id, bracket_type, state in brackets:
+    bracket_types: dict[int, str] = {}
+    for bracket_id, bracket_type, state in result.all():
         if state in IMMUTABLE_BRACKET_STATES:
             raise HTTPException(status_code=409, detail=f"Bracket {bracket_id} is immutable")
-        if bracket_type == BracketType.ROUND_ROBIN.value:
-            await regenerate_round_bracket_matches(db, bracket_id, tournament_id, commit=False)
-        elif bracket_type == BracketType.SINGLE_ELIMINATION.value:
-            await regenerate_bracket_matches(db, bracket_id, tournament_id, commit=False)
-        else:
+        if bracket_type not in SUPPORTED_BRACKET_TYPES:
             logger.warning(f"Bracket type: {bracket_type} not supported")
+            continue
+        bracket_types[bracket_id] = bracket_type
+
+    if bracket_types:
+        bracket_ids = list(bracket_types)
+        participants: dict[int, list[SeededParticipant]] = {bracket_id: [] for bracket_id in bracket_ids}
+        participants_result = await db.execute(
+            select(BracketParticipant.bracket_id, BracketParticipant.seed, BracketParticipant.athlete_id)
+            .where(BracketParticipant.bracket_id.in_(bracket_ids))
+            .order_by(BracketParticipant.bracket_id, BracketParticipant.seed)
+        )
+        for bracket_id, seed, athlete_id in participants_result.all():
+            participants[bracket_id].append(SeededParticipant(seed=seed, athlete_id=athlete_id))
 
-    tournament = await db.get(Tournament, tournament_id)
-    if tournament is not None:
-        tournament.export_last_updated_at = datetime.now(UTC)
-    await db.flush()
+        await _reset_brackets_structure(db, bracket_ids)
+        plans = plan_tournament_brackets(
+            BracketPlanRequest(key=bracket_id, bracket_type=bracket_type, participants=tuple(participants[bracket_id]))
+            for bracket_id, bracket_type in bracket_types.items()
+        )
+        await insert_planned_brackets(db, ((plan.key, plan.matches) for plan in plans))
+
+    await db.execute(
+        update(Tournament).where(Tournament.id == tournament_id).values(export_last_updated_at=datetime.now(UTC))
+    )
     await db.commit()
+    await invalidate_tournament_read_models(tournament_id)
 
 
 async def reorder_seeds_and_get_next(db: AsyncSession, bracket_id: int) -> int:
@@ -321,6 +388,7 @@ async def update_bracket(db: AsyncSession, bracket_id: int, update_data: Bracket
         bump_bracket_version(bracket)
 
     await db.commit()
+    await invalidate_tournament_read_models(bracket.tournament_id)
     await db.refresh(bracket)
     return bracket, bool(update_data.type and update_data.type != old_type)
 
@@ -358,6 +426,8 @@ async def move_participant(db: AsyncSession, move_data: ParticipantMoveSchema) -
     bump_bracket_version(from_bracket)
     bump_bracket_version(to_bracket)
     await db.commit()
+    for tournament_id in {from_bracket.tournament_id, to_bracket.tournament_id}:
+        await invalidate_tournament_read_models(tournament_id)
 
 
 async def reorder_participants(db: AsyncSession, reorder_data: ParticipantReorderSchema) -> None:
@@ -373,6 +443,7 @@ async def reorder_participants(db: AsyncSession, reorder_data: ParticipantReorde
         )
     bump_bracket_version(bracket)
     await db.commit()
+    await invalidate_tournament_read_models(bracket.tournament_id)
 
 
 async def create_bracket(db: AsyncSession, bracket_data: BracketCreateSchema) -> Bracket:
@@ -403,6 +474,7 @@ async def create_bracket(db: AsyncSession, bracket_data: BracketCreateSchema) ->
 
     db.add(new_bracket)
     await db.commit()
+    await invalidate_tournament_read_models(bracket_data.tournament_id)
 
     result = await db.execute(
         select(Bracket)
@@ -451,8 +523,10 @@ async def delete_bracket(db: AsyncSession, bracket_id: int, data: BracketDeleteR
             p.seed = new_seed
         bump_bracket_version(target_bracket)
 
+    tournament_id = bracket.tournament_id
     await db.delete(bracket)
     await db.commit()
+    await invalidate_tournament_read_models(tournament_id)
 
 
 async def update_bracket_status(db: AsyncSession, bracket_id: int, status: str) -> Bracket:
@@ -486,6 +560,7 @@ async def update_bracket_status(db: AsyncSession, bracket_id: int, status: str)
     bracket.status = status
     bracket.state = derive_bracket_state_from_status(status, bracket.state)
     await db.commit()
+    await invalidate_tournament_read_models(bracket.tournament_id)
     return bracket
 
 
@@ -500,3 +575,4 @@ async def start_bracket(db: AsyncSession, bracket_id: int) -> None:
     bracket.state = derive_bracket_state_from_status(bracket.status, bracket.state)
     bump_bracket_version(bracket)
     await db.commit()
+    await invalidate_tournament_read_models(bracket.tournament_id)
@@ -1,8 +1,17 @@
+import hashlib
+import json
 import os
 import re
-from datetime import date, timedelta
+import time
+from collections.abc import Iterable
+from concurrent.futures import Executor
+from contextlib import suppress
+from datetime import date, datetime, timedelta
+from functools import cache
+from io import BytesIO
+from itertools import groupby, islice
 from pathlib import Path
-from tempfile import NamedTemporaryFile
+from uuid import uuid4
 from xml.sax.saxutils import escape
 
 import cairosvg
@@ -13,9 +22,19 @@ from src.utils import sanitize_filename
 
 SVG_TEMPLATE_PATH = "assets/template.svg"
 SVG_ROUND_TEMPLATE_PATH = "assets/round_template.svg"
+PAGE_CACHE_DIR = os.path.join("pdf_storage", "pages")
+PAGE_RENDER_CHUNKSIZE = 4
+PAGE_CACHE_MAX_AGE_SECONDS = 24 * 60 * 60
+
+_PLACEHOLDER_PATTERN = re.compile(r"{{\s*(?P<key>\w+)\s*}}")
+_ROUND_TEMPLATE_PATTERN = re.compile(
+    r"<text(?P<attrs>[^>]*)>{{\s*(?P<multiline_key>athlete[1-5])\s*}}</text>|{{\s*(?P<key>\w+)\s*}}"
+)
 
 HIDE_FINISHED_MATCHES = True
 
+NO_EXPORT_DATA_DETAIL = "Нет данных для генерации."
+
 
 def build_entry(
     matches: list[BracketMatch],
@@ -97,28 +116,64 @@ def build_round_robin_entry(
     return entry
 
 
-def _inject_round_template_multiline_athletes(svg_template: str, entry: dict[str, str]) -> str:
-    for idx in range(1, 6):
-        key = f"athlete{idx}"
-        raw_value = entry.get(key, "")
-        name_line, _, coach_line = raw_value.partition("\n")
-        name_line = escape(name_line)
-        coach_line = escape(coach_line)
+class _MultilineAthleteSlot:
+    __slots__ = ("key", "attrs", "x_attr")
+
+    def __init__(self, key: str, attrs: str) -> None:
+        x_match = re.search(r'\bx="([^"]+)"', attrs)
+        self.key = key
+        self.attrs = attrs
+        self.x_attr = f' x="{x_match.group(1)}"' if x_match else ""
+
+    def __call__(self, entry: dict[str, str]) -> str:
+        name_line, _, coach_line = entry.get(self.key, "").partition("\n")
+        if not coach_line:
+            return f"<text{self.attrs}>{escape(name_line)}</text>"
+        return f'<text{self.attrs}>{escape(name_line)}<tspan{self.x_attr} dy="13">{escape(coach_line)}</tspan></text>'
+
+
+class _PlaceholderSlot:
+    __slots__ = ("key",)
+
+    def __init__(self, key: str) -> None:
+        self.key = key
 
-        pattern = rf"<text(?P<attrs>[^>]*)>{{{{\s*{key}\s*}}}}</text>"
+    def __call__(self, entry: dict[str, str]) -> str:
+        return entry.get(self.key, "")
 
-        def replace_text(match: re.Match[str]) -> str:
-            attrs = match.group("attrs")
-            if not coach_line:
-                return f"<text{attrs}>{name_line}</text>"
 
-            x_match = re.search(r'\bx="([^"]+)"', attrs)
-            x_attr = f' x="{x_match.group(1)}"' if x_match else ""
-            return f'<text{attrs}>{name_line}<tspan{x_attr} dy="13">{coach_line}</tspan></text>'
+class CompiledSvgTemplate:
+    __slots__ = ("segments", "digest")
 
-        svg_template = re.sub(pattern, replace_text, svg_template)
+    def __init__(self, source: str, multiline_athletes: bool = False) -> None:
+        pattern = _ROUND_TEMPLATE_PATTERN if multiline_athletes else _PLACEHOLDER_PATTERN
+        self.segments: list[str | _PlaceholderSlot | _MultilineAthleteSlot] = []
+        self.digest = hashlib.sha256(source.encode("utf-8")).hexdigest()
+        cursor = 0
+        for match in pattern.finditer(source):
+            self.segments.append(source[cursor : match.start()])
+            multiline_key = match.groupdict().get("multiline_key")
+            if multiline_key:
+                self.segments.append(_MultilineAthleteSlot(multiline_key, match.group("attrs")))
+            else:
+                self.segments.append(_PlaceholderSlot(match.group("key")))
+            cursor = match.end()
+        self.segments.append(source[cursor:])
+
+    def render(self, entry: dict[str, str]) -> str:
+        return "".join(segment if isinstance(segment, str) else segment(entry) for segment in self.segments)
+
+
+@cache
+def _compiled_templates() -> tuple[CompiledSvgTemplate, CompiledSvgTemplate]:
+    return (
+        CompiledSvgTemplate(Path(SVG_TEMPLATE_PATH).read_text(encoding="utf-8")),
+        CompiledSvgTemplate(Path(SVG_ROUND_TEMPLATE_PATH).read_text(encoding="utf-8"), multiline_athletes=True),
+    )
 
-    return svg_template
+
+def preload_svg_templates() -> None:
+    _compiled_templates()
 
 
 def build_entries(data: list[Bracket], tournament_title: str, start_date: date | None = None) -> list[dict[str, str]]:
@@ -154,6 +209,8 @@ def build_entries(data: list[Bracket], tournament_title: str, start_date: date |
                 tournament_title=tournament_title,
             )
             entry["_template"] = BracketType.ROUND_ROBIN.value
+            entry["_bracket_id"] = str(bracket.id)
+            entry["_bracket_version"] = str(bracket.version)
             all_entries.append(entry)
             continue
 
@@ -174,51 +231,113 @@ def build_entries(data: list[Bracket], tournament_title: str, start_date: date |
             )
             if len(entry) > 1:
                 entry["_template"] = "elimination"
+                entry["_bracket_id"] = str(bracket.id)
+                entry["_bracket_version"] = str(bracket.version)
                 all_entries.append(entry)
 
     return all_entries
 
 
-def generate_pdf(data: list[Bracket], tournament_title: str, start_date: date | None = None) -> str | dict[str, str]:
-    entries = build_entries(data, tournament_title, start_date=start_date)
-    if not entries:
-        return {"detail": "Нет данных для генерации."}
+def _fill_template(entry: dict[str, str]) -> str:
+    elimination_template, round_template = _compiled_templates()
+    if entry.get("_template", "elimination") == BracketType.ROUND_ROBIN.value:
+        return round_template.render(entry)
+    return elimination_template.render(entry)
+
+
+def _page_cache_path(entries: list[dict[str, str]], template_digest: str) -> str:
+    digest = hashlib.sha256(f"{template_digest}:{json.dumps(entries, sort_keys=True)}".encode()).hexdigest()[:20]
+    bracket_dir = os.path.join(os.getcwd(), PAGE_CACHE_DIR, entries[0]["_bracket_id"])
+    return os.path.join(bracket_dir, f"{entries[0]['_bracket_version']}-{digest}.pdf")
 
+
+def render_page_pdf(entry: dict[str, str]) -> bytes:
+    page: bytes = cairosvg.svg2pdf(bytestring=_fill_template(entry).encode("utf-8"))
+    return page
+
+
+def _prune_stale_pages(bracket_dir: str, keep_path: str) -> None:
+    # Other bracket versions may still be in use by a concurrent export, so only long-unused files go.
+    expires_before = time.time() - PAGE_CACHE_MAX_AGE_SECONDS
+    for name in os.listdir(bracket_dir):
+        stale_path = os.path.join(bracket_dir, name)
+        if stale_path == keep_path or not name.endswith(".pdf"):
+            continue
+        with suppress(FileNotFoundError):
+            if os.path.getmtime(stale_path) < expires_before:
+                os.remove(stale_path)
+
+
+def _write_bracket_pages(pages: Iterable[bytes], cache_path: str) -> None:
     writer = PdfWriter()
-    temp_paths = []
 
-    elimination_template = Path(SVG_TEMPLATE_PATH).read_text(encoding="utf-8")
-    round_template = Path(SVG_ROUND_TEMPLATE_PATH).read_text(encoding="utf-8")
+    for page in pages:
+        writer.append_pages_from_reader(PdfReader(BytesIO(page)))
 
-    for entry in entries:
-        template_type = entry.get("_template", "elimination")
-        if template_type == BracketType.ROUND_ROBIN.value:
-            svg_template = round_template
-            svg_template = _inject_round_template_multiline_athletes(svg_template, entry)
-        else:
-            svg_template = elimination_template
+    bracket_dir = os.path.dirname(cache_path)
+    os.makedirs(bracket_dir, exist_ok=True)
+    partial_path = f"{cache_path}.{uuid4().hex}.part"
+    with open(partial_path, "wb") as f_out:
+        writer.write(f_out)
+    os.replace(partial_path, cache_path)
+
+    _prune_stale_pages(bracket_dir, cache_path)
 
-        placeholders = set(re.findall(r"{{\s*(\w+)\s*}}", svg_template))
 
-        for key in placeholders:
-            value = entry.get(key, "")
-            svg_template = svg_template.replace(f"{{{{ {key} }}}}", value)
+def _reuse_cached_pages(cache_path: str) -> bool:
+    try:
+        os.utime(cache_path)
+    except FileNotFoundError:
+        return False
+    return True
 
-        with NamedTemporaryFile(delete=False, suffix=".pdf") as tmp:
-            cairosvg.svg2pdf(bytestring=svg_template.encode("utf-8"), write_to=tmp.name)
-            temp_paths.append(tmp.name)
-            reader = PdfReader(tmp.name)
-            writer.append_pages_from_reader(reader)
+
+def render_entries_pdf(
+    entries: list[dict[str, str]],
+    tournament_title: str,
+    executor: Executor | None = None,
+    snapshot_at: datetime | None = None,
+) -> str:
+    writer = PdfWriter()
+
+    elimination_template, round_template = _compiled_templates()
+    template_digest = f"{elimination_template.digest}:{round_template.digest}"
+
+    groups = []
+    for _, bracket_entries in groupby(entries, key=lambda entry: entry["_bracket_id"]):
+        group = list(bracket_entries)
+        cache_path = _page_cache_path(group, template_digest)
+        groups.append((group, cache_path, _reuse_cached_pages(cache_path)))
+
+    # Every uncached page is submitted up front; map yields them back in entry order as they finish.
+    missing = [entry for group, _, cached in groups if not cached for entry in group]
+    if executor is not None:
+        pages = executor.map(render_page_pdf, missing, chunksize=PAGE_RENDER_CHUNKSIZE)
+    else:
+        pages = map(render_page_pdf, missing)
+
+    for group, cache_path, cached in groups:
+        if not cached:
+            _write_bracket_pages(islice(pages, len(group)), cache_path)
+        try:
+            writer.append(cache_path)
+        except FileNotFoundError:
+            # The page file vanished after it was picked for reuse; render it again rather than fail the export.
+            _write_bracket_pages(map(render_page_pdf, group), cache_path)
+            writer.append(cache_path)
 
     sanitized_title = sanitize_filename(tournament_title or "tournament")
 
     pdf_storage_path = os.path.join(os.getcwd(), "pdf_storage")
     final_path = os.path.join(pdf_storage_path, f"{sanitized_title}.pdf")
 
-    with open(final_path, "wb") as f_out:
+    partial_path = f"{final_path}.{uuid4().hex}.part"
+    with open(partial_path, "wb") as f_out:
         writer.write(f_out)
-
-    for path in temp_paths:
-        os.remove(path)
+    os.replace(partial_path, final_path)
+    if snapshot_at is not None:
+        # Freshness is judged by mtime, so date the file when its entries were read rather than when it was written.
+        stamp = snapshot_at.timestamp()
+        os.utime(final_path, (stamp, stamp))
 
     return final_path
@@ -0,0 +1,195 @@
+import asyncio
+import json
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import suppress
+from datetime import UTC, datetime, timedelta
+from uuid import uuid4
+
+from redis import asyncio as redis
+
+from src.config import (
+    DEV_MODE,
+    EXPORT_JOB_HEARTBEAT_SECONDS,
+    EXPORT_JOB_STALE_SECONDS,
+    EXPORT_JOB_TTL_SECONDS,
+    EXPORT_WORKERS,
+    REDIS_URL,
+)
+from src.logger import logger
+from src.schemas import ExportJobResponse
+from src.services.export_file import preload_svg_templates, render_entries_pdf
+
+ACTIVE_EXPORT_STATUSES = ("queued", "running", "finished")
+PENDING_EXPORT_STATUSES = ("queued", "running")
+STALE_EXPORT_DETAIL = "Export worker stopped responding"
+
+# Returns the job currently holding the claim, or claims the key and stores the new job in the same step.
+_CLAIM_SCRIPT = """
+local existing = redis.call('GET', KEYS[1])
+if existing and existing ~= ARGV[4] then
+  local raw = redis.call('GET', ARGV[5] .. existing)
+  if raw then
+    return raw
+  end
+end
+redis.call('SET', KEYS[1], ARGV[1], 'EX', ARGV[3])
+redis.call('SET', KEYS[2], ARGV[2], 'EX', ARGV[3])
+return ARGV[2]
+"""
+
+
+def _with_liveness(job: ExportJobResponse) -> ExportJobResponse:
+    if job.status not in PENDING_EXPORT_STATUSES or job.updated_at is None:
+        return job
+    if datetime.now(UTC) - job.updated_at <= timedelta(seconds=EXPORT_JOB_STALE_SECONDS):
+        return job
+    return job.model_copy(update={"status": "failed", "detail": STALE_EXPORT_DETAIL})
+
+
+class MemoryExportJobStore:
+    def __init__(self) -> None:
+        self._jobs: dict[str, ExportJobResponse] = {}
+        self._claims: dict[str, str] = {}
+
+    async def claim(self, key: str, job: ExportJobResponse) -> ExportJobResponse:
+        existing_id = self._claims.get(key)
+        if existing_id is not None:
+            existing = await self.get(existing_id)
+            if existing is not None and existing.status in ACTIVE_EXPORT_STATUSES:
+                return existing
+        if job.job_id is not None:
+            self._claims[key] = job.job_id
+        await self.save(job)
+        return job
+
+    async def save(self, job: ExportJobResponse) -> None:
+        if job.job_id is not None:
+            self._jobs[job.job_id] = job
+
+    async def get(self, job_id: str) -> ExportJobResponse | None:
+        job = self._jobs.get(job_id)
+        return _with_liveness(job) if job is not None else None
+
+    async def close(self) -> None:
+        return None
+
+
+class RedisExportJobStore:
+    def __init__(self, url: str, ttl_seconds: int) -> None:
+        self._ttl_seconds = ttl_seconds
+        self._conn = redis.Redis.from_url(url)
+        self._claim = self._conn.register_script(_CLAIM_SCRIPT)
+
+    @staticmethod
+    def _job_key(job_id: str) -> str:
+        return f"export_job:{job_id}"
+
+    async def claim(self, key: str, job: ExportJobResponse) -> ExportJobResponse:
+        replaceable = ""
+        while True:
+            raw = await self._claim(
+                keys=[f"export_claim:{key}", self._job_key(job.job_id or "")],
+                args=[job.job_id, job.model_dump_json(), self._ttl_seconds, replaceable, self._job_key("")],
+            )
+            holder = _with_liveness(ExportJobResponse.model_validate(json.loads(raw)))
+            if holder.job_id == job.job_id or holder.status in ACTIVE_EXPORT_STATUSES:
+                return holder
+            # Only take over the claim if it still points at the failed job we just saw.
+            replaceable = holder.job_id or ""
+
+    async def save(self, job: ExportJobResponse) -> None:
+        await self._conn.set(self._job_key(job.job_id or ""), job.model_dump_json(), ex=self._ttl_seconds)
+
+    async def get(self, job_id: str) -> ExportJobResponse | None:
+        raw = await self._conn.get(self._job_key(job_id))
+        if raw is None:
+            return None
+        return _with_liveness(ExportJobResponse.model_validate(json.loads(raw)))
+
+    async def close(self) -> None:
+        await self._conn.aclose()
+
+
+class ExportJobRunner:
+    def __init__(self, store: MemoryExportJobStore | RedisExportJobStore, max_workers: int) -> None:
+        self.store = store
+        self._max_workers = max_workers
+        self._executor: ProcessPoolExecutor | None = None
+        self._tasks: set[asyncio.Task[None]] = set()
+
+    def _get_executor(self) -> ProcessPoolExecutor:
+        if self._executor is None:
+            # Spawned workers never inherit the threads and sockets of the running server process.
+            self._executor = ProcessPoolExecutor(
+                max_workers=self._max_workers,
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=preload_svg_templates,
+            )
+        return self._executor
+
+    async def submit(
+        self,
+        key: str,
+        tournament_id: int,
+        tournament_title: str,
+        filename: str,
+        entries: list[dict[str, str]],
+        snapshot_at: datetime,
+    ) -> ExportJobResponse:
+        job = ExportJobResponse(
+            job_id=uuid4().hex,
+            tournament_id=tournament_id,
+            status="queued",
+            filename=filename,
+            updated_at=datetime.now(UTC),
+        )
+        claimed = await self.store.claim(key, job)
+        if claimed.job_id != job.job_id:
+            return claimed
+
+        task = asyncio.create_task(self._run(job, tournament_title, entries, snapshot_at))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+        return job
+
+    async def _heartbeat(self, job: ExportJobResponse) -> None:
+        while True:
+            await asyncio.sleep(EXPORT_JOB_HEARTBEAT_SECONDS)
+            await self.store.save(job.model_copy(update={"updated_at": datetime.now(UTC)}))
+
+    async def _run(
+        self, job: ExportJobResponse, tournament_title: str, entries: list[dict[str, str]], snapshot_at: datetime
+    ) -> None:
+        running = job.model_copy(update={"status": "running", "updated_at": datetime.now(UTC)})
+        await self.store.save(running)
+        heartbeat = asyncio.create_task(self._heartbeat(running))
+        try:
+            # Merging stays on a thread; the process pool only renders individual pages.
+            await asyncio.to_thread(render_entries_pdf, entries, tournament_title, self._get_executor(), snapshot_at)
+            result = job.model_copy(update={"status": "finished"})
+        except Exception as exc:
+            logger.error(f"Export job {job.job_id} for tournament {job.tournament_id} failed: {exc}")
+            result = job.model_copy(update={"status": "failed", "detail": "Failed to generate"})
+        finally:
+            heartbeat.cancel()
+            with suppress(asyncio.CancelledError):
+                await heartbeat
+        await self.store.save(result.model_copy(update={"updated_at": datetime.now(UTC)}))
+
+    async def close(self) -> None:
+        for task in list(self._tasks):
+            task.cancel()
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+        await self.store.close()
+
+
+store: MemoryExportJobStore | RedisExportJobStore
+if DEV_MODE:
+    store = MemoryExportJobStore()
+else:
+    store = RedisExportJobStore(REDIS_URL, EXPORT_JOB_TTL_SECONDS)
+
+export_jobs = ExportJobRunner(store, EXPORT_WORKERS)
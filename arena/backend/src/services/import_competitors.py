@@ -1,8 +1,12 @@
 import json
+import time
+from collections.abc import Iterable, Sequence
+from typing import Any
 
 from fastapi import HTTPException
-from sqlalchemy import delete, select
+from sqlalchemy import delete, func, insert, select, tuple_
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import InstrumentedAttribute
 
 from src.models import (
     Athlete,
@@ -14,98 +18,198 @@ from src.models import (
     Coach,
     Tournament,
 )
+from src.schemas import CompetitorImportResponse
 from src.services.brackets import regenerate_tournament_brackets
 
 
-async def import_competitors_from_cbr(db: AsyncSession, tournament_id: int, content: bytes) -> dict[str, str]:
+class CbrCompetitor:
+    __slots__ = ("first_name", "last_name", "coach", "category", "seed")
+
+    def __init__(self, first_name: str, last_name: str, coach: str, category: str, seed: int) -> None:
+        self.first_name = first_name
+        self.last_name = last_name
+        self.coach = coach
+        self.category = category
+        self.seed = seed
+
+    @property
+    def athlete_key(self) -> tuple[str, str]:
+        return self.first_name, self.last_name
+
+
+def parse_cbr_competitors(content: bytes) -> list[CbrCompetitor]:
     try:
         data = json.loads(content)
     except json.JSONDecodeError:
         raise HTTPException(status_code=400, detail="Invalid JSON format")
 
-    result = await db.execute(select(Tournament).filter_by(id=tournament_id))
-    tournament = result.scalars().first()
-
-    if not tournament:
-        raise HTTPException(status_code=404, detail="Tournament not found")
-
-    brackets_result = await db.execute(select(Bracket).where(Bracket.tournament_id == tournament_id))
-    brackets = brackets_result.scalars().all()
-    for br in brackets:
-        await db.execute(delete(BracketParticipant).where(BracketParticipant.bracket_id == br.id))
-        await db.execute(delete(BracketMatch).where(BracketMatch.bracket_id == br.id))
-
-    coaches_cache = {}
-    categories_cache = {}
-
-    for competitor in data["Competitors"]:
-        category_name = competitor["Category"]
-        coach_name = competitor["Coach"]
-        first_name = competitor.get("Name", "") or ""
-        last_name = competitor["Surname"]
-
-        # Coach
-        if coach_name not in coaches_cache:
-            coach_result = await db.execute(select(Coach).filter_by(last_name=coach_name))
-            coach = coach_result.scalars().first()
-            if not coach:
-                coach = Coach(last_name=coach_name, first_name="")
-                db.add(coach)
-                await db.flush()
-            coaches_cache[coach_name] = coach
-
-        coach = coaches_cache[coach_name]
-
-        # Category
-        if category_name not in categories_cache:
-            category_result = await db.execute(select(Category).filter_by(name=category_name))
-            category = category_result.scalars().first()
-            if not category:
-                category = Category(name=category_name, min_age=1, max_age=99, gender="male-or-female")
-                db.add(category)
-                await db.flush()
-            categories_cache[category_name] = category
-
-        category = categories_cache[category_name]
-
-        # Athlete
-        athlete_result = await db.execute(select(Athlete).filter_by(first_name=first_name, last_name=last_name))
-        athlete = athlete_result.scalars().first()
-        if not athlete:
-            athlete = Athlete(
-                first_name=first_name,
-                last_name=last_name,
-                gender="male-or-female",
-            )
-            db.add(athlete)
-            await db.flush()
-
-            # Create coach link
-            coach_link = AthleteCoachLink(athlete_id=athlete.id, coach_id=coach.id)
-            db.add(coach_link)
-            await db.flush()
-
-        # Bracket
-        bracket_result = await db.execute(
-            select(Bracket).filter_by(tournament_id=tournament.id, category_id=category.id)
-        )
-        bracket = bracket_result.scalar_one_or_none()
-        if not bracket:
-            bracket = Bracket(
-                tournament_id=tournament.id,
-                category_id=category.id,
+    try:
+        return [
+            CbrCompetitor(
+                first_name=competitor.get("Name", "") or "",
+                last_name=competitor["Surname"],
+                coach=competitor["Coach"],
+                category=competitor["Category"],
+                seed=competitor["SortId"],
             )
-            db.add(bracket)
-            await db.flush()
-
-        # BracketParticipant
-        participant = BracketParticipant(
-            bracket_id=bracket.id,
-            athlete_id=athlete.id,
-            seed=competitor["SortId"],
-        )
-        db.add(participant)
-
-    await regenerate_tournament_brackets(db, tournament.id)
+            for competitor in data["Competitors"]
+        ]
+    except (KeyError, TypeError, AttributeError):
+        raise HTTPException(status_code=400, detail="Invalid CBR format")
+
+
+async def _insert_returning_ids(db: AsyncSession, model: Any, rows: Sequence[dict[str, Any]]) -> list[int]:
+    if not rows:
+        return []
+    result = await db.execute(insert(model).returning(model.id, sort_by_parameter_order=True), rows)
+    return list(result.scalars().all())
+
+
+async def _resolve_by_name(
+    db: AsyncSession,
+    name_column: InstrumentedAttribute[str],
+    id_column: InstrumentedAttribute[int],
+    names: Iterable[str],
+) -> dict[str, int]:
+    # Names are not unique; the oldest row wins, like the per-competitor lookup did.
+    result = await db.execute(
+        select(name_column, func.min(id_column)).where(name_column.in_(set(names))).group_by(name_column)
+    )
+    return {name: row_id for name, row_id in result.all()}
+
+
+async def _resolve_coaches(db: AsyncSession, names: list[str]) -> tuple[dict[str, int], int]:
+    coach_ids = await _resolve_by_name(db, Coach.last_name, Coach.id, names)
+    missing = [name for name in names if name not in coach_ids]
+    created = await _insert_returning_ids(db, Coach, [{"last_name": name, "first_name": ""} for name in missing])
+    coach_ids.update(zip(missing, created))
+    return coach_ids, len(created)
+
+
+async def _resolve_categories(db: AsyncSession, names: list[str]) -> tuple[dict[str, int], int]:
+    category_ids = await _resolve_by_name(db, Category.name, Category.id, names)
+    missing = [name for name in names if name not in category_ids]
+    created = await _insert_returning_ids(
+        db,
+        Category,
+        [{"name": name, "min_age": 1, "max_age": 99, "gender": "male-or-female"} for name in missing],
+    )
+    category_ids.update(zip(missing, created))
+    return category_ids, len(created)
+
+
+async def _resolve_athletes(
+    db: AsyncSession, competitors: list[CbrCompetitor], coach_ids: dict[str, int]
+) -> tuple[dict[tuple[str, str], int], int, int]:
+    first_seen: dict[tuple[str, str], CbrCompetitor] = {}
+    for competitor in competitors:
+        first_seen.setdefault(competitor.athlete_key, competitor)
+
+    result = await db.execute(
+        select(Athlete.first_name, Athlete.last_name, func.min(Athlete.id))
+        .where(tuple_(Athlete.first_name, Athlete.last_name).in_(list(first_seen)))
+        .group_by(Athlete.first_name, Athlete.last_name)
+    )
+    athlete_ids = {(first_name, last_name): athlete_id for first_name, last_name, athlete_id in result.all()}
+
+    missing = [key for key in first_seen if key not in athlete_ids]
+    created = await _insert_returning_ids(
+        db,
+        Athlete,
+        [
+            {"first_name": first_name, "last_name": last_name, "gender": "male-or-female"}
+            for first_name, last_name in missing
+        ],
+    )
+    athlete_ids.update(zip(missing, created))
+
+    # Only newly created athletes get a coach link; existing athletes keep their coaches.
+    link_rows = [
+        {"athlete_id": athlete_id, "coach_id": coach_ids[first_seen[key].coach]}
+        for key, athlete_id in zip(missing, created)
+    ]
+    if link_rows:
+        await db.execute(insert(AthleteCoachLink), link_rows)
+    return athlete_ids, len(created), len(link_rows)
+
+
+async def _resolve_brackets(
+    db: AsyncSession, tournament_id: int, category_ids: list[int]
+) -> tuple[dict[int, int], int]:
+    result = await db.execute(
+        select(Bracket.category_id, Bracket.id)
+        .where(Bracket.tournament_id == tournament_id, Bracket.category_id.in_(category_ids))
+        .order_by(Bracket.category_id, Bracket.group_id)
+    )
+    bracket_ids: dict[int, int] = {}
+    for category_id, bracket_id in result.all():
+        bracket_ids.setdefault(category_id, bracket_id)
+
+    missing = [category_id for category_id in category_ids if category_id not in bracket_ids]
+    created = await _insert_returning_ids(
+        db, Bracket, [{"tournament_id": tournament_id, "category_id": category_id} for category_id in missing]
+    )
+    bracket_ids.update(zip(missing, created))
+    return bracket_ids, len(created)
+
+
+def _elapsed_ms(started: float) -> float:
+    return round((time.perf_counter() - started) * 1000, 2)
+
+
+async def import_competitors_from_cbr(db: AsyncSession, tournament_id: int, content: bytes) -> CompetitorImportResponse:
+    timings: dict[str, float] = {}
+    started = time.perf_counter()
+    competitors = parse_cbr_competitors(content)
+    timings["parse"] = _elapsed_ms(started)
+
+    tournament_exists = await db.scalar(select(Tournament.id).where(Tournament.id == tournament_id))
+    if tournament_exists is None:
+        raise HTTPException(status_code=404, detail="Tournament not found")
 
-    return {"status": "success", "message": "Data imported and brackets generated"}
+    started = time.perf_counter()
+    tournament_brackets = select(Bracket.id).where(Bracket.tournament_id == tournament_id)
+    await db.execute(delete(BracketParticipant).where(BracketParticipant.bracket_id.in_(tournament_brackets)))
+    await db.execute(delete(BracketMatch).where(BracketMatch.bracket_id.in_(tournament_brackets)))
+    timings["clear"] = _elapsed_ms(started)
+
+    started = time.perf_counter()
+    coach_ids, coaches_created = await _resolve_coaches(db, list(dict.fromkeys(c.coach for c in competitors)))
+    category_ids, categories_created = await _resolve_categories(
+        db, list(dict.fromkeys(c.category for c in competitors))
+    )
+    athlete_ids, athletes_created, coach_links_created = await _resolve_athletes(db, competitors, coach_ids)
+    timings["resolve"] = _elapsed_ms(started)
+
+    started = time.perf_counter()
+    bracket_ids, brackets_created = await _resolve_brackets(
+        db, tournament_id, list(dict.fromkeys(category_ids[c.category] for c in competitors))
+    )
+    participant_rows = [
+        {
+            "bracket_id": bracket_ids[category_ids[competitor.category]],
+            "athlete_id": athlete_ids[competitor.athlete_key],
+            "seed": competitor.seed,
+        }
+        for competitor in competitors
+    ]
+    if participant_rows:
+        await db.execute(insert(BracketParticipant), participant_rows)
+    timings["brackets"] = _elapsed_ms(started)
+
+    started = time.perf_counter()
+    await regenerate_tournament_brackets(db, tournament_id)
+    timings["regenerate"] = _elapsed_ms(started)
+
+    return CompetitorImportResponse(
+        status="success",
+        message="Data imported and brackets generated",
+        competitors=len(competitors),
+        coaches_created=coaches_created,
+        categories_created=categories_created,
+        athletes_created=athletes_created,
+        coach_links_created=coach_links_created,
+        brackets_created=brackets_created,
+        participants_created=len(participant_rows),
+        timings_ms=timings,
+    )
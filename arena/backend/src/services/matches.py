@@ -1,22 +1,17 @@
 from datetime import UTC, datetime
 from typing import Literal
-from uuid import UUID
+from uuid import UUID, uuid4
 
 from champion_domain import (
-    FinishedMainMatch,
-    PlacementMatchInput,
-    ProgressionAction,
+    BracketChangeSet,
+    BracketRuntime,
+    RuntimeMatch,
     bump_bracket_version,
     can_finish_match,
     can_start_match,
     can_update_scores,
-    compute_bracket_placements,
-    decide_finish_flow_post,
-    decide_finish_flow_runtime,
     derive_bracket_state_from_status,
-    plan_repechage_generation,
     should_finish_tournament,
-    should_generate_repechage,
 )
 from fastapi import HTTPException
 from sqlalchemy import func, select
@@ -38,7 +33,9 @@ from src.models import (
     TournamentStatus,
 )
 from src.schemas import MatchFinishRequest, MatchScoreUpdate, MatchUpdate
-from src.services.broadcast import broadcast
+from src.services.bracket_index import apply_bracket_placements, bracket_placements
+from src.services.read_models import invalidate_tournament_read_models
+from src.services.tournament_feed import publish_tournament_update
 
 MatchId = UUID
 
@@ -64,204 +61,79 @@ async def _load_match_or_404(db: AsyncSession, match_id: MatchId, include_bracke
     return match
 
 
-async def _apply_winner_to_next_match(
-    db: AsyncSession,
-    bm: BracketMatch,
-    winner_id: int,
-    action: ProgressionAction,
-) -> None:
-    if action.kind == "repechage":
-        next_bm = (
-            await db.execute(
-                select(BracketMatch)
-                .join(Match, Match.id == BracketMatch.match_id)
-                .where(
-                    BracketMatch.bracket_id == bm.bracket_id,
-                    Match.stage == MatchStage.REPECHAGE.value,
-                    Match.repechage_side == action.repechage_side,
-                    Match.repechage_step == action.repechage_step,
-                )
-            )
-        ).scalar_one_or_none()
-        if next_bm is None:
-            return
-        next_match = await db.get(Match, next_bm.match_id)
-        if next_match is not None:
-            next_match.athlete1_id = winner_id
-        return
-
-    if action.kind == "main":
-        if action.main_round_number is None or action.main_position is None:
-            return
-        next_bm = (
-            await db.execute(
-                select(BracketMatch).where(
-                    BracketMatch.bracket_id == bm.bracket_id,
-                    BracketMatch.round_number == action.main_round_number,
-                    BracketMatch.position == action.main_position,
-                )
-            )
-        ).scalar_one_or_none()
-        if next_bm is None:
-            return
-        next_match = await db.get(Match, next_bm.match_id)
-        if next_match is None or next_match.stage != MatchStage.MAIN.value:
-            return
-        if action.slot == 1:
-            next_match.athlete1_id = winner_id
-        else:
-            next_match.athlete2_id = winner_id
-
-
-async def _recompute_bracket_placements(db: AsyncSession, bracket_id: int) -> None:
-    bracket = await db.get(Bracket, bracket_id)
-    if bracket is None:
-        return
-
+async def _load_bracket_runtime(db: AsyncSession, bracket: Bracket) -> tuple[BracketRuntime[UUID], dict[UUID, Match]]:
     rows = (
         await db.execute(
             select(BracketMatch, Match)
             .join(Match, Match.id == BracketMatch.match_id)
-            .where(BracketMatch.bracket_id == bracket_id)
+            .where(BracketMatch.bracket_id == bracket.id)
         )
     ).all()
-    placements = compute_bracket_placements(
-        [
-            PlacementMatchInput(
+    runtime = BracketRuntime(
+        bracket.type,
+        bracket.status,
+        (
+            RuntimeMatch(
+                key=match.id,
                 round_number=bm.round_number,
+                position=bm.position,
                 stage=match.stage,
                 status=match.status,
-                winner_id=match.winner_id,
                 athlete1_id=match.athlete1_id,
                 athlete2_id=match.athlete2_id,
+                winner_id=match.winner_id,
+                next_slot=bm.next_slot,
                 repechage_side=match.repechage_side,
                 repechage_step=match.repechage_step,
             )
             for bm, match in rows
-        ],
+        ),
+        new_key=uuid4,
         repechage_stage_value=MatchStage.REPECHAGE.value,
         finished_status_value=MatchStatus.FINISHED.value,
+        not_started_status_value=MatchStatus.NOT_STARTED.value,
+        placements=bracket_placements(bracket),
     )
+    return runtime, {match.id: match for _, match in rows}
 
-    bracket.place_1_id = placements.place_1_id
-    bracket.place_2_id = placements.place_2_id
-    bracket.place_3_a_id = placements.place_3_a_id
-    bracket.place_3_b_id = placements.place_3_b_id
-
-
-async def _ensure_repechage_generated(db: AsyncSession, bracket_id: int) -> bool:
-    bracket = await db.get(Bracket, bracket_id)
-    if bracket is None:
-        return False
-
-    has_repechage_matches = bool(
-        await db.scalar(
-            select(func.count())
-            .select_from(Match)
-            .join(BracketMatch, BracketMatch.match_id == Match.id)
-            .where(
-                BracketMatch.bracket_id == bracket_id,
-                Match.stage == MatchStage.REPECHAGE.value,
-            )
-        )
-    )
 
-    max_main_round = await db.scalar(
-        select(func.max(BracketMatch.round_number))
-        .join(Match, Match.id == BracketMatch.match_id)
-        .where(
-            BracketMatch.bracket_id == bracket_id,
-            Match.stage == MatchStage.MAIN.value,
-        )
-    )
-    if max_main_round is None:
-        return False
-    main_rounds = int(max_main_round)
-
-    final_bm = (
-        await db.execute(
-            select(BracketMatch)
-            .join(Match, Match.id == BracketMatch.match_id)
-            .where(
-                BracketMatch.bracket_id == bracket_id,
-                BracketMatch.round_number == max_main_round,
-                Match.stage == MatchStage.MAIN.value,
+def _apply_bracket_changes(
+    db: AsyncSession,
+    bracket: Bracket,
+    matches_by_id: dict[UUID, Match],
+    changes: BracketChangeSet[UUID],
+) -> None:
+    for item in changes.updated:
+        loaded = matches_by_id.get(item.key)
+        if loaded is None:
+            continue
+        loaded.athlete1_id = item.athlete1_id
+        loaded.athlete2_id = item.athlete2_id
+
+    for item in changes.inserted:
+        db.add(
+            Match(
+                id=item.key,
+                athlete1_id=item.athlete1_id,
+                athlete2_id=item.athlete2_id,
+                round_type="round",
+                stage=item.stage,
+                repechage_side=item.repechage_side,
+                repechage_step=item.repechage_step,
+                status=item.status,
             )
         )
-    ).scalar_one_or_none()
-    if final_bm is None:
-        return False
-
-    final_match = await db.get(Match, final_bm.match_id)
-    finalist_a_id = final_match.athlete1_id if final_match is not None else None
-    finalist_b_id = final_match.athlete2_id if final_match is not None else None
-    if not should_generate_repechage(
-        bracket_type=bracket.type,
-        main_rounds=main_rounds,
-        has_repechage_matches=has_repechage_matches,
-        finalist_a_id=finalist_a_id,
-        finalist_b_id=finalist_b_id,
-    ):
-        return False
-
-    finished_main_rows = (
-        await db.execute(
-            select(BracketMatch, Match)
-            .join(Match, Match.id == BracketMatch.match_id)
-            .where(
-                BracketMatch.bracket_id == bracket_id,
-                Match.status == MatchStatus.FINISHED.value,
-                Match.stage != MatchStage.REPECHAGE.value,
-                BracketMatch.round_number < max_main_round,
+        db.add(
+            BracketMatch(
+                bracket_id=bracket.id,
+                round_number=item.round_number,
+                position=item.position,
+                match_id=item.key,
+                next_slot=item.next_slot,
             )
         )
-    ).all()
-
-    finished_main_matches = [
-        FinishedMainMatch(
-            round_number=bm_row.round_number,
-            winner_id=match.winner_id,
-            athlete1_id=match.athlete1_id,
-            athlete2_id=match.athlete2_id,
-        )
-        for bm_row, match in finished_main_rows
-    ]
 
-    max_round = await db.scalar(
-        select(func.max(BracketMatch.round_number)).where(BracketMatch.bracket_id == bracket_id)
-    )
-    base_round = int(max_round or 0) + 1
-
-    generation = plan_repechage_generation(
-        finalist_a_id=finalist_a_id,
-        finalist_b_id=finalist_b_id,
-        finished_main_matches=finished_main_matches,
-        base_round=base_round,
-    )
-    if not generation.plans:
-        return False
-
-    for plan in generation.plans:
-        rep_match = Match(
-            athlete1_id=plan.athlete1_id,
-            athlete2_id=plan.athlete2_id,
-            round_type="round",
-            stage=MatchStage.REPECHAGE.value,
-            repechage_side=plan.side,
-            repechage_step=plan.step,
-            status=MatchStatus.NOT_STARTED.value,
-        )
-        db.add(rep_match)
-        await db.flush()
-        rep_bm = BracketMatch(
-            bracket_id=bracket_id,
-            round_number=plan.round_number,
-            position=plan.position,
-            match_id=rep_match.id,
-            next_slot=1 if plan.step < generation.max_step_by_side.get(plan.side, plan.step) else None,
-        )
-        db.add(rep_bm)
-    return True
+    apply_bracket_placements(bracket, changes.placements)
 
 
 async def broadcast_match_update(match: Match, db: AsyncSession) -> None:
@@ -273,15 +145,14 @@ async def broadcast_match_update(match: Match, db: AsyncSession) -> None:
         bracket_match = bracket_match_result.scalar_one_or_none()
 
         if bracket_match and bracket_match.bracket:
+            await invalidate_tournament_read_models(bracket_match.bracket.tournament_id)
             match_update = MatchUpdate(
                 match_id=match.id,
                 score_athlete1=match.score_athlete1,
                 score_athlete2=match.score_athlete2,
                 status=match.status,
             )
-            await broadcast.publish(
-                channel=f"tournament:{bracket_match.bracket.tournament_id}", message=match_update.model_dump_json()
-            )
+            await publish_tournament_update(bracket_match.bracket.tournament_id, match_update)
     except Exception as exc:
         logger.error(f"Error broadcasting match update: {exc}")
 
@@ -327,82 +198,40 @@ async def finish_match(
     if not can_finish:
         raise HTTPException(400, finish_error)
 
+    bm_result = await db.execute(select(BracketMatch).where(BracketMatch.match_id == match.id))
+    bm = bm_result.scalar_one_or_none()
+
+    bracket = await db.get(Bracket, bm.bracket_id) if bm else None
+    # Loaded before the match changes so the stored placements advance from this match's previous result.
+    loaded = await _load_bracket_runtime(db, bracket) if bracket is not None else None
+
     match.score_athlete1 = result.score_athlete1
     match.score_athlete2 = result.score_athlete2
     match.winner_id = result.winner_id
     match.status = MatchStatus.FINISHED.value
     match.ended_at = datetime.now(UTC)
 
-    bm_result = await db.execute(select(BracketMatch).where(BracketMatch.match_id == match.id))
-    bm = bm_result.scalar_one_or_none()
-
-    if bm:
-        bracket = await db.get(Bracket, bm.bracket_id)
-        if bracket is not None:
-            bump_bracket_version(bracket)
-        runtime = decide_finish_flow_runtime(
-            origin=origin,
-            stage=match.stage,
-            current_round_number=bm.round_number,
-            current_position=bm.position,
-            explicit_next_slot=bm.next_slot,
-            repechage_side=match.repechage_side,
-            repechage_step=match.repechage_step,
-            allow_implicit_main_slot=False,
-            repechage_stage_value=MatchStage.REPECHAGE.value,
-        )
-        action = runtime.progression_action
-
-        if action is not None and match.winner_id is not None:
-            await _apply_winner_to_next_match(
-                db,
-                bm,
-                match.winner_id,
-                action,
-            )
-
-        generated_repechage = False
-        if runtime.attempt_generate_repechage:
-            generated_repechage = await _ensure_repechage_generated(db, bm.bracket_id)
-        await _recompute_bracket_placements(db, bm.bracket_id)
-
-        total_in_bracket = await db.scalar(
-            select(func.count()).select_from(BracketMatch).where(BracketMatch.bracket_id == bm.bracket_id)
-        )
-        finished_in_bracket = await db.scalar(
-            select(func.count())
-            .select_from(Match)
-            .join(BracketMatch, BracketMatch.match_id == Match.id)
-            .where(
-                BracketMatch.bracket_id == bm.bracket_id,
-                Match.status == MatchStatus.FINISHED.value,
-            )
-        )
-
-        post = decide_finish_flow_post(
-            is_repechage_match=match.stage == MatchStage.REPECHAGE.value,
-            generated_repechage=generated_repechage,
-            total_matches=total_in_bracket,
-            finished_matches=finished_in_bracket,
-            current_bracket_status=bracket.status if bracket is not None else None,
-            finished_status_value=BracketStatus.FINISHED.value,
-        )
-        if post.completion.should_finish_bracket:
-            if bracket:
-                bracket.status = BracketStatus.FINISHED.value
-                bracket.state = derive_bracket_state_from_status(bracket.status, bracket.state)
-                unfinished_brackets = await db.scalar(
-                    select(func.count())
-                    .select_from(Bracket)
-                    .where(
-                        Bracket.tournament_id == bracket.tournament_id,
-                        Bracket.status != BracketStatus.FINISHED.value,
-                    )
+    if bracket is not None and loaded is not None:
+        runtime, matches_by_id = loaded
+        bump_bracket_version(bracket)
+        changes = runtime.apply_result(match.id, match.winner_id, origin=origin)
+        _apply_bracket_changes(db, bracket, matches_by_id, changes)
+
+        if changes.finish_bracket:
+            bracket.status = BracketStatus.FINISHED.value
+            bracket.state = derive_bracket_state_from_status(bracket.status, bracket.state)
+            unfinished_brackets = await db.scalar(
+                select(func.count())
+                .select_from(Bracket)
+                .where(
+                    Bracket.tournament_id == bracket.tournament_id,
+                    Bracket.status != BracketStatus.FINISHED.value,
                 )
-                if should_finish_tournament(unfinished_brackets):
-                    tournament = await db.get(Tournament, bracket.tournament_id)
-                    if tournament and tournament.status != TournamentStatus.FINISHED.value:
-                        tournament.status = TournamentStatus.FINISHED.value
+            )
+            if should_finish_tournament(unfinished_brackets):
+                tournament = await db.get(Tournament, bracket.tournament_id)
+                if tournament and tournament.status != TournamentStatus.FINISHED.value:
+                    tournament.status = TournamentStatus.FINISHED.value
 
     await db.commit()
     await db.refresh(match)
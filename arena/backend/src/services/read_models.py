@@ -0,0 +1,156 @@
+import hashlib
+from collections.abc import Awaitable, Callable
+
+from fastapi import Request, Response
+from redis import asyncio as redis
+from sqlalchemy import func, or_, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.config import DEV_MODE, READ_MODEL_TTL_SECONDS, REDIS_URL
+from src.logger import logger
+from src.models import Bracket, BracketMatch, BracketParticipant, Match, Tournament
+
+
+class MemoryReadModelCache:
+    def __init__(self) -> None:
+        self._generations: dict[int, int] = {}
+        self._entries: dict[tuple[int, str], tuple[str, bytes]] = {}
+
+    async def generation(self, tournament_id: int) -> int:
+        return self._generations.get(tournament_id, 0)
+
+    async def get(self, tournament_id: int, view: str, version: str) -> bytes | None:
+        entry = self._entries.get((tournament_id, view))
+        if entry is None or entry[0] != version:
+            return None
+        return entry[1]
+
+    async def set(self, tournament_id: int, view: str, version: str, body: bytes) -> None:
+        self._entries[(tournament_id, view)] = (version, body)
+
+    async def invalidate(self, tournament_id: int) -> None:
+        self._generations[tournament_id] = self._generations.get(tournament_id, 0) + 1
+        for key in [key for key in self._entries if key[0] == tournament_id]:
+            del self._entries[key]
+
+    async def close(self) -> None:
+        return None
+
+
+class RedisReadModelCache:
+    def __init__(self, url: str, ttl_seconds: int) -> None:
+        self._ttl_seconds = ttl_seconds
+        self._conn = redis.Redis.from_url(url)
+
+    @staticmethod
+    def _generation_key(tournament_id: int) -> str:
+        return f"readmodel:{tournament_id}:generation"
+
+    @staticmethod
+    def _entry_key(tournament_id: int, view: str) -> str:
+        return f"readmodel:{tournament_id}:{view}"
+
+    async def generation(self, tournament_id: int) -> int:
+        return int(await self._conn.get(self._generation_key(tournament_id)) or 0)
+
+    async def get(self, tournament_id: int, view: str, version: str) -> bytes | None:
+        entry = await self._conn.hmget(self._entry_key(tournament_id, view), ["version", "body"])
+        if entry[0] is None or entry[0].decode() != version:
+            return None
+        body: bytes = entry[1]
+        return body
+
+    async def set(self, tournament_id: int, view: str, version: str, body: bytes) -> None:
+        key = self._entry_key(tournament_id, view)
+        async with self._conn.pipeline(transaction=True) as pipe:
+            pipe.hset(key, mapping={"version": version, "body": body})
+            pipe.expire(key, self._ttl_seconds)
+            await pipe.execute()
+
+    async def invalidate(self, tournament_id: int) -> None:
+        await self._conn.incr(self._generation_key(tournament_id))
+
+    async def close(self) -> None:
+        await self._conn.aclose()
+
+
+cache: MemoryReadModelCache | RedisReadModelCache
+if DEV_MODE:
+    cache = MemoryReadModelCache()
+else:
+    cache = RedisReadModelCache(REDIS_URL, READ_MODEL_TTL_SECONDS)
+
+
+async def invalidate_tournament_read_models(tournament_id: int) -> None:
+    try:
+        await cache.invalidate(tournament_id)
+    except Exception as exc:
+        logger.error(f"Error invalidating read models for tournament {tournament_id}: {exc}")
+
+
+async def athlete_tournament_ids(db: AsyncSession, athlete_id: int) -> list[int]:
+    participant_brackets = select(BracketParticipant.bracket_id).where(BracketParticipant.athlete_id == athlete_id)
+    match_brackets = (
+        select(BracketMatch.bracket_id)
+        .join(Match, Match.id == BracketMatch.match_id)
+        .where(or_(Match.athlete1_id == athlete_id, Match.athlete2_id == athlete_id, Match.winner_id == athlete_id))
+    )
+    result = await db.execute(
+        select(Bracket.tournament_id)
+        .where(or_(Bracket.id.in_(participant_brackets), Bracket.id.in_(match_brackets)))
+        .distinct()
+    )
+    return list(result.scalars().all())
+
+
+async def tournament_read_model_version(db: AsyncSession, tournament_id: int) -> str | None:
+    row = (
+        await db.execute(
+            select(
+                Tournament.updated_at,
+                func.count(Bracket.id),
+                func.coalesce(func.sum(Bracket.version), 0),
+                func.max(Bracket.updated_at),
+            )
+            .select_from(Tournament)
+            .outerjoin(Bracket, Bracket.tournament_id == Tournament.id)
+            .where(Tournament.id == tournament_id)
+            .group_by(Tournament.id)
+        )
+    ).one_or_none()
+    if row is None:
+        return None
+    generation = await cache.generation(tournament_id)
+    raw = "|".join(str(value) for value in (*row, generation))
+    return hashlib.blake2b(raw.encode(), digest_size=12).hexdigest()
+
+
+def _etag_matches(request: Request, etag: str) -> bool:
+    header = request.headers.get("if-none-match")
+    if not header:
+        return False
+    candidates = {item.strip().removeprefix("W/") for item in header.split(",")}
+    return etag in candidates or "*" in candidates
+
+
+async def cached_tournament_read_model(
+    request: Request,
+    db: AsyncSession,
+    tournament_id: int,
+    view: str,
+    build: Callable[[], Awaitable[bytes]],
+) -> Response:
+    version = await tournament_read_model_version(db, tournament_id)
+    if version is None:
+        return Response(content=await build(), media_type="application/json")
+
+    etag = f'"{view}-{version}"'
+    headers = {"ETag": etag, "Cache-Control": "no-cache"}
+    if _etag_matches(request, etag):
+        return Response(status_code=304, headers=headers)
+
+    body = await cache.get(tournament_id, view, version)
+    if body is None:
+        body = await build()
+        await cache.set(tournament_id, view, version, body)
+    return Response(content=body, media_type="application/json", headers=headers)
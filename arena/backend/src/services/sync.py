@@ -1,14 +1,32 @@
 from datetime import UTC, datetime
+from typing import Any
 from uuid import UUID
 
-from champion_domain import PlacementMatchInput, compute_bracket_placements, derive_bracket_state_from_status
+from champion_domain import (
+    StructureSnapshot,
+    advance_bracket_placements,
+    derive_bracket_state_from_status,
+    diff_structure_snapshots,
+)
+from champion_domain.use_cases import StructureMatch, StructureParticipant
 from pydantic import BaseModel, ValidationError
-from sqlalchemy import delete, select
+from sqlalchemy import delete, insert, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.logger import logger
-from src.models import Athlete, Bracket, BracketMatch, BracketParticipant, Match, SyncEdgeState, SyncInboxEvent
+from src.models import (
+    Athlete,
+    Bracket,
+    BracketMatch,
+    BracketParticipant,
+    Match,
+    MatchStatus,
+    SyncEdgeState,
+    SyncInboxEvent,
+)
 from src.schemas import (
+    BracketVersionUpdate,
+    MatchBatchUpdate,
     MatchUpdate,
     SyncConflict,
     SyncStatusResponse,
@@ -16,8 +34,15 @@ from src.schemas import (
     SyncUpsertsRequest,
     SyncUpsertsResponse,
 )
+from src.services.bracket_index import (
+    apply_bracket_placements,
+    bracket_placements,
+    match_placement_input,
+    recompute_bracket_placements,
+)
 from src.services.bracket_upsert_dto import parse_structure_payload_dto
-from src.services.broadcast import broadcast
+from src.services.read_models import invalidate_tournament_read_models
+from src.services.tournament_feed import publish_tournament_update
 
 
 class SyncApplyConflict(Exception):
@@ -43,6 +68,100 @@ class MatchUpsertPayloadDTO(BaseModel):
     ended_at: datetime | None = None
 
 
+class _UpsertBatch:
+    def __init__(self) -> None:
+        self.seen_event_ids: set[UUID] = set()
+        self.match_brackets: dict[UUID, tuple[int, int, int | None]] = {}
+        self.athlete_ids: set[int] = set()
+        self.preloaded: list[Match | Bracket] = []
+        self.dirty_brackets: set[int] = set()
+        self.started_brackets: set[int] = set()
+        self._item_dirty: set[int] = set()
+        self._item_started: set[int] = set()
+        self._item_snapshots: set[int] = set()
+
+    def is_dirty(self, bracket_id: int) -> bool:
+        return bracket_id in self.dirty_brackets or bracket_id in self._item_dirty
+
+    def mark_dirty(self, bracket_id: int) -> None:
+        self._item_dirty.add(bracket_id)
+
+    def mark_started(self, bracket_id: int) -> None:
+        self._item_started.add(bracket_id)
+
+    def mark_snapshot(self, bracket_id: int) -> None:
+        self._item_snapshots.add(bracket_id)
+        self._item_dirty.add(bracket_id)
+
+    def start_item(self) -> None:
+        self._item_dirty = set()
+        self._item_started = set()
+        self._item_snapshots = set()
+
+    def finish_item(self) -> None:
+        for bracket_id in self._item_snapshots:
+            self.started_brackets.discard(bracket_id)
+            self.match_brackets = {
+                match_id: state for match_id, state in self.match_brackets.items() if state[0] != bracket_id
+            }
+        self.dirty_brackets.update(self._item_dirty)
+        self.started_brackets.update(self._item_started)
+
+
+def _payload_athlete_ids(item: SyncUpsertItem) -> set[int]:
+    if item.type == "match.upsert":
+        candidates = [item.payload.get(key) for key in ("athlete1_id", "athlete2_id", "winner_id")]
+    elif item.type == "bracket.upsert":
+        participants = item.payload.get("participants")
+        candidates = (
+            [entry.get("athlete_id") for entry in participants if isinstance(entry, dict)]
+            if isinstance(participants, list)
+            else []
+        )
+    else:
+        candidates = []
+    return {value for value in candidates if isinstance(value, int)}
+
+
+async def _prefetch_upsert_batch(db: AsyncSession, items: list[SyncUpsertItem]) -> _UpsertBatch:
+    batch = _UpsertBatch()
+
+    event_ids = [item.event_id for item in items]
+    if event_ids:
+        seen_result = await db.execute(select(SyncInboxEvent.event_id).where(SyncInboxEvent.event_id.in_(event_ids)))
+        batch.seen_event_ids.update(seen_result.scalars().all())
+
+    match_ids: set[UUID] = set()
+    bracket_ids: set[int] = set()
+    athlete_ids: set[int] = set()
+    for item in items:
+        athlete_ids.update(_payload_athlete_ids(item))
+        try:
+            if item.type == "match.upsert":
+                match_ids.add(UUID(item.aggregate_id))
+            elif item.type == "bracket.upsert":
+                bracket_ids.add(int(item.aggregate_id))
+        except ValueError:
+            continue
+
+    if match_ids:
+        batch.preloaded.extend((await db.execute(select(Match).where(Match.id.in_(match_ids)))).scalars().all())
+        placement_rows = await db.execute(
+            select(
+                BracketMatch.match_id, BracketMatch.bracket_id, BracketMatch.round_number, BracketMatch.position
+            ).where(BracketMatch.match_id.in_(match_ids))
+        )
+        for match_id, bracket_id, round_number, position in placement_rows.all():
+            batch.match_brackets[match_id] = (bracket_id, round_number, position)
+            bracket_ids.add(bracket_id)
+    if bracket_ids:
+        batch.preloaded.extend((await db.execute(select(Bracket).where(Bracket.id.in_(bracket_ids)))).scalars().all())
+    if athlete_ids:
+        athlete_result = await db.execute(select(Athlete.id).where(Athlete.id.in_(athlete_ids)))
+        batch.athlete_ids.update(athlete_result.scalars().all())
+    return batch
+
+
 async def _get_or_create_edge_state(db: AsyncSession, edge_id: str, tournament_id: int) -> SyncEdgeState:
     edge_state = await db.get(SyncEdgeState, (edge_id, tournament_id))
     if edge_state is None:
@@ -52,80 +171,74 @@ async def _get_or_create_edge_state(db: AsyncSession, edge_id: str, tournament_i
     return edge_state
 
 
-async def _match_bracket_state(db: AsyncSession, match_id: UUID) -> tuple[int, int]:
-    result = await db.execute(
-        select(Bracket.id, Bracket.version)
-        .join(BracketMatch, BracketMatch.bracket_id == Bracket.id)
-        .where(BracketMatch.match_id == match_id)
-    )
-    row = result.first()
-    if row is None:
+async def _match_bracket_state(
+    db: AsyncSession, batch: _UpsertBatch, match_id: UUID
+) -> tuple[Bracket, int, int | None]:
+    state = batch.match_brackets.get(match_id)
+    if state is None:
+        result = await db.execute(
+            select(BracketMatch.bracket_id, BracketMatch.round_number, BracketMatch.position).where(
+                BracketMatch.match_id == match_id
+            )
+        )
+        row = result.first()
+        if row is None:
+            raise SyncApplyConflict("aggregate_not_found")
+        state = (int(row[0]), int(row[1]), row[2])
+        batch.match_brackets[match_id] = state
+
+    bracket_id, round_number, position = state
+    bracket = await db.get(Bracket, bracket_id)
+    if bracket is None:
         raise SyncApplyConflict("aggregate_not_found")
-    return int(row[0]), int(row[1])
+    return bracket, round_number, position
 
 
-async def _resolve_athlete_id(db: AsyncSession, athlete_id: int | None) -> int | None:
-    if athlete_id is None:
-        return None
+async def _resolve_athlete_id(db: AsyncSession, batch: _UpsertBatch, athlete_id: int | None) -> int | None:
+    if athlete_id is None or athlete_id in batch.athlete_ids:
+        return athlete_id
     athlete = await db.get(Athlete, athlete_id)
     if athlete is None:
         raise SyncApplyConflict("aggregate_not_found")
+    batch.athlete_ids.add(athlete.id)
     return athlete.id
 
 
-async def _broadcast_sync_refresh(tournament_id: int, match_id: UUID) -> None:
+async def _broadcast_sync_batch(
+    db: AsyncSession, tournament_id: int, match_ids: list[UUID], bracket_ids: list[int]
+) -> None:
     try:
-        await broadcast.publish(
-            channel=f"tournament:{tournament_id}",
-            message=MatchUpdate(
-                match_id=match_id,
-                score_athlete1=None,
-                score_athlete2=None,
-                status=None,
-            ).model_dump_json(),
+        match_rows = await db.execute(
+            select(Match.id, Match.score_athlete1, Match.score_athlete2, Match.status).where(Match.id.in_(match_ids))
+        )
+        matches = {row.id: row for row in match_rows.all()}
+        bracket_rows = await db.execute(select(Bracket.id, Bracket.version).where(Bracket.id.in_(bracket_ids)))
+        await publish_tournament_update(
+            tournament_id,
+            MatchBatchUpdate(
+                matches=[
+                    MatchUpdate(
+                        match_id=match_id,
+                        score_athlete1=matches[match_id].score_athlete1,
+                        score_athlete2=matches[match_id].score_athlete2,
+                        status=matches[match_id].status,
+                    )
+                    for match_id in match_ids
+                    if match_id in matches
+                ],
+                brackets=[
+                    BracketVersionUpdate(bracket_id=bracket_id, version=version)
+                    for bracket_id, version in sorted(bracket_rows.all())
+                ],
+            ),
         )
     except Exception as exc:
         logger.error(f"Error broadcasting sync update: {exc}")
 
 
-async def _recompute_bracket_placements(db: AsyncSession, bracket_id: int) -> None:
-    bracket = await db.get(Bracket, bracket_id)
-    if bracket is None:
-        return
-
-    rows = (
-        await db.execute(
-            select(BracketMatch, Match)
-            .join(Match, Match.id == BracketMatch.match_id)
-            .where(BracketMatch.bracket_id == bracket_id)
-        )
-    ).all()
-
-    placements = compute_bracket_placements(
-        [
-            PlacementMatchInput(
-                round_number=bm.round_number,
-                stage=match.stage,
-                status=match.status,
-                winner_id=match.winner_id,
-                athlete1_id=match.athlete1_id,
-                athlete2_id=match.athlete2_id,
-                repechage_side=match.repechage_side,
-                repechage_step=match.repechage_step,
-            )
-            for bm, match in rows
-        ],
-        repechage_stage_value="repechage",
-        finished_status_value="finished",
-    )
-
-    bracket.place_1_id = placements.place_1_id
-    bracket.place_2_id = placements.place_2_id
-    bracket.place_3_a_id = placements.place_3_a_id
-    bracket.place_3_b_id = placements.place_3_b_id
-
-
-async def _apply_match_upsert(db: AsyncSession, item: SyncUpsertItem) -> tuple[int, int, UUID | None]:
+async def _apply_match_upsert(
+    db: AsyncSession, batch: _UpsertBatch, item: SyncUpsertItem
+) -> tuple[int, int, list[UUID]]:
     try:
         match_id = UUID(item.aggregate_id)
     except ValueError as exc:
@@ -140,17 +253,18 @@ async def _apply_match_upsert(db: AsyncSession, item: SyncUpsertItem) -> tuple[i
     except ValidationError as exc:
         raise SyncApplyConflict("invalid_payload") from exc
 
-    bracket_id, current_version = await _match_bracket_state(db, match_id)
-    if item.aggregate_version < current_version:
+    bracket, round_number, position = await _match_bracket_state(db, batch, match_id)
+    if item.aggregate_version < bracket.version:
         raise SyncApplyConflict(
             "version_conflict",
-            expected_version=current_version,
+            expected_version=bracket.version,
             received_version=item.aggregate_version,
         )
 
-    match.athlete1_id = await _resolve_athlete_id(db, payload.athlete1_id)
-    match.athlete2_id = await _resolve_athlete_id(db, payload.athlete2_id)
-    match.winner_id = await _resolve_athlete_id(db, payload.winner_id)
+    previous = match_placement_input(match, round_number, position)
+    match.athlete1_id = await _resolve_athlete_id(db, batch, payload.athlete1_id)
+    match.athlete2_id = await _resolve_athlete_id(db, batch, payload.athlete2_id)
+    match.winner_id = await _resolve_athlete_id(db, batch, payload.winner_id)
     match.round_type = payload.round_type
     match.stage = payload.stage
     match.repechage_side = payload.repechage_side
@@ -161,18 +275,83 @@ async def _apply_match_upsert(db: AsyncSession, item: SyncUpsertItem) -> tuple[i
     match.started_at = payload.started_at
     match.ended_at = payload.ended_at
 
-    bracket = await db.get(Bracket, bracket_id)
-    if bracket is None:
-        raise SyncApplyConflict("aggregate_not_found")
     bracket.version = max(bracket.version, item.aggregate_version)
-    if match.status in {"started", "finished"} and bracket.status != "finished":
-        bracket.status = "started"
-        bracket.state = derive_bracket_state_from_status(bracket.status, bracket.state)
-    await _recompute_bracket_placements(db, bracket_id)
-    return bracket_id, bracket.tournament_id, match.id
+    if match.status in {"started", "finished"}:
+        batch.mark_started(bracket.id)
+
+    if not batch.is_dirty(bracket.id):
+        placements = advance_bracket_placements(
+            bracket_placements(bracket),
+            previous,
+            match_placement_input(match, round_number, position),
+            finished_status_value=MatchStatus.FINISHED.value,
+        )
+        if placements is None:
+            batch.mark_dirty(bracket.id)
+        else:
+            apply_bracket_placements(bracket, placements)
+    return bracket.id, bracket.tournament_id, [match.id]
+
+
+def _match_columns(item: StructureMatch) -> dict[str, Any]:
+    return {
+        "athlete1_id": item.athlete1_id,
+        "athlete2_id": item.athlete2_id,
+        "winner_id": item.winner_id,
+        "score_athlete1": item.score_athlete1,
+        "score_athlete2": item.score_athlete2,
+        "round_type": item.round_type,
+        "stage": item.stage,
+        "repechage_side": item.repechage_side,
+        "repechage_step": item.repechage_step,
+        "status": item.status,
+        "started_at": item.started_at,
+        "ended_at": item.ended_at,
+    }
+
+
+def _stored_structure_match(bracket_match: BracketMatch, match: Match) -> StructureMatch:
+    return StructureMatch(
+        id=match.id,
+        round_number=bracket_match.round_number,
+        position=bracket_match.position,
+        next_slot=bracket_match.next_slot,
+        round_type=match.round_type,
+        stage=match.stage,
+        status=match.status,
+        athlete1_id=match.athlete1_id,
+        athlete2_id=match.athlete2_id,
+        winner_id=match.winner_id,
+        score_athlete1=match.score_athlete1,
+        score_athlete2=match.score_athlete2,
+        repechage_side=match.repechage_side,
+        repechage_step=match.repechage_step,
+        started_at=match.started_at,
+        ended_at=match.ended_at,
+    )
+
 
+async def _load_stored_structure(
+    db: AsyncSession, bracket_id: int
+) -> tuple[dict[UUID, tuple[BracketMatch, Match]], dict[int, BracketParticipant]]:
+    match_rows = await db.execute(
+        select(BracketMatch, Match)
+        .join(Match, Match.id == BracketMatch.match_id)
+        .where(BracketMatch.bracket_id == bracket_id)
+        .order_by(BracketMatch.round_number, BracketMatch.position)
+    )
+    participant_rows = await db.execute(
+        select(BracketParticipant).where(BracketParticipant.bracket_id == bracket_id).order_by(BracketParticipant.seed)
+    )
+    return (
+        {match.id: (bracket_match, match) for bracket_match, match in match_rows.all()},
+        {participant.seed: participant for participant in participant_rows.scalars().all()},
+    )
 
-async def _apply_bracket_upsert(db: AsyncSession, item: SyncUpsertItem) -> tuple[int, int, UUID | None]:
+
+async def _apply_bracket_upsert(
+    db: AsyncSession, batch: _UpsertBatch, item: SyncUpsertItem
+) -> tuple[int, int, list[UUID]]:
     try:
         bracket_id = int(item.aggregate_id)
     except ValueError as exc:
@@ -204,70 +383,93 @@ async def _apply_bracket_upsert(db: AsyncSession, item: SyncUpsertItem) -> tuple
     else:
         bracket.state = derive_bracket_state_from_status(bracket.status, bracket.state)
 
-    bracket.place_1_id = None
-    bracket.place_2_id = None
-    bracket.place_3_a_id = None
-    bracket.place_3_b_id = None
-
-    await db.execute(
-        delete(Match).where(Match.id.in_(select(BracketMatch.match_id).where(BracketMatch.bracket_id == bracket_id)))
+    stored_matches, stored_participants = await _load_stored_structure(db, bracket_id)
+    patch = diff_structure_snapshots(
+        StructureSnapshot(
+            participants=tuple(
+                StructureParticipant(athlete_id=participant.athlete_id, seed=participant.seed)
+                for participant in stored_participants.values()
+            ),
+            matches=tuple(
+                _stored_structure_match(bracket_match, match) for bracket_match, match in stored_matches.values()
+            ),
+        ),
+        StructureSnapshot(participants=tuple(participants), matches=tuple(matches)),
     )
-    await db.execute(delete(BracketMatch).where(BracketMatch.bracket_id == bracket_id))
-    await db.execute(delete(BracketParticipant).where(BracketParticipant.bracket_id == bracket_id))
-
-    for participant in sorted(participants, key=lambda entry: entry.seed):
-        await _resolve_athlete_id(db, participant.athlete_id)
-        db.add(
-            BracketParticipant(
-                bracket_id=bracket_id,
-                athlete_id=participant.athlete_id,
-                seed=participant.seed,
+
+    for participant in (*patch.added_participants, *patch.changed_participants):
+        await _resolve_athlete_id(db, batch, participant.athlete_id)
+
+    if patch.removed_match_ids:
+        await db.execute(delete(BracketMatch).where(BracketMatch.match_id.in_(patch.removed_match_ids)))
+        await db.execute(delete(Match).where(Match.id.in_(patch.removed_match_ids)))
+    if patch.removed_participant_seeds:
+        await db.execute(
+            delete(BracketParticipant).where(
+                BracketParticipant.bracket_id == bracket_id,
+                BracketParticipant.seed.in_(patch.removed_participant_seeds),
             )
         )
 
-    broadcast_match_id: UUID | None = None
-    for planned_match in matches:
-        if broadcast_match_id is None:
-            broadcast_match_id = planned_match.id
-        db.add(
-            Match(
-                id=planned_match.id,
-                athlete1_id=planned_match.athlete1_id,
-                athlete2_id=planned_match.athlete2_id,
-                winner_id=planned_match.winner_id,
-                score_athlete1=planned_match.score_athlete1,
-                score_athlete2=planned_match.score_athlete2,
-                round_type=planned_match.round_type,
-                stage=planned_match.stage,
-                repechage_side=planned_match.repechage_side,
-                repechage_step=planned_match.repechage_step,
-                status=planned_match.status,
-                started_at=planned_match.started_at,
-                ended_at=planned_match.ended_at,
-            )
+    for structure_match in patch.changed_matches:
+        bracket_match, match = stored_matches[structure_match.id]
+        for key, value in _match_columns(structure_match).items():
+            setattr(match, key, value)
+        bracket_match.round_number = structure_match.round_number
+        bracket_match.position = structure_match.position
+        bracket_match.next_slot = structure_match.next_slot
+    for structure_participant in patch.changed_participants:
+        stored_participants[structure_participant.seed].athlete_id = structure_participant.athlete_id
+
+    if patch.added_matches:
+        await db.execute(
+            insert(Match),
+            [{"id": item.id, **_match_columns(item)} for item in patch.added_matches],
         )
-        db.add(
-            BracketMatch(
-                round_number=planned_match.round_number,
-                position=planned_match.position,
-                next_slot=planned_match.next_slot,
-                bracket_id=bracket_id,
-                match_id=planned_match.id,
-            )
+        await db.execute(
+            insert(BracketMatch),
+            [
+                {
+                    "bracket_id": bracket_id,
+                    "match_id": item.id,
+                    "round_number": item.round_number,
+                    "position": item.position,
+                    "next_slot": item.next_slot,
+                }
+                for item in patch.added_matches
+            ],
+        )
+    if patch.added_participants:
+        await db.execute(
+            insert(BracketParticipant),
+            [
+                {"bracket_id": bracket_id, "athlete_id": item.athlete_id, "seed": item.seed}
+                for item in patch.added_participants
+            ],
         )
-    await db.flush()
-    await _recompute_bracket_placements(db, bracket_id)
-    return bracket_id, bracket.tournament_id, broadcast_match_id
+
+    batch.mark_snapshot(bracket_id)
+    return bracket_id, bracket.tournament_id, [item.id for item in (*patch.changed_matches, *patch.added_matches)]
 
 
-async def _apply_upsert(db: AsyncSession, item: SyncUpsertItem) -> tuple[int, int, UUID | None]:
+async def _apply_upsert(db: AsyncSession, batch: _UpsertBatch, item: SyncUpsertItem) -> tuple[int, int, list[UUID]]:
     if item.type == "match.upsert":
-        return await _apply_match_upsert(db, item)
+        return await _apply_match_upsert(db, batch, item)
     if item.type == "bracket.upsert":
-        return await _apply_bracket_upsert(db, item)
+        return await _apply_bracket_upsert(db, batch, item)
     raise SyncApplyConflict("unsupported_upsert_type")
 
 
+async def _finalize_dirty_brackets(db: AsyncSession, batch: _UpsertBatch) -> None:
+    for bracket_id in sorted(batch.started_brackets):
+        bracket = await db.get(Bracket, bracket_id)
+        if bracket is not None and bracket.status != "finished":
+            bracket.status = "started"
+            bracket.state = derive_bracket_state_from_status(bracket.status, bracket.state)
+    for bracket_id in sorted(batch.dirty_brackets):
+        await recompute_bracket_placements(db, bracket_id)
+
+
 async def get_status(db: AsyncSession, edge_id: str, tournament_id: int) -> SyncStatusResponse:
     edge_state = await _get_or_create_edge_state(db, edge_id, tournament_id)
     await db.commit()
@@ -279,19 +481,107 @@ async def get_status(db: AsyncSession, edge_id: str, tournament_id: int) -> Sync
     )
 
 
+def _upsert_scope(item: SyncUpsertItem, batch: _UpsertBatch) -> tuple[str, str]:
+    try:
+        if item.type == "bracket.upsert":
+            return "bracket", str(int(item.aggregate_id))
+        if item.type == "match.upsert":
+            state = batch.match_brackets.get(UUID(item.aggregate_id))
+            if state is not None:
+                return "bracket", str(state[0])
+    except ValueError:
+        pass
+    # Unknown aggregates never share a scope, so they are always applied on their own.
+    return "event", str(item.event_id)
+
+
+def _coalesce_upserts(items: list[SyncUpsertItem], batch: _UpsertBatch) -> dict[UUID, UUID]:
+    # Only consecutive upserts of one aggregate coalesce; any other item touching the same bracket ends the run,
+    # because it may move the bracket version the older items were checked against.
+    runs: list[list[SyncUpsertItem]] = []
+    open_runs: dict[tuple[str, str], list[SyncUpsertItem]] = {}
+    fresh_event_ids: set[UUID] = set()
+    for item in items:
+        if item.event_id in batch.seen_event_ids or item.event_id in fresh_event_ids:
+            continue
+        fresh_event_ids.add(item.event_id)
+        scope = _upsert_scope(item, batch)
+        run = open_runs.get(scope)
+        if run is None or (run[0].type, run[0].aggregate_id) != (item.type, item.aggregate_id):
+            run = []
+            open_runs[scope] = run
+            runs.append(run)
+        run.append(item)
+
+    superseded: dict[UUID, UUID] = {}
+    for run in runs:
+        winner = max(run, key=lambda entry: (entry.aggregate_version, entry.seq))
+        # Items after the winner carry older versions and are applied (and rejected) on their own.
+        for item in run[: run.index(winner)]:
+            superseded[item.event_id] = winner.event_id
+    return superseded
+
+
+async def _apply_in_savepoint(
+    db: AsyncSession, batch: _UpsertBatch, item: SyncUpsertItem
+) -> tuple[int, int, list[UUID]] | SyncApplyConflict:
+    batch.start_item()
+    try:
+        async with db.begin_nested():
+            applied = await _apply_upsert(db, batch, item)
+    except SyncApplyConflict as exc:
+        return exc
+    except Exception:
+        return SyncApplyConflict("apply_failed")
+    batch.finish_item()
+    return applied
+
+
 async def apply_upserts(db: AsyncSession, payload: SyncUpsertsRequest) -> SyncUpsertsResponse:
     accepted: list[int] = []
     duplicates: list[int] = []
     conflicts: list[SyncConflict] = []
+    refreshes: dict[int, tuple[dict[UUID, None], set[int]]] = {}
 
     edge_state = await _get_or_create_edge_state(db, payload.edge_id, payload.tournament_id)
-    await db.commit()
-
-    for item in sorted(payload.items, key=lambda entry: entry.seq):
-        existing = await db.execute(select(SyncInboxEvent).where(SyncInboxEvent.event_id == item.event_id))
-        if existing.scalar_one_or_none() is not None:
+    items = sorted(payload.items, key=lambda entry: entry.seq)
+    batch = await _prefetch_upsert_batch(db, items)
+    superseded = _coalesce_upserts(items, batch)
+    coalesced: dict[UUID, list[tuple[SyncUpsertItem, SyncInboxEvent]]] = {}
+
+    def record(
+        outcomes: list[tuple[SyncUpsertItem, SyncInboxEvent]],
+        result: tuple[int, int, list[UUID]] | SyncApplyConflict,
+    ) -> None:
+        if isinstance(result, SyncApplyConflict):
+            for outcome_item, outcome_event in outcomes:
+                outcome_event.error = result.reason
+                conflicts.append(
+                    SyncConflict(
+                        seq=outcome_item.seq,
+                        reason=result.reason,
+                        expected_version=result.expected_version,
+                        received_version=(
+                            outcome_item.aggregate_version if result.received_version is not None else None
+                        ),
+                    )
+                )
+            return
+
+        bracket_id, tournament_id, changed_match_ids = result
+        for outcome_item, outcome_event in outcomes:
+            outcome_event.applied = True
+            outcome_event.error = None
+            accepted.append(outcome_item.seq)
+        refreshed_matches, refreshed_brackets = refreshes.setdefault(tournament_id, ({}, set()))
+        refreshed_matches.update(dict.fromkeys(changed_match_ids))
+        refreshed_brackets.add(bracket_id)
+
+    for item in items:
+        if item.event_id in batch.seen_event_ids:
             duplicates.append(item.seq)
             continue
+        batch.seen_event_ids.add(item.event_id)
 
         expected_seq = edge_state.last_applied_seq + 1
         if item.seq != expected_seq:
@@ -306,41 +596,31 @@ async def apply_upserts(db: AsyncSession, payload: SyncUpsertsRequest) -> SyncUp
             applied=False,
         )
         db.add(inbox_event)
-        await db.flush()
+        edge_state.last_applied_seq = max(edge_state.last_applied_seq, item.seq)
 
-        try:
-            bracket_id, tournament_id, broadcast_match_id = await _apply_upsert(db, item)
-        except SyncApplyConflict as exc:
-            inbox_event.error = exc.reason
-            conflicts.append(
-                SyncConflict(
-                    seq=item.seq,
-                    reason=exc.reason,
-                    expected_version=exc.expected_version,
-                    received_version=exc.received_version,
-                )
-            )
-            edge_state.last_applied_seq = max(edge_state.last_applied_seq, item.seq)
-            await db.commit()
-            continue
-        except Exception:
-            inbox_event.error = "apply_failed"
-            conflicts.append(SyncConflict(seq=item.seq, reason="apply_failed"))
-            edge_state.last_applied_seq = max(edge_state.last_applied_seq, item.seq)
-            await db.commit()
+        winner_event_id = superseded.get(item.event_id)
+        if winner_event_id is not None:
+            coalesced.setdefault(winner_event_id, []).append((item, inbox_event))
             continue
 
-        inbox_event.applied = True
-        inbox_event.error = None
-        edge_state.last_applied_seq = max(edge_state.last_applied_seq, item.seq)
-        accepted.append(item.seq)
-        await db.commit()
-        if broadcast_match_id is not None:
-            await _broadcast_sync_refresh(tournament_id, broadcast_match_id)
+        result = await _apply_in_savepoint(db, batch, item)
+        pending = coalesced.pop(item.event_id, [])
+        if isinstance(result, SyncApplyConflict) and result.reason != "version_conflict":
+            # Older versions were only skipped because the newest one was expected to apply; replay them in order.
+            for pending_item, pending_event in pending:
+                record([(pending_item, pending_event)], await _apply_in_savepoint(db, batch, pending_item))
+            pending = []
+        record([*pending, (item, inbox_event)], result)
+
+    await _finalize_dirty_brackets(db, batch)
+    await db.commit()
+    for tournament_id, (refreshed_matches, refreshed_brackets) in refreshes.items():
+        await invalidate_tournament_read_models(tournament_id)
+        await _broadcast_sync_batch(db, tournament_id, list(refreshed_matches), sorted(refreshed_brackets))
 
     return SyncUpsertsResponse(
-        accepted=accepted,
+        accepted=sorted(accepted),
         duplicates=duplicates,
-        conflicts=conflicts,
+        conflicts=sorted(conflicts, key=lambda entry: entry.seq),
         last_applied_seq=edge_state.last_applied_seq,
     )
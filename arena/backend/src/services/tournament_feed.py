@@ -0,0 +1,106 @@
+from collections import deque
+
+from broadcaster import Broadcast
+from pydantic import BaseModel
+from redis import asyncio as redis
+
+from src.config import DEV_MODE, REDIS_URL, WS_HISTORY_LENGTH
+from src.services.broadcast import broadcast
+
+# Sequence, history and publish happen in one script so the stream order always matches the live order.
+_PUBLISH_SCRIPT = """
+local seq = redis.call('INCR', KEYS[1])
+local message = '{"seq":' .. seq .. ',' .. string.sub(ARGV[1], 2)
+redis.call('XADD', KEYS[2], 'MAXLEN', '~', ARGV[3], seq .. '-0', 'message', message)
+redis.call('PUBLISH', ARGV[2], message)
+return seq
+"""
+
+
+def tournament_channel(tournament_id: int) -> str:
+    return f"tournament:{tournament_id}"
+
+
+def _with_seq(seq: int, payload: str) -> str:
+    return f'{{"seq":{seq},{payload[1:]}'
+
+
+class MemoryTournamentFeed:
+    def __init__(self, source: Broadcast, history_length: int) -> None:
+        self._source = source
+        self._history_length = history_length
+        self._seqs: dict[int, int] = {}
+        self._history: dict[int, deque[tuple[int, str]]] = {}
+
+    async def publish(self, tournament_id: int, payload: str) -> int:
+        seq = self._seqs.get(tournament_id, 0) + 1
+        self._seqs[tournament_id] = seq
+        message = _with_seq(seq, payload)
+        history = self._history.setdefault(tournament_id, deque(maxlen=self._history_length))
+        history.append((seq, message))
+        await self._source.publish(channel=tournament_channel(tournament_id), message=message)
+        return seq
+
+    async def current_seq(self, tournament_id: int) -> int:
+        return self._seqs.get(tournament_id, 0)
+
+    async def history_since(self, tournament_id: int, since: int) -> list[str] | None:
+        current = self._seqs.get(tournament_id, 0)
+        if since > current:
+            return None
+        entries = [item for item in self._history.get(tournament_id, ()) if item[0] > since]
+        if since < current and (not entries or entries[0][0] != since + 1):
+            return None
+        return [message for _, message in entries]
+
+    async def close(self) -> None:
+        return None
+
+
+class RedisTournamentFeed:
+    def __init__(self, url: str, history_length: int) -> None:
+        self._history_length = history_length
+        self._conn = redis.Redis.from_url(url)
+        self._publish = self._conn.register_script(_PUBLISH_SCRIPT)
+
+    @staticmethod
+    def _keys(tournament_id: int) -> tuple[str, str]:
+        channel = tournament_channel(tournament_id)
+        return f"{channel}:seq", f"{channel}:history"
+
+    async def publish(self, tournament_id: int, payload: str) -> int:
+        seq = await self._publish(
+            keys=list(self._keys(tournament_id)),
+            args=[payload, tournament_channel(tournament_id), self._history_length],
+        )
+        return int(seq)
+
+    async def current_seq(self, tournament_id: int) -> int:
+        seq_key, _ = self._keys(tournament_id)
+        return int(await self._conn.get(seq_key) or 0)
+
+    async def history_since(self, tournament_id: int, since: int) -> list[str] | None:
+        current = await self.current_seq(tournament_id)
+        if since > current:
+            return None
+        if since == current:
+            return []
+        _, history_key = self._keys(tournament_id)
+        entries = await self._conn.xrange(history_key, min=f"{since + 1}-0", max="+")
+        if not entries or int(entries[0][0].split(b"-")[0]) != since + 1:
+            return None
+        return [fields[b"message"].decode() for _, fields in entries]
+
+    async def close(self) -> None:
+        await self._conn.aclose()
+
+
+feed: MemoryTournamentFeed | RedisTournamentFeed
+if DEV_MODE:
+    feed = MemoryTournamentFeed(broadcast, WS_HISTORY_LENGTH)
+else:
+    feed = RedisTournamentFeed(REDIS_URL, WS_HISTORY_LENGTH)
+
+
+async def publish_tournament_update(tournament_id: int, update: BaseModel) -> int:
+    return await feed.publish(tournament_id, update.model_dump_json())
@@ -5,6 +5,7 @@ from datetime import UTC, datetime
 from pathlib import Path
 
 from fastapi import HTTPException
+from pydantic import TypeAdapter
 from sqlalchemy import asc, delete, desc, distinct, func, select
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -28,6 +29,7 @@ from src.schemas import (
     ApplicationCreate,
     BracketMatchesFull,
     BracketResponse,
+    ExportJobResponse,
     TimetableEntryCreate,
     TimetableEntryResponse,
     TimetableReplace,
@@ -36,10 +38,15 @@ from src.schemas import (
     TournamentResponse,
     TournamentUpdate,
 )
+from src.services.bracket_projection import render_tournament_bracket_matches
 from src.services.brackets import regenerate_tournament_brackets, reorder_seeds_and_get_next
-from src.services.export_file import generate_pdf
+from src.services.export_file import NO_EXPORT_DATA_DETAIL, build_entries
+from src.services.export_jobs import export_jobs
+from src.services.read_models import invalidate_tournament_read_models
 from src.utils import sanitize_filename
 
+_bracket_responses = TypeAdapter(list[BracketResponse])
+
 
 async def list_tournaments(
     db: AsyncSession,
@@ -157,6 +164,11 @@ async def get_tournament_brackets(db: AsyncSession, tournament_id: int, sorted_b
     return list(result.scalars().all())
 
 
+async def render_tournament_brackets(db: AsyncSession, tournament_id: int, sorted_brackets: bool) -> bytes:
+    brackets = await get_tournament_brackets(db, tournament_id, sorted_brackets)
+    return _bracket_responses.dump_json([BracketResponse.model_validate(bracket) for bracket in brackets])
+
+
 async def get_participant_count_per_coach(db: AsyncSession, tournament_id: int) -> list[dict[str, int | str]]:
     subquery = (
         select(
@@ -231,6 +243,10 @@ async def get_matches_for_tournament_full(db: AsyncSession, tournament_id: int)
     return list(result.scalars().all())
 
 
+async def render_matches_for_tournament_full(db: AsyncSession, tournament_id: int) -> bytes:
+    return await render_tournament_bracket_matches(db, tournament_id)
+
+
 async def get_matches_for_tournament_raw(db: AsyncSession, tournament_id: int) -> list[Bracket]:
     result = await db.execute(
         select(Bracket)
@@ -292,11 +308,16 @@ async def get_tournament_bootstrap_snapshot(db: AsyncSession, tournament_id: int
     )
 
 
+async def render_tournament_bootstrap_snapshot(db: AsyncSession, tournament_id: int) -> bytes:
+    snapshot = await get_tournament_bootstrap_snapshot(db, tournament_id)
+    return snapshot.model_dump_json().encode()
+
+
 async def regenerate_tournament(db: AsyncSession, tournament_id: int) -> None:
     await regenerate_tournament_brackets(db, tournament_id)
 
 
-async def generate_brackets_export_file(db: AsyncSession, tournament_id: int) -> dict[str, str]:
+async def generate_brackets_export_file(db: AsyncSession, tournament_id: int) -> ExportJobResponse:
     tournament = await db.get(Tournament, tournament_id)
     if not tournament:
         raise HTTPException(status_code=404, detail="Tournament not found")
@@ -304,18 +325,30 @@ async def generate_brackets_export_file(db: AsyncSession, tournament_id: int) ->
     tournament_title = tournament.name
     final_filename = f"{sanitize_filename(tournament_title)}.pdf"
     final_path = Path("pdf_storage") / final_filename
+    export_updated_at = tournament.export_last_updated_at
 
     if final_path.exists():
         file_mtime = datetime.fromtimestamp(final_path.stat().st_mtime, UTC)
-        export_updated_at = tournament.export_last_updated_at
         if export_updated_at is not None and file_mtime > export_updated_at:
-            return {"filename": final_path.as_posix()}
+            return ExportJobResponse(tournament_id=tournament_id, status="finished", filename=final_path.as_posix())
 
+    snapshot_at = datetime.now(UTC)
     brackets = await get_matches_for_tournament_raw(db, tournament_id)
-    result = generate_pdf(brackets, tournament_title, start_date=tournament.start_date)
-    if isinstance(result, dict):
-        raise HTTPException(status_code=400, detail=result.get("detail", "Failed to generate"))
-    return {"filename": final_path.as_posix()}
+    entries = build_entries(brackets, tournament_title, start_date=tournament.start_date)
+    if not entries:
+        raise HTTPException(status_code=400, detail=NO_EXPORT_DATA_DETAIL)
+
+    version = export_updated_at.isoformat() if export_updated_at is not None else "initial"
+    return await export_jobs.submit(
+        f"{tournament_id}:{version}", tournament_id, tournament_title, final_path.as_posix(), entries, snapshot_at
+    )
+
+
+async def get_export_job(tournament_id: int, job_id: str) -> ExportJobResponse:
+    job = await export_jobs.store.get(job_id)
+    if job is None or job.tournament_id != tournament_id:
+        raise HTTPException(status_code=404, detail="Export job not found")
+    return job
 
 
 async def update_tournament_status(db: AsyncSession, tournament_id: int, status: str) -> Tournament:
@@ -440,6 +473,7 @@ async def approve_application(db: AsyncSession, tournament_id: int, application_
 
     try:
         await db.commit()
+        await invalidate_tournament_read_models(tournament_id)
         return bracket.id
     except Exception:
         await db.rollback()
@@ -503,6 +537,7 @@ async def approve_all_applications(db: AsyncSession, tournament_id: int) -> tupl
 
     try:
         await db.commit()
+        await invalidate_tournament_read_models(tournament_id)
         return len(applications), updated_bracket_ids
     except Exception:
         await db.rollback()
@@ -540,6 +575,8 @@ async def remove_competitor(db: AsyncSession, participant_id: int) -> int | None
                 await db.delete(app)
 
         await db.commit()
+        if tournament_id:
+            await invalidate_tournament_read_models(tournament_id)
         return bracket_id
     except Exception:
         await db.rollback()
@@ -632,6 +669,7 @@ async def replace_timetable_entries(
     ]
     db.add_all(entries)
     await db.commit()
+    await invalidate_tournament_read_models(tournament_id)
     result = await db.execute(
         select(TimetableEntry)
         .where(TimetableEntry.tournament_id == tournament_id)
@@ -0,0 +1,176 @@
+import asyncio
+import json
+import logging
+from collections import OrderedDict
+from collections.abc import AsyncIterator, Hashable
+from contextlib import asynccontextmanager, suppress
+from typing import Any
+
+from broadcaster import Broadcast
+
+from src.config import WS_CLIENT_QUEUE_SIZE
+from src.services.broadcast import broadcast
+
+logger = logging.getLogger(__name__)
+
+
+def _message_meta(message: str) -> tuple[str | None, int | None]:
+    try:
+        data = json.loads(message)
+    except ValueError:
+        return None, None
+    if not isinstance(data, dict):
+        return None, None
+    seq = data.get("seq")
+    key = None
+    if data.get("type") is None and data.get("match_id") is not None:
+        key = f"match:{data['match_id']}"
+    return key, seq if isinstance(seq, int) else None
+
+
+class HubClient:
+    def __init__(self, max_queue: int) -> None:
+        self._max_queue = max_queue
+        self._pending: OrderedDict[Hashable, tuple[int | None, str]] = OrderedDict()
+        self._ready = asyncio.Event()
+        self.closed = False
+        self.overflowed = False
+        self.coalesced = 0
+        self.resume_after = 0
+
+    @property
+    def depth(self) -> int:
+        return len(self._pending)
+
+    def offer(self, key: str | None, seq: int | None, message: str) -> None:
+        if self.closed or (seq is not None and seq <= self.resume_after):
+            return
+        if key is not None and key in self._pending:
+            self._pending[key] = (seq, message)
+            self._pending.move_to_end(key)
+            self.coalesced += 1
+            return
+        if len(self._pending) >= self._max_queue:
+            self.overflowed = True
+            self.close()
+            return
+        self._pending[key if key is not None else object()] = (seq, message)
+        self._ready.set()
+
+    def resume_from(self, seq: int) -> None:
+        self.resume_after = seq
+        for key, (queued_seq, _) in list(self._pending.items()):
+            if queued_seq is not None and queued_seq <= seq:
+                del self._pending[key]
+
+    def close(self) -> None:
+        self.closed = True
+        self._ready.set()
+
+    async def receive(self) -> str | None:
+        while not self._pending:
+            if self.closed:
+                return None
+            self._ready.clear()
+            await self._ready.wait()
+        if self.overflowed:
+            return None
+        return self._pending.popitem(last=False)[1][1]
+
+
+class _Channel:
+    def __init__(self) -> None:
+        self.clients: set[HubClient] = set()
+        self.task: asyncio.Task[None] | None = None
+        self.ready = asyncio.Event()
+        self.delivered = 0
+
+
+class WebSocketHub:
+    def __init__(self, source: Broadcast, max_queue: int) -> None:
+        self._source = source
+        self._max_queue = max_queue
+        self._channels: dict[str, _Channel] = {}
+        self._disconnected_slow = 0
+
+    @asynccontextmanager
+    async def connect(self, channel: str) -> AsyncIterator[HubClient]:
+        client = HubClient(self._max_queue)
+        state = self._channels.get(channel)
+        if state is None:
+            state = _Channel()
+            self._channels[channel] = state
+            state.task = asyncio.create_task(self._pump(channel, state))
+        state.clients.add(client)
+        try:
+            await state.ready.wait()
+            yield client
+        finally:
+            client.close()
+            if client.overflowed:
+                self._disconnected_slow += 1
+            state.clients.discard(client)
+            if not state.clients and self._channels.get(channel) is state:
+                del self._channels[channel]
+                if state.task is not None:
+                    state.task.cancel()
+                    with suppress(asyncio.CancelledError):
+                        await state.task
+
+    async def _pump(self, channel: str, state: _Channel) -> None:
+        try:
+            async with self._source.subscribe(channel=channel) as subscriber:
+                state.ready.set()
+                async for event in subscriber:  # type: ignore
+                    if event is None:
+                        continue
+                    self._fan_out(state, event.message)
+        except asyncio.CancelledError:
+            raise
+        except Exception:
+            logger.exception("WebSocket hub subscription for %s failed", channel)
+            state.ready.set()
+            if self._channels.get(channel) is state:
+                del self._channels[channel]
+            for client in state.clients:
+                client.close()
+
+    def _fan_out(self, state: _Channel, message: str) -> None:
+        key, seq = _message_meta(message)
+        state.delivered += 1
+        for client in state.clients:
+            client.offer(key, seq, message)
+
+    async def close(self) -> None:
+        channels = list(self._channels.values())
+        self._channels.clear()
+        for state in channels:
+            for client in state.clients:
+                client.close()
+            if state.task is not None:
+                state.task.cancel()
+                with suppress(asyncio.CancelledError):
+                    await state.task
+
+    def stats(self) -> dict[str, Any]:
+        channels = {
+            channel: {
+                "connections": len(state.clients),
+                "delivered": state.delivered,
+                "max_queue_depth": max((client.depth for client in state.clients), default=0),
+                "queued": sum(client.depth for client in state.clients),
+                "coalesced": sum(client.coalesced for client in state.clients),
+            }
+            for channel, state in self._channels.items()
+        }
+        return {
+            "channels": len(channels),
+            "connections": sum(item["connections"] for item in channels.values()),
+            "max_queue_depth": max((item["max_queue_depth"] for item in channels.values()), default=0),
+            "slow_disconnects": self._disconnected_slow,
+            "queue_limit": self._max_queue,
+            "by_channel": channels,
+        }
+
+
+hub = WebSocketHub(broadcast, WS_CLIENT_QUEUE_SIZE)
@@ -0,0 +1,72 @@
+from datetime import date
+
+import pytest
+from httpx import AsyncClient
+from pydantic import TypeAdapter
+
+from src.models import Athlete, AthleteCoachLink, BracketParticipant, Coach
+from src.schemas import BracketMatchesFull, BracketMatchResponse
+from src.services.bracket_projection import render_bracket_matches, render_tournament_bracket_matches
+from src.services.brackets import get_bracket_matches
+from src.services.tournaments import get_matches_for_tournament_full
+
+
+@pytest.mark.asyncio
+async def test_projection_matches_pydantic_serialization(client: AsyncClient, db_session) -> None:
+    category_response = await client.post(
+        "/categories",
+        json={"name": "U12 Kata", "min_age": 8, "max_age": 12, "gender": "female"},
+    )
+    tournament_response = await client.post(
+        "/tournaments",
+        json={
+            "name": "Projection Cup",
+            "location": "Dnipro",
+            "start_date": date(2025, 8, 1).isoformat(),
+            "end_date": date(2025, 8, 2).isoformat(),
+            "registration_start_date": date(2025, 7, 1).isoformat(),
+            "registration_end_date": date(2025, 7, 30).isoformat(),
+            "image_url": None,
+        },
+    )
+    tournament_id = tournament_response.json()["id"]
+    bracket_response = await client.post(
+        "/brackets/create",
+        json={"tournament_id": tournament_id, "category_id": category_response.json()["id"], "group_id": 2},
+    )
+    bracket_id = bracket_response.json()["id"]
+
+    coaches = [Coach(first_name="A", last_name="Shevchenko"), Coach(first_name="B", last_name="Bondar")]
+    athletes = [
+        Athlete(first_name=f"P{i}", last_name=f"Q{i}", gender="female", birth_date=date(2015, 1, 1)) for i in range(5)
+    ]
+    db_session.add_all([*coaches, *athletes])
+    await db_session.flush()
+    db_session.add_all(
+        AthleteCoachLink(athlete_id=athlete.id, coach_id=coach.id) for athlete in athletes[:2] for coach in coaches
+    )
+    db_session.add_all(
+        BracketParticipant(bracket_id=bracket_id, athlete_id=athlete.id, seed=index)
+        for index, athlete in enumerate(athletes, start=1)
+    )
+    await db_session.commit()
+    assert (await client.post(f"/brackets/{bracket_id}/regenerate")).status_code == 200
+
+    matches = (await client.get(f"/brackets/{bracket_id}/matches")).json()
+    playable = next(bm for bm in matches if bm["match"]["athlete1"] and bm["match"]["athlete2"])
+    assert (await client.post(f"/matches/{playable['match']['id']}/start")).status_code == 200
+    db_session.expire_all()
+
+    expected_matches = TypeAdapter(list[BracketMatchResponse]).dump_json(
+        [BracketMatchResponse.model_validate(bm) for bm in await get_bracket_matches(db_session, bracket_id)]
+    )
+    assert await render_bracket_matches(db_session, bracket_id) == expected_matches
+
+    expected_full = []
+    for bracket in await get_matches_for_tournament_full(db_session, tournament_id):
+        full = BracketMatchesFull.model_validate(bracket)
+        full.matches.sort(key=lambda bm: (bm.round_number, bm.position))
+        expected_full.append(full)
+    assert await render_tournament_bracket_matches(db_session, tournament_id) == TypeAdapter(
+        list[BracketMatchesFull]
+    ).dump_json(expected_full)
@@ -0,0 +1,106 @@
+from datetime import date
+
+import pytest
+from httpx import AsyncClient
+from sqlalchemy import func, select
+
+from src.models import Athlete, Bracket, BracketMatch, BracketParticipant, BracketState
+
+
+async def _create_tournament(client: AsyncClient) -> tuple[int, int]:
+    category_response = await client.post(
+        "/categories",
+        json={"name": "U16 Kata", "min_age": 12, "max_age": 16, "gender": "male"},
+    )
+    assert category_response.status_code == 200
+
+    tournament_response = await client.post(
+        "/tournaments",
+        json={
+            "name": "Regeneration Cup",
+            "location": "Lviv",
+            "start_date": date(2025, 6, 10).isoformat(),
+            "end_date": date(2025, 6, 11).isoformat(),
+            "registration_start_date": date(2025, 5, 1).isoformat(),
+            "registration_end_date": date(2025, 5, 31).isoformat(),
+            "image_url": None,
+        },
+    )
+    assert tournament_response.status_code == 200
+    return tournament_response.json()["id"], category_response.json()["id"]
+
+
+async def _create_bracket(
+    client: AsyncClient, db_session, tournament_id: int, category_id: int, bracket_type: str, size: int
+) -> int:
+    bracket_response = await client.post(
+        "/brackets/create",
+        json={"tournament_id": tournament_id, "category_id": category_id, "group_id": 1, "type": bracket_type},
+    )
+    assert bracket_response.status_code == 200
+    bracket_id = bracket_response.json()["id"]
+
+    athletes = [
+        Athlete(first_name=f"R{i}", last_name=f"L{i}", gender="male", birth_date=date(2011, 1, 1))
+        for i in range(1, size + 1)
+    ]
+    db_session.add_all(athletes)
+    await db_session.flush()
+    db_session.add_all(
+        BracketParticipant(bracket_id=bracket_id, athlete_id=athlete.id, seed=index)
+        for index, athlete in enumerate(athletes, start=1)
+    )
+    await db_session.commit()
+    return bracket_id
+
+
+@pytest.mark.asyncio
+async def test_tournament_regeneration_materializes_every_bracket(client: AsyncClient, db_session) -> None:
+    tournament_id, category_id = await _create_tournament(client)
+    elimination_id = await _create_bracket(client, db_session, tournament_id, category_id, "single_elimination", 5)
+    round_robin_id = await _create_bracket(client, db_session, tournament_id, category_id, "round_robin", 4)
+
+    for _ in range(2):
+        response = await client.post(f"/tournaments/{tournament_id}/regenerate")
+        assert response.status_code == 200
+
+    counts = dict(
+        (
+            await db_session.execute(
+                select(BracketMatch.bracket_id, func.count())
+                .where(BracketMatch.bracket_id.in_([elimination_id, round_robin_id]))
+                .group_by(BracketMatch.bracket_id)
+            )
+        ).all()
+    )
+    assert counts == {elimination_id: 7, round_robin_id: 6}
+
+    matches_response = await client.get(f"/brackets/{elimination_id}/matches")
+    assert matches_response.status_code == 200
+    finished = [bm for bm in matches_response.json() if bm["match"]["status"] == "finished"]
+    assert len(finished) == 3
+    assert all(bm["match"]["winner"] is not None for bm in finished)
+
+
+@pytest.mark.asyncio
+async def test_tournament_regeneration_rejects_running_bracket(client: AsyncClient, db_session) -> None:
+    tournament_id, category_id = await _create_tournament(client)
+    draft_id = await _create_bracket(client, db_session, tournament_id, category_id, "single_elimination", 4)
+    running_id = await _create_bracket(client, db_session, tournament_id, category_id, "single_elimination", 4)
+
+    response = await client.post(f"/tournaments/{tournament_id}/regenerate")
+    assert response.status_code == 200
+
+    running = await db_session.get(Bracket, running_id)
+    running.state = BracketState.RUNNING.value
+    await db_session.commit()
+
+    response = await client.post(f"/tournaments/{tournament_id}/regenerate")
+    assert response.status_code == 409
+
+    versions = dict(
+        (
+            await db_session.execute(select(Bracket.id, Bracket.version).where(Bracket.id.in_([draft_id, running_id])))
+        ).all()
+    )
+    assert versions[running_id] == versions[draft_id]
@@ -0,0 +1,41 @@
+from datetime import UTC, datetime, timedelta
+
+import pytest
+
+from src.schemas import ExportJobResponse
+from src.services.export_jobs import STALE_EXPORT_DETAIL, MemoryExportJobStore
+
+
+def _job(job_id: str, status: str = "queued", age_seconds: int = 0) -> ExportJobResponse:
+    return ExportJobResponse(
+        job_id=job_id,
+        tournament_id=7,
+        status=status,
+        updated_at=datetime.now(UTC) - timedelta(seconds=age_seconds),
+    )
+
+
+@pytest.mark.asyncio
+async def test_export_job_claims_deduplicate_until_failure() -> None:
+    store = MemoryExportJobStore()
+
+    assert (await store.claim("7:initial", _job("first"))).job_id == "first"
+    assert await store.get("first") is not None
+    await store.save(_job("first", status="running"))
+    assert (await store.claim("7:initial", _job("second"))).job_id == "first"
+    assert (await store.claim("7:2025-06-01T00:00:00+00:00", _job("third"))).job_id == "third"
+
+    await store.save(ExportJobResponse(job_id="first", tournament_id=7, status="failed", detail="Failed to generate"))
+    assert (await store.claim("7:initial", _job("fourth"))).job_id == "fourth"
+
+
+@pytest.mark.asyncio
+async def test_export_job_without_heartbeat_is_reported_failed_and_reclaimed() -> None:
+    store = MemoryExportJobStore()
+    await store.claim("7:initial", _job("abandoned", status="running", age_seconds=3600))
+
+    abandoned = await store.get("abandoned")
+    assert abandoned is not None
+    assert abandoned.status == "failed"
+    assert abandoned.detail == STALE_EXPORT_DETAIL
+    assert (await store.claim("7:initial", _job("retry"))).job_id == "retry"
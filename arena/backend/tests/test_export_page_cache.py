@@ -0,0 +1,114 @@
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import UTC, datetime, timedelta
+from io import BytesIO
+from pathlib import Path
+
+import pytest
+from pypdf import PdfReader, PdfWriter
+
+from src.services import export_file
+from src.services.export_file import CompiledSvgTemplate, _page_cache_path
+
+
+def _entries(version: str, start_time_tatami: str) -> list[dict[str, str]]:
+    return [
+        {
+            "tournament_name": "Cup",
+            "category": "U12 Kata",
+            "start_time_tatami": start_time_tatami,
+            "_template": "elimination",
+            "_bracket_id": "42",
+            "_bracket_version": version,
+        }
+    ]
+
+
+def test_page_cache_path_tracks_version_timetable_and_template() -> None:
+    base = _page_cache_path(_entries("3", "Day: 1 | Tatami: 2"), "template-a")
+
+    assert base == _page_cache_path(_entries("3", "Day: 1 | Tatami: 2"), "template-a")
+    assert "/pages/42/3-" in base
+    assert _page_cache_path(_entries("4", "Day: 1 | Tatami: 2"), "template-a") != base
+    assert _page_cache_path(_entries("3", "Day: 2 | Tatami: 1"), "template-a") != base
+    assert _page_cache_path(_entries("3", "Day: 1 | Tatami: 2"), "template-b") != base
+
+
+def test_compiled_template_fills_placeholders_and_multiline_athletes() -> None:
+    source = '<svg><text x="10" y="5">{{ athlete1 }}</text><text>{{athlete2}}</text><text>{{ category }}</text></svg>'
+    template = CompiledSvgTemplate(source, multiline_athletes=True)
+
+    rendered = template.render({"athlete1": "Ivanov I.\n(Petrov & Co)", "athlete2": "Sidorov S.", "category": "U12"})
+
+    assert rendered == (
+        '<svg><text x="10" y="5">Ivanov I.<tspan x="10" dy="13">(Petrov &amp; Co)</tspan></text>'
+        "<text>Sidorov S.</text><text>U12</text></svg>"
+    )
+    assert CompiledSvgTemplate(source).render({"athlete1": "A\nB"}) == (
+        '<svg><text x="10" y="5">A\nB</text><text></text><text></text></svg>'
+    )
+
+
+def _blank_page(entry: dict[str, str]) -> bytes:
+    writer = PdfWriter()
+    writer.add_blank_page(width=100 + int(entry["category"]), height=100)
+    buffer = BytesIO()
+    writer.write(buffer)
+    return buffer.getvalue()
+
+
+def test_parallel_render_keeps_entry_order(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    export_file.preload_svg_templates()
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(export_file, "render_page_pdf", _blank_page)
+    entries = [
+        {"category": str(index), "_template": "elimination", "_bracket_id": str(index // 3), "_bracket_version": "1"}
+        for index in range(10)
+    ]
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        final_path = export_file.render_entries_pdf(entries, "Cup", executor)
+
+    widths = [int(page.mediabox.width) for page in PdfReader(final_path).pages]
+    assert widths == [100 + index for index in range(10)]
+
+
+def test_page_cache_prunes_only_long_unused_versions(tmp_path: Path) -> None:
+    bracket_dir = tmp_path / "42"
+    bracket_dir.mkdir()
+    in_use = bracket_dir / "2-in-use.pdf"
+    abandoned = bracket_dir / "1-abandoned.pdf"
+    current = bracket_dir / "3-current.pdf"
+    for path in (in_use, abandoned, current):
+        path.write_bytes(b"%PDF")
+    expired = time.time() - export_file.PAGE_CACHE_MAX_AGE_SECONDS - 60
+    os.utime(abandoned, (expired, expired))
+
+    export_file._prune_stale_pages(str(bracket_dir), str(current))
+
+    assert sorted(path.name for path in bracket_dir.iterdir()) == ["2-in-use.pdf", "3-current.pdf"]
+
+
+def test_render_recovers_when_reused_page_file_disappears(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    export_file.preload_svg_templates()
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(export_file, "render_page_pdf", _blank_page)
+    monkeypatch.setattr(export_file, "_reuse_cached_pages", lambda cache_path: True)
+    entries = [{"category": "1", "_template": "elimination", "_bracket_id": "7", "_bracket_version": "1"}]
+
+    final_path = export_file.render_entries_pdf(entries, "Cup")
+
+    assert [int(page.mediabox.width) for page in PdfReader(final_path).pages] == [101]
+
+
+def test_export_file_is_dated_by_its_snapshot(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    export_file.preload_svg_templates()
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(export_file, "render_page_pdf", _blank_page)
+    entries = [{"category": "1", "_template": "elimination", "_bracket_id": "7", "_bracket_version": "1"}]
+    snapshot_at = datetime.now(UTC) - timedelta(minutes=5)
+
+    final_path = export_file.render_entries_pdf(entries, "Cup", snapshot_at=snapshot_at)
+
+    assert os.stat(final_path).st_mtime == pytest.approx(snapshot_at.timestamp())
@@ -0,0 +1,93 @@
+import json
+from datetime import date
+
+import pytest
+from fastapi import HTTPException
+from httpx import AsyncClient
+from sqlalchemy import func, select
+
+from src.models import Athlete, AthleteCoachLink, BracketParticipant, Coach
+from src.services.import_competitors import parse_cbr_competitors
+
+
+def _cbr(*competitors: dict[str, object]) -> bytes:
+    return json.dumps({"Competitors": list(competitors)}).encode()
+
+
+def test_parse_cbr_competitors_reads_each_row_once() -> None:
+    competitors = parse_cbr_competitors(
+        _cbr(
+            {"Name": "Anna", "Surname": "Koval", "Coach": "Petrov", "Category": "U12 Kata", "SortId": 2},
+            {"Name": None, "Surname": "Bondar", "Coach": "Petrov", "Category": "U12 Kata", "SortId": 1},
+        )
+    )
+
+    assert [(c.athlete_key, c.coach, c.category, c.seed) for c in competitors] == [
+        (("Anna", "Koval"), "Petrov", "U12 Kata", 2),
+        (("", "Bondar"), "Petrov", "U12 Kata", 1),
+    ]
+
+
+@pytest.mark.parametrize("content", [b"not json", b'{"Competitors": [{"Name": "Anna"}]}', b"[]"])
+def test_parse_cbr_competitors_rejects_malformed_files(content: bytes) -> None:
+    with pytest.raises(HTTPException) as exc_info:
+        parse_cbr_competitors(content)
+
+    assert exc_info.value.status_code == 400
+
+
+@pytest.mark.asyncio
+async def test_import_reuses_existing_rows_and_reports_counts(client: AsyncClient, db_session) -> None:
+    tournament_response = await client.post(
+        "/tournaments",
+        json={
+            "name": "Import Cup",
+            "location": "Kyiv",
+            "start_date": date(2025, 5, 10).isoformat(),
+            "end_date": date(2025, 5, 11).isoformat(),
+            "registration_start_date": date(2025, 4, 1).isoformat(),
+            "registration_end_date": date(2025, 4, 30).isoformat(),
+            "image_url": None,
+        },
+    )
+    tournament_id = tournament_response.json()["id"]
+
+    db_session.add_all(
+        [Coach(first_name="", last_name="Petrov"), Athlete(first_name="Anna", last_name="Koval", gender="female")]
+    )
+    await db_session.flush()
+
+    content = _cbr(
+        {"Name": "Anna", "Surname": "Koval", "Coach": "Petrov", "Category": "U12 Kata", "SortId": 1},
+        {"Name": "Olha", "Surname": "Bondar", "Coach": "Sydorenko", "Category": "U12 Kata", "SortId": 2},
+        {"Name": "Olha", "Surname": "Bondar", "Coach": "Sydorenko", "Category": "U14 Kumite", "SortId": 1},
+    )
+    response = await client.post(
+        f"/tournaments/{tournament_id}/import", files={"file": ("competitors.cbr", content, "application/json")}
+    )
+
+    assert response.status_code == 200
+    summary = response.json()
+    assert summary["status"] == "success"
+    assert {key: summary[key] for key in summary if key not in ("status", "message", "timings_ms")} == {
+        "competitors": 3,
+        "coaches_created": 1,
+        "categories_created": 2,
+        "athletes_created": 1,
+        "coach_links_created": 1,
+        "brackets_created": 2,
+        "participants_created": 3,
+    }
+    assert set(summary["timings_ms"]) == {"parse", "clear", "resolve", "brackets", "regenerate"}
+
+    assert await db_session.scalar(select(func.count(Athlete.id))) == 2
+    assert await db_session.scalar(select(func.count(AthleteCoachLink.id))) == 1
+    assert await db_session.scalar(select(func.count(BracketParticipant.id))) == 3
+
+    repeat = await client.post(
+        f"/tournaments/{tournament_id}/import", files={"file": ("competitors.cbr", content, "application/json")}
+    )
+    assert repeat.status_code == 200
+    assert repeat.json()["brackets_created"] == 0
+    assert repeat.json()["athletes_created"] == 0
+    assert await db_session.scalar(select(func.count(BracketParticipant.id))) == 3
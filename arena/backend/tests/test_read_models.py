@@ -0,0 +1,111 @@
+from datetime import date
+
+import pytest
+from httpx import AsyncClient
+
+from src.models import BracketParticipant
+
+
+@pytest.mark.asyncio
+async def test_tournament_read_models_honor_etag_until_written(client: AsyncClient) -> None:
+    category_response = await client.post(
+        "/categories",
+        json={"name": "U14 Kumite", "min_age": 10, "max_age": 14, "gender": "male"},
+    )
+    assert category_response.status_code == 200
+    tournament_response = await client.post(
+        "/tournaments",
+        json={
+            "name": "Cache Cup",
+            "location": "Odesa",
+            "start_date": date(2025, 7, 1).isoformat(),
+            "end_date": date(2025, 7, 2).isoformat(),
+            "registration_start_date": date(2025, 6, 1).isoformat(),
+            "registration_end_date": date(2025, 6, 30).isoformat(),
+            "image_url": None,
+        },
+    )
+    assert tournament_response.status_code == 200
+    tournament_id = tournament_response.json()["id"]
+
+    first = await client.get(f"/tournaments/{tournament_id}/brackets")
+    assert first.status_code == 200
+    assert first.json() == []
+    etag = first.headers["etag"]
+
+    cached = await client.get(f"/tournaments/{tournament_id}/brackets", headers={"If-None-Match": etag})
+    assert cached.status_code == 304
+
+    bracket_response = await client.post(
+        "/brackets/create",
+        json={
+            "tournament_id": tournament_id,
+            "category_id": category_response.json()["id"],
+            "group_id": 1,
+            "type": "round_robin",
+        },
+    )
+    assert bracket_response.status_code == 200
+
+    refreshed = await client.get(f"/tournaments/{tournament_id}/brackets", headers={"If-None-Match": etag})
+    assert refreshed.status_code == 200
+    assert refreshed.headers["etag"] != etag
+    assert [bracket["id"] for bracket in refreshed.json()] == [bracket_response.json()["id"]]
+
+    matches_full = await client.get(f"/tournaments/{tournament_id}/matches_full")
+    assert matches_full.status_code == 200
+    assert matches_full.headers["etag"] != refreshed.headers["etag"]
+
+
+@pytest.mark.asyncio
+async def test_athlete_edit_refreshes_tournament_read_models(client: AsyncClient, db_session) -> None:
+    category_response = await client.post(
+        "/categories",
+        json={"name": "U12 Kata", "min_age": 8, "max_age": 12, "gender": "female"},
+    )
+    tournament_response = await client.post(
+        "/tournaments",
+        json={
+            "name": "Rename Cup",
+            "location": "Lviv",
+            "start_date": date(2025, 8, 1).isoformat(),
+            "end_date": date(2025, 8, 2).isoformat(),
+            "registration_start_date": date(2025, 7, 1).isoformat(),
+            "registration_end_date": date(2025, 7, 30).isoformat(),
+            "image_url": None,
+        },
+    )
+    tournament_id = tournament_response.json()["id"]
+    bracket_response = await client.post(
+        "/brackets/create",
+        json={
+            "tournament_id": tournament_id,
+            "category_id": category_response.json()["id"],
+            "group_id": 1,
+            "type": "round_robin",
+        },
+    )
+    athlete_response = await client.post(
+        "/athletes",
+        json={"first_name": "Anna", "last_name": "Koval", "gender": "female", "coaches_id": []},
+    )
+    athlete_id = athlete_response.json()["id"]
+    db_session.add(BracketParticipant(bracket_id=bracket_response.json()["id"], athlete_id=athlete_id, seed=1))
+    await db_session.commit()
+
+    first = await client.get(f"/tournaments/{tournament_id}/brackets")
+    assert first.status_code == 200
+    etag = first.headers["etag"]
+    assert (
+        await client.get(f"/tournaments/{tournament_id}/brackets", headers={"If-None-Match": etag})
+    ).status_code == 304
+
+    update_response = await client.put(
+        f"/athletes/{athlete_id}", json={"first_name": "Anna", "last_name": "Kovalenko", "coaches_id": []}
+    )
+    assert update_response.status_code == 200
+
+    refreshed = await client.get(f"/tournaments/{tournament_id}/brackets", headers={"If-None-Match": etag})
+    assert refreshed.status_code == 200
+    assert refreshed.headers["etag"] != etag
+    assert refreshed.json()[0]["participants"][0]["last_name"] == "Kovalenko"
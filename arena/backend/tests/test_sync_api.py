@@ -5,7 +5,19 @@ import pytest
 from httpx import AsyncClient
 from sqlalchemy import func, select
 
-from src.models import Athlete, Bracket, BracketMatch, BracketState, BracketStatus, Category, Match, Tournament
+from src.models import (
+    Athlete,
+    Bracket,
+    BracketMatch,
+    BracketState,
+    BracketStatus,
+    Category,
+    Match,
+    SyncInboxEvent,
+    Tournament,
+)
+from src.schemas import MatchBatchUpdate
+from src.services import sync
 
 
 async def _seed_match(db_session):
@@ -239,3 +251,422 @@ async def test_sync_commands_apply_bracket_structure_rebuilt_event(client: Async
 
     rebuilt_match = await db_session.get(Match, uuid.UUID(rebuilt_match_id))
     assert rebuilt_match is not None
+
+
+@pytest.mark.asyncio
+async def test_sync_upserts_batch_isolates_conflicts(client: AsyncClient, db_session) -> None:
+    _, match_id = await _seed_match(db_session)
+    match = await db_session.get(Match, match_id)
+    athlete1_id, athlete2_id = match.athlete1_id, match.athlete2_id
+
+    def _item(seq: int, event_id: str, payload: dict) -> dict:
+        return {
+            "event_id": event_id,
+            "seq": seq,
+            "type": "match.upsert",
+            "aggregate_id": str(match_id),
+            "aggregate_version": 1,
+            "occurred_at": datetime.now(UTC).isoformat(),
+            "payload": payload,
+        }
+
+    started_event_id = str(uuid.uuid4())
+    response = await client.post(
+        "/sync/upserts",
+        json={
+            "edge_id": "edge-batch",
+            "tournament_id": 1,
+            "items": [
+                _item(
+                    1,
+                    started_event_id,
+                    {"athlete1_id": athlete1_id, "athlete2_id": athlete2_id, "status": "started"},
+                ),
+                _item(
+                    2,
+                    str(uuid.uuid4()),
+                    {"athlete1_id": athlete2_id, "athlete2_id": 999999, "status": "finished"},
+                ),
+                _item(
+                    3,
+                    started_event_id,
+                    {"athlete1_id": athlete1_id, "athlete2_id": athlete2_id, "status": "started"},
+                ),
+            ],
+        },
+    )
+    assert response.status_code == 200
+    payload = response.json()
+    assert payload["accepted"] == [1]
+    assert payload["duplicates"] == [3]
+    assert [(conflict["seq"], conflict["reason"]) for conflict in payload["conflicts"]] == [(2, "aggregate_not_found")]
+    assert payload["last_applied_seq"] == 2
+
+    db_session.expire_all()
+    stored = await db_session.get(Match, match_id)
+    assert stored.status == "started"
+    assert stored.athlete1_id == athlete1_id
+
+
+@pytest.mark.asyncio
+async def test_sync_upserts_coalesce_superseded_match_items(client: AsyncClient, db_session) -> None:
+    bracket_id, match_id = await _seed_match(db_session)
+    match = await db_session.get(Match, match_id)
+    athlete1_id, athlete2_id = match.athlete1_id, match.athlete2_id
+
+    items = [
+        {
+            "event_id": str(uuid.uuid4()),
+            "seq": seq,
+            "type": "match.upsert",
+            "aggregate_id": str(match_id),
+            "aggregate_version": seq,
+            "occurred_at": datetime.now(UTC).isoformat(),
+            "payload": {
+                "athlete1_id": athlete1_id,
+                "athlete2_id": athlete2_id,
+                "score_athlete1": seq,
+                "score_athlete2": 0,
+                "status": "started",
+            },
+        }
+        for seq in range(1, 6)
+    ]
+    response = await client.post("/sync/upserts", json={"edge_id": "edge-coalesce", "tournament_id": 1, "items": items})
+    assert response.status_code == 200
+    payload = response.json()
+    assert payload["accepted"] == [1, 2, 3, 4, 5]
+    assert payload["conflicts"] == []
+
+    db_session.expire_all()
+    stored = await db_session.get(Match, match_id)
+    assert stored.score_athlete1 == 5
+    bracket = await db_session.get(Bracket, bracket_id)
+    assert bracket.status == "started"
+    assert bracket.version == 5
+    inbox_count = await db_session.scalar(
+        select(func.count())
+        .select_from(SyncInboxEvent)
+        .where(SyncInboxEvent.edge_id == "edge-coalesce", SyncInboxEvent.applied.is_(True))
+    )
+    assert inbox_count == 5
+
+    replay = await client.post("/sync/upserts", json={"edge_id": "edge-coalesce", "tournament_id": 1, "items": items})
+    assert replay.json()["duplicates"] == [1, 2, 3, 4, 5]
+
+
+@pytest.mark.asyncio
+async def test_sync_upserts_replay_superseded_items_when_newest_payload_is_invalid(
+    client: AsyncClient, db_session
+) -> None:
+    bracket_id, match_id = await _seed_match(db_session)
+    match = await db_session.get(Match, match_id)
+    athlete1_id, athlete2_id = match.athlete1_id, match.athlete2_id
+
+    def _item(seq: int, payload: dict) -> dict:
+        return {
+            "event_id": str(uuid.uuid4()),
+            "seq": seq,
+            "type": "match.upsert",
+            "aggregate_id": str(match_id),
+            "aggregate_version": seq,
+            "occurred_at": datetime.now(UTC).isoformat(),
+            "payload": payload,
+        }
+
+    scored = {"athlete1_id": athlete1_id, "athlete2_id": athlete2_id, "score_athlete2": 0, "status": "started"}
+    response = await client.post(
+        "/sync/upserts",
+        json={
+            "edge_id": "edge-replay",
+            "tournament_id": 1,
+            "items": [
+                _item(1, {**scored, "score_athlete1": 1}),
+                _item(2, {**scored, "score_athlete1": 2}),
+                _item(3, {"athlete1_id": athlete1_id, "athlete2_id": athlete2_id, "score_athlete1": 3}),
+            ],
+        },
+    )
+    assert response.status_code == 200
+    payload = response.json()
+    assert payload["accepted"] == [1, 2]
+    assert [(conflict["seq"], conflict["reason"]) for conflict in payload["conflicts"]] == [(3, "invalid_payload")]
+
+    db_session.expire_all()
+    stored = await db_session.get(Match, match_id)
+    assert stored.score_athlete1 == 2
+    bracket = await db_session.get(Bracket, bracket_id)
+    assert bracket.version == 2
+
+
+@pytest.mark.asyncio
+async def test_sync_upserts_report_older_version_after_newer_item(client: AsyncClient, db_session) -> None:
+    bracket_id, match_id = await _seed_match(db_session)
+    match = await db_session.get(Match, match_id)
+    athlete1_id, athlete2_id = match.athlete1_id, match.athlete2_id
+
+    def _item(seq: int, version: int) -> dict:
+        return {
+            "event_id": str(uuid.uuid4()),
+            "seq": seq,
+            "type": "match.upsert",
+            "aggregate_id": str(match_id),
+            "aggregate_version": version,
+            "occurred_at": datetime.now(UTC).isoformat(),
+            "payload": {
+                "athlete1_id": athlete1_id,
+                "athlete2_id": athlete2_id,
+                "score_athlete1": version,
+                "score_athlete2": 0,
+                "status": "started",
+            },
+        }
+
+    response = await client.post(
+        "/sync/upserts",
+        json={"edge_id": "edge-decreasing", "tournament_id": 1, "items": [_item(1, 5), _item(2, 4)]},
+    )
+    assert response.status_code == 200
+    payload = response.json()
+    assert payload["accepted"] == [1]
+    assert [(conflict["seq"], conflict["reason"]) for conflict in payload["conflicts"]] == [(2, "version_conflict")]
+    assert payload["last_applied_seq"] == 2
+
+    db_session.expire_all()
+    stored = await db_session.get(Match, match_id)
+    assert stored.score_athlete1 == 5
+    bracket = await db_session.get(Bracket, bracket_id)
+    assert bracket.version == 5
+
+
+@pytest.mark.asyncio
+async def test_sync_upserts_do_not_coalesce_across_bracket_upsert(client: AsyncClient, db_session) -> None:
+    bracket_id, match_id = await _seed_match(db_session)
+    match = await db_session.get(Match, match_id)
+    athlete1_id, athlete2_id = match.athlete1_id, match.athlete2_id
+
+    def _match_item(seq: int, payload: dict) -> dict:
+        return {
+            "event_id": str(uuid.uuid4()),
+            "seq": seq,
+            "type": "match.upsert",
+            "aggregate_id": str(match_id),
+            "aggregate_version": seq,
+            "occurred_at": datetime.now(UTC).isoformat(),
+            "payload": payload,
+        }
+
+    response = await client.post(
+        "/sync/upserts",
+        json={
+            "edge_id": "edge-interleaved",
+            "tournament_id": 1,
+            "items": [
+                _match_item(1, {"athlete1_id": athlete1_id, "athlete2_id": athlete2_id, "status": "started"}),
+                {
+                    "event_id": str(uuid.uuid4()),
+                    "seq": 2,
+                    "type": "bracket.upsert",
+                    "aggregate_id": str(bracket_id),
+                    "aggregate_version": 2,
+                    "occurred_at": datetime.now(UTC).isoformat(),
+                    "payload": {
+                        "type": "single_elimination",
+                        "status": "started",
+                        "participants": [
+                            {"athlete_id": athlete1_id, "seed": 1},
+                            {"athlete_id": athlete2_id, "seed": 2},
+                        ],
+                        "matches": [
+                            {
+                                "id": str(match_id),
+                                "round_number": 1,
+                                "position": 1,
+                                "status": "started",
+                                "athlete1_id": athlete1_id,
+                                "athlete2_id": athlete2_id,
+                                "winner_id": None,
+                            }
+                        ],
+                    },
+                },
+                _match_item(3, {"athlete1_id": athlete1_id, "athlete2_id": athlete2_id}),
+            ],
+        },
+    )
+    assert response.status_code == 200
+    payload = response.json()
+    assert payload["accepted"] == [1, 2]
+    assert [(conflict["seq"], conflict["reason"]) for conflict in payload["conflicts"]] == [(3, "invalid_payload")]
+
+    db_session.expire_all()
+    bracket = await db_session.get(Bracket, bracket_id)
+    assert bracket.version == 2
+
+
+@pytest.mark.asyncio
+async def test_sync_bracket_upsert_applies_structure_diff(client: AsyncClient, db_session) -> None:
+    bracket_id, match_id = await _seed_match(db_session)
+    match = await db_session.get(Match, match_id)
+    athlete1_id, athlete2_id = match.athlete1_id, match.athlete2_id
+    added_match_id = uuid.uuid4()
+
+    def _structure_match(item_id: uuid.UUID, round_number: int, status: str, winner_id: int | None) -> dict:
+        return {
+            "id": str(item_id),
+            "round_number": round_number,
+            "position": 1,
+            "status": status,
+            "athlete1_id": athlete1_id,
+            "athlete2_id": athlete2_id,
+            "winner_id": winner_id,
+        }
+
+    response = await client.post(
+        "/sync/upserts",
+        json={
+            "edge_id": "edge-structure",
+            "tournament_id": 1,
+            "items": [
+                {
+                    "event_id": str(uuid.uuid4()),
+                    "seq": 1,
+                    "type": "bracket.upsert",
+                    "aggregate_id": str(bracket_id),
+                    "aggregate_version": 2,
+                    "occurred_at": datetime.now(UTC).isoformat(),
+                    "payload": {
+                        "type": "single_elimination",
+                        "status": "started",
+                        "participants": [
+                            {"athlete_id": athlete1_id, "seed": 1},
+                            {"athlete_id": athlete2_id, "seed": 2},
+                        ],
+                        "matches": [
+                            _structure_match(match_id, 1, "finished", athlete1_id),
+                            _structure_match(added_match_id, 2, "not_started", None),
+                        ],
+                    },
+                }
+            ],
+        },
+    )
+    assert response.status_code == 200
+    assert response.json()["accepted"] == [1]
+
+    db_session.expire_all()
+    stored_ids = set(
+        (await db_session.execute(select(BracketMatch.match_id).where(BracketMatch.bracket_id == bracket_id)))
+        .scalars()
+        .all()
+    )
+    assert stored_ids == {match_id, added_match_id}
+    stored = await db_session.get(Match, match_id)
+    assert stored.status == "finished"
+    assert stored.winner_id == athlete1_id
+
+
+@pytest.mark.asyncio
+async def test_sync_upserts_broadcast_one_batch_per_tournament(
+    client: AsyncClient, db_session, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    bracket_a_id, match_a_id = await _seed_match(db_session)
+    bracket_b_id, match_b_id = await _seed_match(db_session)
+    match_a = await db_session.get(Match, match_a_id)
+    athlete1_id, athlete2_id = match_a.athlete1_id, match_a.athlete2_id
+    tournament_a_id = (await db_session.get(Bracket, bracket_a_id)).tournament_id
+    tournament_b_id = (await db_session.get(Bracket, bracket_b_id)).tournament_id
+    match_b = await db_session.get(Match, match_b_id)
+    added_match_id = uuid.uuid4()
+
+    published: list[tuple[int, MatchBatchUpdate]] = []
+
+    async def _publish(tournament_id: int, message: MatchBatchUpdate) -> None:
+        published.append((tournament_id, message))
+
+    monkeypatch.setattr(sync, "publish_tournament_update", _publish)
+
+    def _item(seq: int, item_type: str, aggregate_id: object, version: int, payload: dict) -> dict:
+        return {
+            "event_id": str(uuid.uuid4()),
+            "seq": seq,
+            "type": item_type,
+            "aggregate_id": str(aggregate_id),
+            "aggregate_version": version,
+            "occurred_at": datetime.now(UTC).isoformat(),
+            "payload": payload,
+        }
+
+    def _scores(athletes: tuple[int, int], score_athlete1: int, score_athlete2: int) -> dict:
+        return {
+            "athlete1_id": athletes[0],
+            "athlete2_id": athletes[1],
+            "score_athlete1": score_athlete1,
+            "score_athlete2": score_athlete2,
+            "status": "started",
+        }
+
+    response = await client.post(
+        "/sync/upserts",
+        json={
+            "edge_id": "edge-broadcast",
+            "tournament_id": 1,
+            "items": [
+                _item(1, "match.upsert", match_a_id, 2, _scores((athlete1_id, athlete2_id), 1, 0)),
+                _item(2, "match.upsert", match_a_id, 3, _scores((athlete1_id, athlete2_id), 2, 0)),
+                _item(3, "match.upsert", match_b_id, 2, _scores((match_b.athlete1_id, match_b.athlete2_id), 0, 2)),
+                _item(
+                    4,
+                    "bracket.upsert",
+                    bracket_a_id,
+                    4,
+                    {
+                        "type": "single_elimination",
+                        "status": "started",
+                        "participants": [
+                            {"athlete_id": athlete1_id, "seed": 1},
+                            {"athlete_id": athlete2_id, "seed": 2},
+                        ],
+                        "matches": [
+                            {
+                                "id": str(match_a_id),
+                                "round_number": 1,
+                                "position": 1,
+                                "status": "finished",
+                                "athlete1_id": athlete1_id,
+                                "athlete2_id": athlete2_id,
+                                "winner_id": athlete1_id,
+                                "score_athlete1": 3,
+                                "score_athlete2": 0,
+                            },
+                            {
+                                "id": str(added_match_id),
+                                "round_number": 2,
+                                "position": 1,
+                                "status": "not_started",
+                                "athlete1_id": athlete1_id,
+                                "athlete2_id": None,
+                                "winner_id": None,
+                            },
+                        ],
+                    },
+                ),
+            ],
+        },
+    )
+    assert response.status_code == 200
+    assert response.json()["accepted"] == [1, 2, 3, 4]
+
+    assert sorted(tournament_id for tournament_id, _ in published) == sorted([tournament_a_id, tournament_b_id])
+    updates = dict(published)
+    update_a = updates[tournament_a_id]
+    assert [
+        (match.match_id, match.score_athlete1, match.score_athlete2, match.status) for match in update_a.matches
+    ] == [(match_a_id, 3, 0, "finished"), (added_match_id, None, None, "not_started")]
+    assert [(bracket.bracket_id, bracket.version) for bracket in update_a.brackets] == [(bracket_a_id, 4)]
+
+    update_b = updates[tournament_b_id]
+    assert [
+        (match.match_id, match.score_athlete1, match.score_athlete2, match.status) for match in update_b.matches
+    ] == [(match_b_id, 0, 2, "started")]
+    assert [(bracket.bracket_id, bracket.version) for bracket in update_b.brackets] == [(bracket_b_id, 2)]
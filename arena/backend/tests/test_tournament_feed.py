@@ -0,0 +1,50 @@
+import json
+
+import pytest
+from broadcaster import Broadcast
+
+from src.schemas import BracketVersionUpdate
+from src.services.tournament_feed import MemoryTournamentFeed
+from src.services.ws_hub import WebSocketHub
+
+
+@pytest.mark.asyncio
+async def test_feed_replays_missed_deltas_and_detects_gaps() -> None:
+    source = Broadcast("memory://")
+    await source.connect()
+    feed = MemoryTournamentFeed(source, history_length=3)
+    try:
+        for version in range(1, 5):
+            await feed.publish(7, BracketVersionUpdate(bracket_id=1, version=version).model_dump_json())
+
+        assert await feed.current_seq(7) == 4
+        replay = await feed.history_since(7, 2)
+        assert [json.loads(message) for message in replay] == [
+            {"seq": 3, "bracket_id": 1, "version": 3},
+            {"seq": 4, "bracket_id": 1, "version": 4},
+        ]
+        assert await feed.history_since(7, 4) == []
+        assert await feed.history_since(7, 0) is None
+        assert await feed.history_since(7, 9) is None
+    finally:
+        await source.disconnect()
+
+
+@pytest.mark.asyncio
+async def test_hub_skips_live_messages_already_replayed() -> None:
+    source = Broadcast("memory://")
+    await source.connect()
+    feed = MemoryTournamentFeed(source, history_length=10)
+    hub = WebSocketHub(source, max_queue=10)
+    try:
+        async with hub.connect("tournament:7") as client:
+            for version in range(1, 4):
+                await feed.publish(7, BracketVersionUpdate(bracket_id=1, version=version).model_dump_json())
+            client.resume_from(2)
+            await feed.publish(7, BracketVersionUpdate(bracket_id=1, version=4).model_dump_json())
+
+            assert json.loads(await client.receive())["seq"] == 3
+            assert json.loads(await client.receive())["seq"] == 4
+    finally:
+        await hub.close()
+        await source.disconnect()
@@ -0,0 +1,62 @@
+import asyncio
+import json
+
+import pytest
+from broadcaster import Broadcast
+
+from src.services.ws_hub import WebSocketHub
+
+
+def _update(match_id: str, score: int) -> str:
+    return json.dumps({"match_id": match_id, "score_athlete1": score, "score_athlete2": 0, "status": "started"})
+
+
+async def _settle() -> None:
+    for _ in range(5):
+        await asyncio.sleep(0)
+
+
+@pytest.mark.asyncio
+async def test_hub_shares_one_subscription_and_coalesces_per_match() -> None:
+    source = Broadcast("memory://")
+    await source.connect()
+    hub = WebSocketHub(source, max_queue=4)
+    try:
+        async with hub.connect("tournament:1") as first, hub.connect("tournament:1") as second:
+            await _settle()
+            assert hub.stats()["channels"] == 1
+            assert hub.stats()["connections"] == 2
+
+            for score in range(3):
+                await source.publish(channel="tournament:1", message=_update("a", score))
+            await source.publish(channel="tournament:1", message=_update("b", 7))
+            await _settle()
+
+            assert hub.stats()["max_queue_depth"] == 2
+            for client in (first, second):
+                assert json.loads(await client.receive())["score_athlete1"] == 2
+                assert json.loads(await client.receive())["match_id"] == "b"
+        assert hub.stats()["channels"] == 0
+    finally:
+        await hub.close()
+        await source.disconnect()
+
+
+@pytest.mark.asyncio
+async def test_hub_disconnects_slow_consumer() -> None:
+    source = Broadcast("memory://")
+    await source.connect()
+    hub = WebSocketHub(source, max_queue=2)
+    try:
+        async with hub.connect("tournament:1") as client:
+            await _settle()
+            for index in range(3):
+                await source.publish(channel="tournament:1", message=_update(str(index), 1))
+            await _settle()
+
+            assert client.overflowed
+            assert await client.receive() is None
+        assert hub.stats()["slow_disconnects"] == 1
+    finally:
+        await hub.close()
+        await source.disconnect()
@@ -2,24 +2,17 @@
 
 import React from "react";
 
-import { useWebSocket } from "@/hooks/use-websocket";
-
-interface MatchUpdate {
-  match_id: string;
-  score_athlete1: number | null;
-  score_athlete2: number | null;
-  status: string | null;
-}
+import { MatchBatchUpdate, MatchUpdate, ResyncRequired, useWebSocket } from "@/hooks/use-websocket";
 
 interface WebSocketProviderProps {
   children: React.ReactNode;
   tournamentId: string;
-  onAnyUpdate?: (update: MatchUpdate) => void;
+  onAnyUpdate?: (update: MatchUpdate | MatchBatchUpdate | ResyncRequired) => void;
 }
 
 export function WebSocketProvider({ children, tournamentId, onAnyUpdate }: WebSocketProviderProps) {
   const handleMatchUpdate = React.useCallback(
-    (update: MatchUpdate) => {
+    (update: MatchUpdate | MatchBatchUpdate | ResyncRequired) => {
       onAnyUpdate?.(update);
     },
     [onAnyUpdate],
@@ -28,6 +21,8 @@ export function WebSocketProvider({ children, tournamentId, onAnyUpdate }: WebSo
   useWebSocket({
     tournamentId,
     onMatchUpdate: handleMatchUpdate,
+    onBatchUpdate: handleMatchUpdate,
+    onResync: handleMatchUpdate,
   });
 
   return <>{children}</>;
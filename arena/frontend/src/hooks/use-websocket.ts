@@ -2,23 +2,38 @@ import { useCallback, useEffect, useRef, useState } from "react";
 
 import { BACKEND_URL } from "@/lib/config";
 
-interface MatchUpdate {
+export interface MatchUpdate {
+  seq?: number;
   match_id: string;
   score_athlete1: number | null;
   score_athlete2: number | null;
   status: string | null;
 }
 
+export interface MatchBatchUpdate {
+  seq?: number;
+  type: "match_batch";
+  matches: MatchUpdate[];
+  brackets: { bracket_id: number; version: number }[];
+}
+
+export interface ResyncRequired {
+  type: "resync";
+  seq: number;
+}
+
 interface UseWebSocketOptions {
   tournamentId: string;
   onMatchUpdate?: (update: MatchUpdate) => void;
+  onBatchUpdate?: (update: MatchBatchUpdate) => void;
+  onResync?: (update: ResyncRequired) => void;
   onConnect?: () => void;
   onDisconnect?: () => void;
   onError?: (error: Event) => void;
 }
 
-function buildWebSocketUrl(baseUrl: string, tournamentId: string): string {
-  const suffix = `/ws/tournament/${tournamentId}`;
+function buildWebSocketUrl(baseUrl: string, tournamentId: string, since: number | null): string {
+  const suffix = `/ws/tournament/${tournamentId}${since === null ? "" : `?since=${since}`}`;
   const trimmed = baseUrl.replace(/\/+$/, "");
 
   if (trimmed.startsWith("ws://") || trimmed.startsWith("wss://")) {
@@ -40,12 +55,21 @@ function buildWebSocketUrl(baseUrl: string, tournamentId: string): string {
   return `${trimmed}${suffix}`;
 }
 
-export function useWebSocket({ tournamentId, onMatchUpdate, onConnect, onDisconnect, onError }: UseWebSocketOptions) {
+export function useWebSocket({
+  tournamentId,
+  onMatchUpdate,
+  onBatchUpdate,
+  onResync,
+  onConnect,
+  onDisconnect,
+  onError,
+}: UseWebSocketOptions) {
   const [isConnected, setIsConnected] = useState(false);
   const [error, setError] = useState<string | null>(null);
   const wsRef = useRef<WebSocket | null>(null);
   const reconnectTimeoutRef = useRef<NodeJS.Timeout | null>(null);
   const reconnectAttempts = useRef(0);
+  const lastSeqRef = useRef<{ tournamentId: string; seq: number } | null>(null);
   const maxReconnectAttempts = 5;
 
   const connect = useCallback(() => {
@@ -55,7 +79,8 @@ export function useWebSocket({ tournamentId, onMatchUpdate, onConnect, onDisconn
     }
 
     try {
-      const wsUrl = buildWebSocketUrl(BACKEND_URL, tournamentId);
+      const lastSeq = lastSeqRef.current?.tournamentId === tournamentId ? lastSeqRef.current.seq : null;
+      const wsUrl = buildWebSocketUrl(BACKEND_URL, tournamentId, lastSeq);
 
       const ws = new WebSocket(wsUrl);
       wsRef.current = ws;
@@ -71,6 +96,26 @@ export function useWebSocket({ tournamentId, onMatchUpdate, onConnect, onDisconn
         try {
           const data = JSON.parse(event.data);
 
+          if (typeof data.seq === "number") {
+            const current = lastSeqRef.current?.tournamentId === tournamentId ? lastSeqRef.current.seq : 0;
+            lastSeqRef.current = { tournamentId, seq: Math.max(current, data.seq) };
+          }
+
+          if (data.type === "resync") {
+            lastSeqRef.current = { tournamentId, seq: data.seq };
+            onResync?.(data as ResyncRequired);
+            return;
+          }
+
+          if (data.type === "sequence") {
+            return;
+          }
+
+          if (data.type === "match_batch") {
+            onBatchUpdate?.(data as MatchBatchUpdate);
+            return;
+          }
+
           // Check if it's a match update
           if (data.match_id && (data.score_athlete1 !== undefined || data.score_athlete2 !== undefined)) {
             onMatchUpdate?.(data as MatchUpdate);
@@ -104,7 +149,7 @@ export function useWebSocket({ tournamentId, onMatchUpdate, onConnect, onDisconn
       setError("Failed to create WebSocket connection");
       console.error("WebSocket connection error:", err);
     }
-  }, [tournamentId, onMatchUpdate, onConnect, onDisconnect, onError]);
+  }, [tournamentId, onMatchUpdate, onBatchUpdate, onResync, onConnect, onDisconnect, onError]);
 
   const disconnect = useCallback(() => {
     if (reconnectTimeoutRef.current) {
@@ -133,6 +133,17 @@ export async function replaceTournamentTimetable(
   return res.json();
 }
 
+interface ExportJob {
+  job_id: string | null;
+  tournament_id: number;
+  status: "queued" | "running" | "finished" | "failed";
+  filename: string | null;
+  detail: string | null;
+  updated_at: string | null;
+}
+
+const EXPORT_POLL_INTERVAL_MS = 1000;
+
 export async function downloadTournamentDocx(tournamentId: number): Promise<string> {
   const res = await fetchWithRefresh(`${BACKEND_URL}/tournaments/${tournamentId}/export_file`, { cache: "no-store" });
 
@@ -140,8 +151,22 @@ export async function downloadTournamentDocx(tournamentId: number): Promise<stri
     throw new Error("Failed to export tournament file");
   }
 
-  const data = await res.json();
-  return `${BACKEND_URL}/${data.filename}`;
+  let job: ExportJob = await res.json();
+  while (job.status === "queued" || job.status === "running") {
+    await new Promise((resolve) => setTimeout(resolve, EXPORT_POLL_INTERVAL_MS));
+    const statusRes = await fetchWithRefresh(`${BACKEND_URL}/tournaments/${tournamentId}/export_jobs/${job.job_id}`, {
+      cache: "no-store",
+    });
+    if (!statusRes.ok) {
+      throw new Error("Failed to export tournament file");
+    }
+    job = await statusRes.json();
+  }
+
+  if (job.status === "failed" || !job.filename) {
+    throw new Error(job.detail ?? "Failed to export tournament file");
+  }
+  return `${BACKEND_URL}/${job.filename}`;
 }
 
 export async function importCbrFile(tournamentId: number, file: File): Promise<void> {
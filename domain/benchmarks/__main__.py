@@ -0,0 +1,76 @@
+import argparse
+import json
+import sys
+from pathlib import Path
+
+from benchmarks.cases import build_cases
+from benchmarks.runner import find_regressions, load_baseline, results_to_json, run_calibration, run_case
+
+DEFAULT_BASELINE = Path(__file__).with_name("baseline.json")
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks")
+    parser.add_argument("--filter", default="", help="only run cases whose name contains this text")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--output", type=Path, help="write results JSON to this file instead of stdout")
+    parser.add_argument("--baseline", type=Path, default=DEFAULT_BASELINE)
+    parser.add_argument("--max-regression", type=float, default=25.0, help="allowed slowdown in percent")
+    parser.add_argument(
+        "--noise-floor-us", type=float, default=25.0, help="ignore slowdowns smaller than this many microseconds"
+    )
+    parser.add_argument("--update-baseline", action="store_true")
+    args = parser.parse_args(argv)
+
+    calibration_ns = run_calibration(repeat=args.repeat)
+    cases = {case.name: case for case in build_cases() if args.filter in case.name}
+    results = []
+    for case in cases.values():
+        result = run_case(case, repeat=args.repeat)
+        results.append(result)
+        print(f"{result.name:<60} {result.best_ns / 1000:>12.1f} us", file=sys.stderr)
+
+    payload = json.dumps(results_to_json(results, calibration_ns), indent=2, sort_keys=True) + "\n"
+    if args.update_baseline:
+        args.baseline.write_text(payload)
+        return 0
+    if args.output is not None:
+        args.output.write_text(payload)
+    else:
+        sys.stdout.write(payload)
+
+    if not args.baseline.exists():
+        return 0
+    baseline = load_baseline(args.baseline)
+    mismatch = baseline.environment_mismatch()
+    if mismatch is not None:
+        print(f"Skipping regression check: {mismatch}; re-record with --update-baseline", file=sys.stderr)
+        return 0
+    scale = baseline.scale_for(calibration_ns)
+    noise_floor_ns = args.noise_floor_us * 1000
+    regressions = find_regressions(
+        results, baseline.results, args.max_regression, scale=scale, noise_floor_ns=noise_floor_ns
+    )
+    if regressions:
+        # A single slow sample is usually host noise; only slowdowns that survive a second measurement fail the run.
+        suspects = {regression.name for regression in regressions}
+        results = [
+            min(result, run_case(cases[result.name], repeat=args.repeat), key=lambda item: item.best_ns)
+            if result.name in suspects
+            else result
+            for result in results
+        ]
+        regressions = find_regressions(
+            results, baseline.results, args.max_regression, scale=scale, noise_floor_ns=noise_floor_ns
+        )
+    for regression in regressions:
+        print(
+            f"REGRESSION {regression.name}: {regression.baseline_ns / 1000:.1f} us -> "
+            f"{regression.current_ns / 1000:.1f} us (+{regression.percent:.1f}%)",
+            file=sys.stderr,
+        )
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,212 @@
+import json
+from collections.abc import Callable
+from dataclasses import dataclass
+from typing import Any
+from uuid import UUID, uuid5
+
+from champion_domain import (
+    BracketIndex,
+    BracketPlanRequest,
+    PlacementMatchInput,
+    SeededParticipant,
+    StructureMatch,
+    StructureMatchInput,
+    build_structure_match,
+    compute_bracket_placements,
+    compute_main_rounds,
+    plan_bracket_matches,
+    plan_repechage_generation,
+    plan_single_elimination_bracket,
+    plan_tournament_brackets,
+    resolve_bye_advancements,
+)
+from champion_domain.use_cases import plan_single_elimination
+
+PARTICIPANT_COUNTS = (2, 3, 8, 17, 64, 128, 256, 512, 1024)
+ROUND_ROBIN_COUNTS = (2, 3, 8, 17, 64, 128, 256, 512, 1024)
+TOURNAMENT_BRACKET_SIZES = (2, 3, 4, 5, 6, 8, 11, 16)
+TOURNAMENT_BRACKET_COUNT = 400
+
+_ID_NAMESPACE = UUID("6f1c3f4e-8d0a-4a53-9a7e-2a61f0c0b001")
+
+
+@dataclass(frozen=True)
+class BenchmarkCase:
+    name: str
+    func: Callable[[], object]
+
+
+def _athlete_ids(count: int) -> list[int]:
+    return list(range(1000, 1000 + count))
+
+
+def _participants(count: int) -> list[SeededParticipant]:
+    athlete_ids = _athlete_ids(count)
+    return [SeededParticipant(seed=seed, athlete_id=athlete_id) for seed, athlete_id in enumerate(athlete_ids, start=1)]
+
+
+def _finished_bracket(count: int) -> list[PlacementMatchInput]:
+    winners: dict[tuple[int, int], int | None] = {}
+    rows: list[PlacementMatchInput] = []
+    for round_items in plan_single_elimination_bracket(_athlete_ids(count)):
+        for planned in round_items:
+            athlete1_id = planned.athlete1_id
+            athlete2_id = planned.athlete2_id
+            if planned.round_number > 1:
+                athlete1_id = winners.get((planned.round_number - 1, planned.position * 2 - 1))
+                athlete2_id = winners.get((planned.round_number - 1, planned.position * 2))
+            winner_id = athlete1_id if athlete1_id is not None else athlete2_id
+            winners[(planned.round_number, planned.position)] = winner_id
+            rows.append(
+                PlacementMatchInput(
+                    round_number=planned.round_number,
+                    stage="main",
+                    status="finished",
+                    winner_id=winner_id,
+                    athlete1_id=athlete1_id,
+                    athlete2_id=athlete2_id,
+                    repechage_side=None,
+                    repechage_step=None,
+                    position=planned.position,
+                )
+            )
+    return rows
+
+
+def _structure_inputs(count: int) -> list[StructureMatchInput]:
+    return [
+        StructureMatchInput(
+            id=str(uuid5(_ID_NAMESPACE, f"{row.round_number}:{row.position}")),
+            round_number=row.round_number,
+            position=row.position or 1,
+            next_slot=None,
+            status=row.status,
+            athlete1_id=row.athlete1_id,
+            athlete2_id=row.athlete2_id,
+            winner_id=row.winner_id,
+            score_athlete1=1,
+            score_athlete2=0,
+            started_at=None,
+            ended_at=None,
+        )
+        for row in _finished_bracket(count)
+    ]
+
+
+def _structure_payload(matches: list[StructureMatch]) -> str:
+    return json.dumps(
+        {
+            "matches": [
+                {
+                    "id": str(match.id),
+                    "round_number": match.round_number,
+                    "position": match.position,
+                    "next_slot": match.next_slot,
+                    "status": match.status,
+                    "athlete1_id": match.athlete1_id,
+                    "athlete2_id": match.athlete2_id,
+                    "winner_id": match.winner_id,
+                    "score_athlete1": match.score_athlete1,
+                    "score_athlete2": match.score_athlete2,
+                }
+                for match in matches
+            ]
+        }
+    )
+
+
+def _parse_structure_payload(payload: str, main_rounds: int) -> list[StructureMatch]:
+    data: dict[str, Any] = json.loads(payload)
+    return [
+        build_structure_match(
+            StructureMatchInput(
+                id=item["id"],
+                round_number=item["round_number"],
+                position=item["position"],
+                next_slot=item["next_slot"],
+                status=item["status"],
+                athlete1_id=item["athlete1_id"],
+                athlete2_id=item["athlete2_id"],
+                winner_id=item["winner_id"],
+                score_athlete1=item["score_athlete1"],
+                score_athlete2=item["score_athlete2"],
+                started_at=None,
+                ended_at=None,
+            ),
+            main_rounds=main_rounds,
+        )
+        for item in data["matches"]
+    ]
+
+
+def _single_elimination_cases(count: int) -> list[BenchmarkCase]:
+    participants = _participants(count)
+    planned_rounds = plan_single_elimination(_athlete_ids(count))
+    rows = _finished_bracket(count)
+    final = rows[-1]
+    main_rounds = compute_main_rounds(count)
+    structure_inputs = _structure_inputs(count)
+    structure_matches = [build_structure_match(item, main_rounds) for item in structure_inputs]
+    payload = _structure_payload(structure_matches)
+
+    def repechage() -> object:
+        if final.athlete1_id is None or final.athlete2_id is None:
+            return None
+        return plan_repechage_generation(
+            finalist_a_id=final.athlete1_id,
+            finalist_b_id=final.athlete2_id,
+            base_round=main_rounds + 1,
+            index=BracketIndex(rows),
+        )
+
+    return [
+        BenchmarkCase(
+            f"plan_bracket_matches[single_elimination-{count}]",
+            lambda: plan_bracket_matches("single_elimination", participants),
+        ),
+        BenchmarkCase(f"resolve_bye_advancements[{count}]", lambda: resolve_bye_advancements(planned_rounds)),
+        BenchmarkCase(f"compute_bracket_placements[{count}]", lambda: compute_bracket_placements(rows)),
+        BenchmarkCase(f"plan_repechage_generation[{count}]", repechage),
+        BenchmarkCase(
+            f"build_structure_match[{count}]",
+            lambda: [build_structure_match(item, main_rounds) for item in structure_inputs],
+        ),
+        BenchmarkCase(
+            f"structure_payload_roundtrip[{count}]",
+            lambda: _structure_payload(_parse_structure_payload(payload, main_rounds)),
+        ),
+    ]
+
+
+def _round_robin_case(count: int) -> BenchmarkCase:
+    participants = _participants(count)
+    return BenchmarkCase(
+        f"plan_bracket_matches[round_robin-{count}]",
+        lambda: plan_bracket_matches("round_robin", participants),
+    )
+
+
+def _tournament_case() -> BenchmarkCase:
+    requests = [
+        BracketPlanRequest(
+            key=key,
+            bracket_type="round_robin" if size <= 4 else "single_elimination",
+            participants=tuple(_participants(size)),
+        )
+        for key in range(TOURNAMENT_BRACKET_COUNT)
+        for size in (TOURNAMENT_BRACKET_SIZES[key % len(TOURNAMENT_BRACKET_SIZES)],)
+    ]
+    return BenchmarkCase(
+        f"plan_tournament_brackets[{TOURNAMENT_BRACKET_COUNT}]",
+        lambda: plan_tournament_brackets(requests),
+    )
+
+
+def build_cases() -> list[BenchmarkCase]:
+    cases: list[BenchmarkCase] = []
+    for count in PARTICIPANT_COUNTS:
+        cases.extend(_single_elimination_cases(count))
+    for count in ROUND_ROBIN_COUNTS:
+        cases.append(_round_robin_case(count))
+    cases.append(_tournament_case())
+    return cases
@@ -0,0 +1,116 @@
+import json
+import platform
+import timeit
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Any
+
+from benchmarks.cases import BenchmarkCase
+
+
+@dataclass(frozen=True)
+class BenchmarkResult:
+    name: str
+    number: int
+    repeat: int
+    best_ns: float
+    mean_ns: float
+
+
+@dataclass(frozen=True)
+class Baseline:
+    python: str | None
+    machine: str | None
+    calibration_ns: float | None
+    results: dict[str, float]
+
+    def environment_mismatch(self) -> str | None:
+        current = _python_series(platform.python_version())
+        if self.python is not None and _python_series(self.python) != current:
+            return f"baseline recorded on Python {self.python}, running {platform.python_version()}"
+        if self.machine is not None and self.machine != platform.machine():
+            return f"baseline recorded on {self.machine}, running on {platform.machine()}"
+        return None
+
+    def scale_for(self, calibration_ns: float) -> float:
+        if self.calibration_ns is None or self.calibration_ns <= 0:
+            return 1.0
+        return calibration_ns / self.calibration_ns
+
+
+@dataclass(frozen=True)
+class Regression:
+    name: str
+    baseline_ns: float
+    current_ns: float
+
+    @property
+    def percent(self) -> float:
+        return (self.current_ns / self.baseline_ns - 1) * 100
+
+
+def _python_series(version: str) -> str:
+    return ".".join(version.split(".")[:2])
+
+
+def _calibration_workload() -> object:
+    # Plain interpreter work with no domain code, so its timing tracks only the speed of the host.
+    return sorted(str(value) for value in range(2000, 0, -1))
+
+
+def run_calibration(repeat: int = 5) -> float:
+    return run_case(BenchmarkCase("calibration", _calibration_workload), repeat=repeat).best_ns
+
+
+def run_case(case: BenchmarkCase, repeat: int = 5) -> BenchmarkResult:
+    timer = timeit.Timer(case.func)
+    number, _ = timer.autorange()
+    timings = [elapsed / number * 1e9 for elapsed in timer.repeat(repeat=repeat, number=number)]
+    return BenchmarkResult(
+        name=case.name,
+        number=number,
+        repeat=repeat,
+        best_ns=min(timings),
+        mean_ns=sum(timings) / len(timings),
+    )
+
+
+def results_to_json(results: list[BenchmarkResult], calibration_ns: float | None = None) -> dict[str, Any]:
+    return {
+        "python": platform.python_version(),
+        "machine": platform.machine(),
+        "calibration_ns": calibration_ns,
+        "results": {result.name: asdict(result) for result in results},
+    }
+
+
+def load_baseline(path: Path) -> Baseline:
+    data = json.loads(path.read_text())
+    calibration_ns = data.get("calibration_ns")
+    return Baseline(
+        python=data.get("python"),
+        machine=data.get("machine"),
+        calibration_ns=float(calibration_ns) if calibration_ns is not None else None,
+        results={name: float(item["best_ns"]) for name, item in data.get("results", {}).items()},
+    )
+
+
+def find_regressions(
+    results: list[BenchmarkResult],
+    baseline: dict[str, float],
+    max_regression_percent: float,
+    *,
+    scale: float = 1.0,
+    noise_floor_ns: float = 0.0,
+) -> list[Regression]:
+    regressions: list[Regression] = []
+    for result in results:
+        baseline_ns = baseline.get(result.name)
+        if baseline_ns is None or baseline_ns <= 0:
+            continue
+        expected_ns = baseline_ns * scale
+        if result.best_ns - expected_ns <= noise_floor_ns:
+            continue
+        if result.best_ns > expected_ns * (1 + max_regression_percent / 100):
+            regressions.append(Regression(result.name, expected_ns, result.best_ns))
+    return regressions
@@ -8,13 +8,22 @@ from .bracket_policy import (
 from .match_policy import can_finish_match, can_start_match, can_update_scores
 from .match_results import final_loser_id, match_loser_id
 from .use_cases import (
+    SUPPORTED_BRACKET_TYPES,
     AdvancementTarget,
+    BracketChangeSet,
     BracketCompletionDecision,
+    BracketIndex,
     BracketPlacements,
+    BracketPlan,
+    BracketPlanRequest,
+    BracketRow,
+    BracketRuntime,
+    BracketStructure,
     FinishedMainMatch,
     FinishFlowPostDecision,
     FinishFlowRuntimeDecision,
     FinishRuntimeDecision,
+    IndexableMatch,
     MatchClassification,
     NextMatchTarget,
     PlacementMatchInput,
@@ -23,11 +32,18 @@ from .use_cases import (
     ProgressionAction,
     RepechageAdvanceTarget,
     RepechageGenerationResult,
+    RuntimeMatch,
     SeededParticipant,
+    SingleEliminationTemplate,
     StructureMatch,
     StructureMatchInput,
     StructureParticipant,
     StructureParticipantInput,
+    StructurePatch,
+    StructureSnapshot,
+    TemplateMatch,
+    advance_bracket_placements,
+    apply_structure_patch,
     build_repechage_plan,
     build_structure_match,
     build_structure_participant,
@@ -43,16 +59,20 @@ from .use_cases import (
     decide_finish_flow_post,
     decide_finish_flow_runtime,
     decide_finish_runtime,
+    diff_structure_snapshots,
     is_bracket_finished,
+    iter_round_robin_rounds,
     plan_bracket_matches,
     plan_repechage_generation,
     plan_round_robin_bracket,
     plan_single_elimination_bracket,
+    plan_tournament_brackets,
     resolve_bye_advancements,
     should_attempt_repechage_generation_on_finish,
     should_finish_tournament,
     should_generate_repechage,
     should_publish_structure_after_match_finish,
+    single_elimination_template,
 )
 
 __all__ = [
@@ -73,14 +93,26 @@ __all__ = [
     "compute_main_rounds",
     "SeededParticipant",
     "PlannedRoundRobinMatch",
+    "iter_round_robin_rounds",
     "plan_round_robin_bracket",
     "resolve_bye_advancements",
     "plan_single_elimination_bracket",
+    "SingleEliminationTemplate",
+    "TemplateMatch",
+    "single_elimination_template",
     "plan_bracket_matches",
+    "plan_tournament_brackets",
+    "BracketPlan",
+    "BracketPlanRequest",
+    "SUPPORTED_BRACKET_TYPES",
     "StructureMatch",
     "StructureParticipant",
     "StructureMatchInput",
     "StructureParticipantInput",
+    "StructureSnapshot",
+    "StructurePatch",
+    "diff_structure_snapshots",
+    "apply_structure_patch",
     "build_structure_match",
     "build_structure_participant",
     "build_structure_participants",
@@ -112,5 +144,13 @@ __all__ = [
     "is_bracket_finished",
     "PlacementMatchInput",
     "BracketPlacements",
+    "advance_bracket_placements",
     "compute_bracket_placements",
+    "BracketIndex",
+    "IndexableMatch",
+    "BracketRuntime",
+    "BracketChangeSet",
+    "RuntimeMatch",
+    "BracketStructure",
+    "BracketRow",
 ]
@@ -1,4 +1,5 @@
 import math
+from functools import lru_cache
 
 
 def get_round_type(round_index: int, total_rounds: int) -> str:
@@ -12,13 +13,22 @@ def get_round_type(round_index: int, total_rounds: int) -> str:
 
 
 def distribute_byes_safely(athlete_ids: list[int]) -> list[tuple[int | None, int | None]]:
-    num_players = len(athlete_ids)
+    return [
+        (
+            athlete_ids[first] if first is not None else None,
+            athlete_ids[second] if second is not None else None,
+        )
+        for first, second in bye_layout(len(athlete_ids))
+    ]
+
+
+@lru_cache(maxsize=256)
+def bye_layout(num_players: int) -> tuple[tuple[int | None, int | None], ...]:
     next_power_of_two = 2 ** math.ceil(math.log2(max(num_players, 2)))
     total_matches = next_power_of_two // 2
     byes_needed = next_power_of_two - num_players
 
     pairs: list[tuple[int | None, int | None]] = []
-    ids = athlete_ids.copy()
 
     bye_positions = set()
     if byes_needed > 0:
@@ -29,16 +39,16 @@ def distribute_byes_safely(athlete_ids: list[int]) -> list[tuple[int | None, int
 
     idx = 0
     for match_idx in range(total_matches):
-        if match_idx in bye_positions and idx < len(ids):
-            pairs.append((ids[idx], None))
+        if match_idx in bye_positions and idx < num_players:
+            pairs.append((idx, None))
             idx += 1
         else:
-            a1 = ids[idx] if idx < len(ids) else None
-            a2 = ids[idx + 1] if (idx + 1) < len(ids) else None
+            a1 = idx if idx < num_players else None
+            a2 = idx + 1 if (idx + 1) < num_players else None
             pairs.append((a1, a2))
             idx += 2
 
-    return pairs
+    return tuple(pairs)
 
 
 def split_evenly[T](athletes: list[T], max_per_group: int = 4) -> list[list[T]]:
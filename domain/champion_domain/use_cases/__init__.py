@@ -1,6 +1,10 @@
 from .bracket_completion import BracketCompletionDecision, decide_bracket_completion, should_finish_tournament
+from .bracket_index import BracketIndex, IndexableMatch
 from .bracket_labels import MatchClassification, classify_bracket_match, compute_main_rounds
 from .bracket_rebuild import PlannedMatch, plan_single_elimination
+from .bracket_runtime import BracketChangeSet, BracketRuntime, RuntimeMatch
+from .bracket_structure import BracketRow, BracketStructure
+from .bracket_templates import SingleEliminationTemplate, TemplateMatch, single_elimination_template
 from .finish_flow import (
     FinishFlowPostDecision,
     FinishFlowRuntimeDecision,
@@ -17,8 +21,19 @@ from .match_progression import (
     compute_progression_action,
     is_bracket_finished,
 )
-from .placements import BracketPlacements, PlacementMatchInput, compute_bracket_placements
-from .regeneration_planner import plan_bracket_matches
+from .placements import (
+    BracketPlacements,
+    PlacementMatchInput,
+    advance_bracket_placements,
+    compute_bracket_placements,
+)
+from .regeneration_planner import (
+    SUPPORTED_BRACKET_TYPES,
+    BracketPlan,
+    BracketPlanRequest,
+    plan_bracket_matches,
+    plan_tournament_brackets,
+)
 from .repechage_runtime import (
     FinishedMainMatch,
     PlannedRepechageMatch,
@@ -34,12 +49,14 @@ from .repechage_runtime import (
 from .round_robin import (
     PlannedRoundRobinMatch,
     SeededParticipant,
+    iter_round_robin_rounds,
     plan_round_robin_bracket,
 )
 from .single_elimination import (
     plan_single_elimination_bracket,
     resolve_bye_advancements,
 )
+from .structure_diff import StructurePatch, StructureSnapshot, apply_structure_patch, diff_structure_snapshots
 from .structure_rebuild import StructureMatch, StructureParticipant
 from .structure_snapshot import (
     StructureMatchInput,
@@ -51,6 +68,9 @@ from .structure_snapshot import (
 
 __all__ = [
     "PlannedMatch",
+    "SingleEliminationTemplate",
+    "TemplateMatch",
+    "single_elimination_template",
     "MatchClassification",
     "classify_bracket_match",
     "compute_main_rounds",
@@ -58,16 +78,25 @@ __all__ = [
     "StructureParticipant",
     "StructureMatchInput",
     "StructureParticipantInput",
+    "StructureSnapshot",
+    "StructurePatch",
+    "diff_structure_snapshots",
+    "apply_structure_patch",
     "build_structure_match",
     "build_structure_participant",
     "build_structure_participants",
     "plan_single_elimination",
     "SeededParticipant",
     "PlannedRoundRobinMatch",
+    "iter_round_robin_rounds",
     "plan_round_robin_bracket",
     "resolve_bye_advancements",
     "plan_single_elimination_bracket",
     "plan_bracket_matches",
+    "SUPPORTED_BRACKET_TYPES",
+    "BracketPlanRequest",
+    "BracketPlan",
+    "plan_tournament_brackets",
     "FinishedMainMatch",
     "RepechageGenerationResult",
     "PlannedRepechageMatch",
@@ -96,5 +125,13 @@ __all__ = [
     "is_bracket_finished",
     "PlacementMatchInput",
     "BracketPlacements",
+    "advance_bracket_placements",
     "compute_bracket_placements",
+    "BracketIndex",
+    "IndexableMatch",
+    "BracketRuntime",
+    "BracketChangeSet",
+    "RuntimeMatch",
+    "BracketStructure",
+    "BracketRow",
 ]
@@ -0,0 +1,169 @@
+from collections.abc import Iterable
+from typing import Protocol
+
+from champion_domain.match_results import match_loser_id
+from champion_domain.use_cases.match_progression import ProgressionAction
+
+
+class IndexableMatch(Protocol):
+    @property
+    def round_number(self) -> int: ...
+
+    @property
+    def position(self) -> int | None: ...
+
+    @property
+    def stage(self) -> str: ...
+
+    @property
+    def status(self) -> str: ...
+
+    @property
+    def winner_id(self) -> int | None: ...
+
+    @property
+    def athlete1_id(self) -> int | None: ...
+
+    @property
+    def athlete2_id(self) -> int | None: ...
+
+    @property
+    def repechage_side(self) -> str | None: ...
+
+    @property
+    def repechage_step(self) -> int | None: ...
+
+
+def structural_key(row: IndexableMatch) -> tuple[int, int | None, str, str | None, int | None]:
+    return (row.round_number, row.position, row.stage, row.repechage_side, row.repechage_step)
+
+
+class BracketIndex[T: IndexableMatch]:
+    def __init__(
+        self,
+        rows: Iterable[T],
+        *,
+        repechage_stage_value: str = "repechage",
+        finished_status_value: str = "finished",
+    ) -> None:
+        self.repechage_stage_value = repechage_stage_value
+        self.finished_status_value = finished_status_value
+        self._rows: list[T] = []
+        self._slot_by_row_id: dict[int, int] = {}
+        self._main_by_round_and_position: dict[tuple[int, int], T] = {}
+        self._repechage_by_side_and_step: dict[tuple[str, int], T] = {}
+        self._last_repechage_by_side: dict[str, T] = {}
+        self._main_wins_by_athlete: dict[int, list[T]] = {}
+        self._final: T | None = None
+        self._repechage_count = 0
+        self.main_rounds = 0
+        self.max_round = 0
+
+        for row in rows:
+            self.add(row)
+
+    @property
+    def rows(self) -> list[T]:
+        return list(self._rows)
+
+    @property
+    def has_main_matches(self) -> bool:
+        return self.main_rounds > 0
+
+    @property
+    def has_repechage_matches(self) -> bool:
+        return self._repechage_count > 0
+
+    def is_repechage(self, row: T) -> bool:
+        return row.stage == self.repechage_stage_value
+
+    def is_finished(self, row: T) -> bool:
+        return row.status == self.finished_status_value
+
+    def final_match(self) -> T | None:
+        return self._final
+
+    def match_at(self, round_number: int, position: int) -> T | None:
+        return self._main_by_round_and_position.get((round_number, position))
+
+    def repechage_match_at(self, side: str, step: int) -> T | None:
+        return self._repechage_by_side_and_step.get((side, step))
+
+    def last_repechage_match(self, side: str) -> T | None:
+        return self._last_repechage_by_side.get(side)
+
+    def main_matches_won_by(self, athlete_id: int) -> list[T]:
+        return list(self._main_wins_by_athlete.get(athlete_id, ()))
+
+    def progression_target(self, action: ProgressionAction) -> T | None:
+        if action.kind == "main":
+            if action.main_round_number is None or action.main_position is None:
+                return None
+            return self.match_at(action.main_round_number, action.main_position)
+        if action.kind == "repechage":
+            if action.repechage_side is None or action.repechage_step is None:
+                return None
+            return self.repechage_match_at(action.repechage_side, action.repechage_step)
+        return None
+
+    def replace(self, previous: T, changed: T) -> bool:
+        slot = self._slot_by_row_id.get(id(previous))
+        if slot is None or structural_key(previous) != structural_key(changed):
+            return False
+
+        del self._slot_by_row_id[id(previous)]
+        self._rows[slot] = changed
+        self._slot_by_row_id[id(changed)] = slot
+
+        if self.is_repechage(changed):
+            side = changed.repechage_side
+            if side is None:
+                return True
+            key = (side, changed.repechage_step or 0)
+            if self._repechage_by_side_and_step.get(key) is previous:
+                self._repechage_by_side_and_step[key] = changed
+            if self._last_repechage_by_side.get(side) is previous:
+                self._last_repechage_by_side[side] = changed
+            return True
+
+        if changed.position is not None:
+            main_key = (changed.round_number, changed.position)
+            if self._main_by_round_and_position.get(main_key) is previous:
+                self._main_by_round_and_position[main_key] = changed
+        if self._final is previous:
+            self._final = changed
+
+        if previous.winner_id is not None:
+            wins = self._main_wins_by_athlete.get(previous.winner_id, [])
+            self._main_wins_by_athlete[previous.winner_id] = [row for row in wins if row is not previous]
+        self._index_main_win(changed)
+        return True
+
+    def _index_main_win(self, row: T) -> None:
+        if self.is_finished(row) and row.winner_id is not None and match_loser_id(row) is not None:
+            self._main_wins_by_athlete.setdefault(row.winner_id, []).append(row)
+
+    def add(self, row: T) -> None:
+        self._slot_by_row_id[id(row)] = len(self._rows)
+        self._rows.append(row)
+        self.max_round = max(self.max_round, row.round_number)
+
+        if self.is_repechage(row):
+            self._repechage_count += 1
+            side = row.repechage_side
+            if side is None:
+                return
+            step = row.repechage_step or 0
+            self._repechage_by_side_and_step.setdefault((side, step), row)
+            last = self._last_repechage_by_side.get(side)
+            if last is None or step >= (last.repechage_step or 0):
+                self._last_repechage_by_side[side] = row
+            return
+
+        if row.position is not None:
+            self._main_by_round_and_position.setdefault((row.round_number, row.position), row)
+        if row.round_number > self.main_rounds:
+            self.main_rounds = row.round_number
+            self._final = row
+
+        self._index_main_win(row)
@@ -1,5 +1,6 @@
 import math
 from dataclasses import dataclass
+from functools import lru_cache
 
 from champion_domain.bracket_generation import get_round_type
 
@@ -19,7 +20,22 @@ def compute_main_rounds(participants_count: int | None) -> int:
     return int(math.ceil(math.log2(participants_count)))
 
 
-def classify_bracket_match(round_number: int, position: int, main_rounds: int) -> MatchClassification:
+@lru_cache(maxsize=4096)
+def classify_bracket_match(
+    round_number: int,
+    position: int,
+    main_rounds: int,
+    bracket_type: str | None = None,
+) -> MatchClassification:
+    if bracket_type == "round_robin":
+        return MatchClassification(
+            is_repechage=False,
+            stage="main",
+            round_type="group",
+            repechage_side=None,
+            repechage_step=None,
+        )
+
     is_repechage = main_rounds > 0 and round_number > main_rounds
     if is_repechage:
         return MatchClassification(
@@ -0,0 +1,205 @@
+from collections.abc import Callable, Hashable, Iterable
+from dataclasses import dataclass, replace
+
+from champion_domain.use_cases.bracket_index import BracketIndex
+from champion_domain.use_cases.finish_flow import decide_finish_flow_post, decide_finish_flow_runtime
+from champion_domain.use_cases.placements import (
+    BracketPlacements,
+    advance_bracket_placements,
+    compute_bracket_placements,
+)
+from champion_domain.use_cases.repechage_runtime import plan_repechage_generation, should_generate_repechage
+
+
+@dataclass(frozen=True)
+class RuntimeMatch[K: Hashable]:
+    key: K
+    round_number: int
+    position: int
+    stage: str
+    status: str
+    athlete1_id: int | None
+    athlete2_id: int | None
+    winner_id: int | None
+    next_slot: int | None = None
+    repechage_side: str | None = None
+    repechage_step: int | None = None
+
+
+@dataclass(frozen=True)
+class BracketChangeSet[K: Hashable]:
+    updated: list[RuntimeMatch[K]]
+    inserted: list[RuntimeMatch[K]]
+    bracket_status: str | None
+    finish_bracket: bool
+    placements: BracketPlacements
+    generated_repechage: bool
+    publish_structure: bool
+
+
+class BracketRuntime[K: Hashable]:
+    def __init__(
+        self,
+        bracket_type: str,
+        status: str | None,
+        matches: Iterable[RuntimeMatch[K]],
+        *,
+        new_key: Callable[[], K],
+        allow_implicit_main_slot: bool = False,
+        repechage_stage_value: str = "repechage",
+        finished_status_value: str = "finished",
+        not_started_status_value: str = "not_started",
+        placements: BracketPlacements | None = None,
+    ) -> None:
+        self.bracket_type = bracket_type
+        self.status = status
+        self.new_key = new_key
+        self.allow_implicit_main_slot = allow_implicit_main_slot
+        self.repechage_stage_value = repechage_stage_value
+        self.finished_status_value = finished_status_value
+        self.not_started_status_value = not_started_status_value
+        self._matches: dict[K, RuntimeMatch[K]] = {}
+        self.index: BracketIndex[RuntimeMatch[K]] = BracketIndex(
+            (),
+            repechage_stage_value=repechage_stage_value,
+            finished_status_value=finished_status_value,
+        )
+        self.finished_count = 0
+        for match in matches:
+            self._add(match)
+        self._placements = placements
+
+    @property
+    def matches(self) -> list[RuntimeMatch[K]]:
+        return list(self._matches.values())
+
+    def get(self, key: K) -> RuntimeMatch[K] | None:
+        return self._matches.get(key)
+
+    def placements(self) -> BracketPlacements:
+        if self._placements is None:
+            self._placements = compute_bracket_placements(index=self.index)
+        return self._placements
+
+    def apply_result(self, key: K, winner_id: int | None, *, origin: str = "local") -> BracketChangeSet[K]:
+        current = self._matches.get(key)
+        if current is None:
+            raise ValueError("match_not_in_bracket")
+
+        updated: dict[K, RuntimeMatch[K]] = {}
+        finished = replace(current, status=self.finished_status_value, winner_id=winner_id)
+        self._replace(current, finished, updated)
+
+        runtime = decide_finish_flow_runtime(
+            origin=origin,
+            stage=finished.stage,
+            current_round_number=finished.round_number,
+            current_position=finished.position,
+            explicit_next_slot=finished.next_slot,
+            repechage_side=finished.repechage_side,
+            repechage_step=finished.repechage_step,
+            allow_implicit_main_slot=self.allow_implicit_main_slot,
+            main_rounds=self.index.main_rounds,
+            repechage_stage_value=self.repechage_stage_value,
+        )
+        action = runtime.progression_action
+        if action is not None and winner_id is not None:
+            target = self.index.progression_target(action)
+            if target is not None:
+                if action.kind == "repechage" or action.slot == 1:
+                    self._replace(target, replace(target, athlete1_id=winner_id), updated)
+                else:
+                    self._replace(target, replace(target, athlete2_id=winner_id), updated)
+
+        inserted = self._generate_repechage() if runtime.attempt_generate_repechage else []
+
+        post = decide_finish_flow_post(
+            is_repechage_match=finished.stage == self.repechage_stage_value,
+            generated_repechage=bool(inserted),
+            total_matches=len(self._matches),
+            finished_matches=self.finished_count,
+            current_bracket_status=self.status,
+            finished_status_value=self.finished_status_value,
+        )
+        if post.completion.should_finish_bracket:
+            self.status = self.finished_status_value
+
+        return BracketChangeSet(
+            updated=list(updated.values()),
+            inserted=inserted,
+            bracket_status=self.status,
+            finish_bracket=post.completion.should_finish_bracket,
+            placements=self.placements(),
+            generated_repechage=bool(inserted),
+            publish_structure=post.publish_structure,
+        )
+
+    def _generate_repechage(self) -> list[RuntimeMatch[K]]:
+        final_match = self.index.final_match()
+        if final_match is None:
+            return []
+        finalist_a_id = final_match.athlete1_id
+        finalist_b_id = final_match.athlete2_id
+        if finalist_a_id is None or finalist_b_id is None:
+            return []
+        if not should_generate_repechage(
+            bracket_type=self.bracket_type,
+            main_rounds=self.index.main_rounds,
+            has_repechage_matches=self.index.has_repechage_matches,
+            finalist_a_id=finalist_a_id,
+            finalist_b_id=finalist_b_id,
+        ):
+            return []
+
+        generation = plan_repechage_generation(
+            finalist_a_id=finalist_a_id,
+            finalist_b_id=finalist_b_id,
+            base_round=self.index.max_round + 1,
+            index=self.index,
+        )
+        inserted: list[RuntimeMatch[K]] = []
+        for plan in generation.plans:
+            match = RuntimeMatch(
+                key=self.new_key(),
+                round_number=plan.round_number,
+                position=plan.position,
+                stage=self.repechage_stage_value,
+                status=self.not_started_status_value,
+                athlete1_id=plan.athlete1_id,
+                athlete2_id=plan.athlete2_id,
+                winner_id=None,
+                next_slot=1 if plan.step < generation.max_step_by_side.get(plan.side, plan.step) else None,
+                repechage_side=plan.side,
+                repechage_step=plan.step,
+            )
+            self._add(match)
+            inserted.append(match)
+        return inserted
+
+    def _add(self, match: RuntimeMatch[K]) -> None:
+        self._placements = None
+        self._matches[match.key] = match
+        self.index.add(match)
+        if match.status == self.finished_status_value:
+            self.finished_count += 1
+
+    def _replace(
+        self,
+        previous: RuntimeMatch[K],
+        changed: RuntimeMatch[K],
+        updated: dict[K, RuntimeMatch[K]],
+    ) -> None:
+        self._matches[changed.key] = changed
+        updated[changed.key] = changed
+        self.index.replace(previous, changed)
+        if self._placements is not None:
+            self._placements = advance_bracket_placements(
+                self._placements,
+                previous,
+                changed,
+                self.index,
+                finished_status_value=self.finished_status_value,
+            )
+        self.finished_count += (changed.status == self.finished_status_value) - (
+            previous.status == self.finished_status_value
+        )
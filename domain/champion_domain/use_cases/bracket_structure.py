@@ -0,0 +1,217 @@
+from array import array
+from collections.abc import Iterable, Iterator
+from datetime import datetime
+from uuid import UUID
+
+from champion_domain.use_cases.bracket_labels import classify_bracket_match
+from champion_domain.use_cases.bracket_rebuild import PlannedMatch
+from champion_domain.use_cases.structure_rebuild import StructureMatch
+
+_NONE = -1
+
+
+def _pack(value: int | None) -> int:
+    return _NONE if value is None else value
+
+
+def _unpack(value: int) -> int | None:
+    return None if value == _NONE else value
+
+
+class BracketStructure:
+    __slots__ = (
+        "ids",
+        "round_numbers",
+        "positions",
+        "next_slots",
+        "athlete1_ids",
+        "athlete2_ids",
+        "winner_ids",
+        "score_athlete1",
+        "score_athlete2",
+        "status_codes",
+        "stage_codes",
+        "repechage_side_codes",
+        "repechage_steps",
+        "started_at",
+        "ended_at",
+        "_codes",
+        "_names",
+    )
+
+    def __init__(self) -> None:
+        self.ids: list[str] = []
+        self.round_numbers = array("i")
+        self.positions = array("i")
+        self.next_slots = array("b")
+        self.athlete1_ids = array("q")
+        self.athlete2_ids = array("q")
+        self.winner_ids = array("q")
+        self.score_athlete1 = array("i")
+        self.score_athlete2 = array("i")
+        self.status_codes = array("b")
+        self.stage_codes = array("b")
+        self.repechage_side_codes = array("b")
+        self.repechage_steps = array("i")
+        self.started_at: list[datetime | None] = []
+        self.ended_at: list[datetime | None] = []
+        self._codes: dict[str, int] = {}
+        self._names: list[str] = []
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def __iter__(self) -> Iterator["BracketRow"]:
+        return (BracketRow(self, index) for index in range(len(self.ids)))
+
+    def row(self, index: int) -> "BracketRow":
+        if not 0 <= index < len(self.ids):
+            raise IndexError(index)
+        return BracketRow(self, index)
+
+    def code(self, name: str | None) -> int:
+        if name is None:
+            return _NONE
+        code = self._codes.get(name)
+        if code is None:
+            code = len(self._names)
+            self._codes[name] = code
+            self._names.append(name)
+        return code
+
+    def name(self, code: int) -> str | None:
+        return None if code == _NONE else self._names[code]
+
+    def append(
+        self,
+        *,
+        id: str | UUID,
+        round_number: int,
+        position: int,
+        status: str,
+        next_slot: int | None = None,
+        athlete1_id: int | None = None,
+        athlete2_id: int | None = None,
+        winner_id: int | None = None,
+        score_athlete1: int | None = None,
+        score_athlete2: int | None = None,
+        stage: str = "main",
+        repechage_side: str | None = None,
+        repechage_step: int | None = None,
+        started_at: datetime | None = None,
+        ended_at: datetime | None = None,
+    ) -> None:
+        self.ids.append(str(id))
+        self.round_numbers.append(round_number)
+        self.positions.append(position)
+        self.next_slots.append(_pack(next_slot))
+        self.athlete1_ids.append(_pack(athlete1_id))
+        self.athlete2_ids.append(_pack(athlete2_id))
+        self.winner_ids.append(_pack(winner_id))
+        self.score_athlete1.append(_pack(score_athlete1))
+        self.score_athlete2.append(_pack(score_athlete2))
+        self.status_codes.append(self.code(status))
+        self.stage_codes.append(self.code(stage))
+        self.repechage_side_codes.append(self.code(repechage_side))
+        self.repechage_steps.append(_pack(repechage_step))
+        self.started_at.append(started_at)
+        self.ended_at.append(ended_at)
+
+    @classmethod
+    def from_planned(cls, planned: Iterable[PlannedMatch], ids: Iterable[str | UUID]) -> "BracketStructure":
+        structure = cls()
+        for item, match_id in zip(planned, ids, strict=True):
+            structure.append(
+                id=match_id,
+                round_number=item.round_number,
+                position=item.position,
+                status=item.status,
+                next_slot=item.next_slot,
+                athlete1_id=item.athlete1_id,
+                athlete2_id=item.athlete2_id,
+                winner_id=item.winner_id,
+            )
+        return structure
+
+    def to_structure_matches(self, main_rounds: int, bracket_type: str | None = None) -> list[StructureMatch]:
+        matches: list[StructureMatch] = []
+        for index in range(len(self.ids)):
+            round_number = self.round_numbers[index]
+            position = self.positions[index]
+            classification = classify_bracket_match(round_number, position, main_rounds, bracket_type)
+            matches.append(
+                StructureMatch(
+                    id=UUID(self.ids[index]),
+                    round_number=round_number,
+                    position=position,
+                    next_slot=_unpack(self.next_slots[index]),
+                    round_type=classification.round_type,
+                    stage=classification.stage,
+                    status=self._names[self.status_codes[index]],
+                    athlete1_id=_unpack(self.athlete1_ids[index]),
+                    athlete2_id=_unpack(self.athlete2_ids[index]),
+                    winner_id=_unpack(self.winner_ids[index]),
+                    score_athlete1=_unpack(self.score_athlete1[index]),
+                    score_athlete2=_unpack(self.score_athlete2[index]),
+                    repechage_side=classification.repechage_side,
+                    repechage_step=classification.repechage_step,
+                    started_at=self.started_at[index],
+                    ended_at=self.ended_at[index],
+                )
+            )
+        return matches
+
+
+class BracketRow:
+    __slots__ = ("_structure", "_index")
+
+    def __init__(self, structure: BracketStructure, index: int) -> None:
+        self._structure = structure
+        self._index = index
+
+    def __repr__(self) -> str:
+        return f"BracketRow(id={self.id!r}, round_number={self.round_number}, position={self.position})"
+
+    @property
+    def id(self) -> str:
+        return self._structure.ids[self._index]
+
+    @property
+    def round_number(self) -> int:
+        return self._structure.round_numbers[self._index]
+
+    @property
+    def position(self) -> int:
+        return self._structure.positions[self._index]
+
+    @property
+    def next_slot(self) -> int | None:
+        return _unpack(self._structure.next_slots[self._index])
+
+    @property
+    def athlete1_id(self) -> int | None:
+        return _unpack(self._structure.athlete1_ids[self._index])
+
+    @property
+    def athlete2_id(self) -> int | None:
+        return _unpack(self._structure.athlete2_ids[self._index])
+
+    @property
+    def winner_id(self) -> int | None:
+        return _unpack(self._structure.winner_ids[self._index])
+
+    @property
+    def status(self) -> str:
+        return self._structure._names[self._structure.status_codes[self._index]]
+
+    @property
+    def stage(self) -> str:
+        return self._structure._names[self._structure.stage_codes[self._index]]
+
+    @property
+    def repechage_side(self) -> str | None:
+        return self._structure.name(self._structure.repechage_side_codes[self._index])
+
+    @property
+    def repechage_step(self) -> int | None:
+        return _unpack(self._structure.repechage_steps[self._index])
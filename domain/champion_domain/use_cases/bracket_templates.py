@@ -0,0 +1,86 @@
+import math
+from dataclasses import dataclass, replace
+from functools import lru_cache
+
+from champion_domain.bracket_generation import bye_layout, get_round_type
+from champion_domain.use_cases.bracket_labels import compute_main_rounds
+from champion_domain.use_cases.match_progression import compute_advancement_target
+
+SINGLE_ELIMINATION_TEMPLATE_CACHE_SIZE = 256
+
+
+@dataclass(frozen=True)
+class TemplateMatch:
+    round_number: int
+    position: int
+    round_type: str
+    athlete1_index: int | None
+    athlete2_index: int | None
+    status: str
+    winner_index: int | None
+    next_slot: int | None
+
+
+@dataclass(frozen=True)
+class SingleEliminationTemplate:
+    participants_count: int
+    total_rounds: int
+    main_rounds: int
+    rounds: tuple[tuple[TemplateMatch, ...], ...]
+    resolved_rounds: tuple[tuple[TemplateMatch, ...], ...]
+
+
+@lru_cache(maxsize=SINGLE_ELIMINATION_TEMPLATE_CACHE_SIZE)
+def single_elimination_template(participants_count: int) -> SingleEliminationTemplate:
+    next_power_of_two = 2 ** math.ceil(math.log2(max(participants_count, 2)))
+    total_rounds = int(math.log2(next_power_of_two))
+    main_rounds = compute_main_rounds(participants_count)
+
+    rounds: list[list[TemplateMatch]] = []
+    for round_number in range(1, total_rounds + 1):
+        round_type = get_round_type(round_number - 1, total_rounds)
+        next_slot_enabled = round_number < total_rounds
+        round_items: list[TemplateMatch] = []
+        if round_number == 1:
+            pairs = bye_layout(participants_count)
+        else:
+            pairs = tuple((None, None) for _ in range(2 ** (total_rounds - round_number)))
+        for position, (first, second) in enumerate(pairs, start=1):
+            bye = (first is None) != (second is None)
+            round_items.append(
+                TemplateMatch(
+                    round_number=round_number,
+                    position=position,
+                    round_type=round_type,
+                    athlete1_index=first,
+                    athlete2_index=second,
+                    status="finished" if bye else "not_started",
+                    winner_index=(first if first is not None else second) if bye else None,
+                    next_slot=(1 if position % 2 == 1 else 2) if next_slot_enabled else None,
+                )
+            )
+        rounds.append(round_items)
+
+    resolved = [list(round_items) for round_items in rounds]
+    for current in rounds[0] if total_rounds > 1 else ():
+        if current.status != "finished" or current.winner_index is None:
+            continue
+        target = compute_advancement_target(
+            current_round_number=current.round_number,
+            current_position=current.position,
+            explicit_next_slot=current.next_slot,
+        )
+        next_round = resolved[target.round_number - 1]
+        next_match = next_round[target.position - 1]
+        if target.slot == 1:
+            next_round[target.position - 1] = replace(next_match, athlete1_index=current.winner_index)
+        else:
+            next_round[target.position - 1] = replace(next_match, athlete2_index=current.winner_index)
+
+    return SingleEliminationTemplate(
+        participants_count=participants_count,
+        total_rounds=total_rounds,
+        main_rounds=main_rounds,
+        rounds=tuple(tuple(round_items) for round_items in rounds),
+        resolved_rounds=tuple(tuple(round_items) for round_items in resolved),
+    )
@@ -1,9 +1,11 @@
+from collections.abc import Iterable
 from dataclasses import dataclass
 
 from champion_domain.match_results import final_loser_id, match_loser_id
+from champion_domain.use_cases.bracket_index import BracketIndex, IndexableMatch, structural_key
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class PlacementMatchInput:
     round_number: int
     stage: str
@@ -13,6 +15,7 @@ class PlacementMatchInput:
     athlete2_id: int | None
     repechage_side: str | None
     repechage_step: int | None
+    position: int | None = None
 
 
 @dataclass(frozen=True)
@@ -23,62 +26,32 @@ class BracketPlacements:
     place_3_b_id: int | None
 
 
-def compute_bracket_placements(
-    rows: list[PlacementMatchInput],
-    *,
-    repechage_stage_value: str = "repechage",
-    finished_status_value: str = "finished",
-) -> BracketPlacements:
-    if not rows:
-        return BracketPlacements(None, None, None, None)
+_UNDECIDED = BracketPlacements(None, None, None, None)
 
-    main_rows = [row for row in rows if row.stage != repechage_stage_value]
-    if not main_rows:
-        return BracketPlacements(None, None, None, None)
 
-    final_round = max(row.round_number for row in main_rows)
-    final_match = next((row for row in main_rows if row.round_number == final_round), None)
-    if final_match is None:
-        return BracketPlacements(None, None, None, None)
-
-    if final_match.status != finished_status_value or final_match.winner_id is None:
-        return BracketPlacements(None, None, None, None)
-
-    place_1_id = final_match.winner_id
-    place_2_id = final_loser_id(final_match)
-
-    def direct_bronze_from_main_side(finalist_id: int) -> int | None:
-        losses: list[tuple[int, int]] = []
-        for row in main_rows:
-            if row.round_number >= final_round:
-                continue
-            if row.status != finished_status_value:
-                continue
-            if row.winner_id != finalist_id:
-                continue
-            loser_id = match_loser_id(row)
-            if loser_id is None:
-                continue
-            losses.append((row.round_number, loser_id))
-        if len(losses) != 1:
-            return None
-        return losses[0][1]
-
-    def bronze_from_repechage_side(side: str, finalist_id: int) -> int | None:
-        side_rows = [row for row in rows if row.stage == repechage_stage_value and row.repechage_side == side]
-        if not side_rows:
-            return direct_bronze_from_main_side(finalist_id)
-
-        last_match = sorted(side_rows, key=lambda row: row.repechage_step or 0)[-1]
-        if last_match.status != finished_status_value:
-            return None
-        return last_match.winner_id
-
-    finalist_a = final_match.athlete1_id
-    finalist_b = final_match.athlete2_id
-    place_3_a_id = bronze_from_repechage_side("A", finalist_a) if finalist_a is not None else None
-    place_3_b_id = bronze_from_repechage_side("B", finalist_b) if finalist_b is not None else None
+def _direct_bronze[T: IndexableMatch](index: BracketIndex[T], finalist_id: int) -> int | None:
+    losers = [
+        match_loser_id(row) for row in index.main_matches_won_by(finalist_id) if row.round_number < index.main_rounds
+    ]
+    if len(losers) != 1:
+        return None
+    return losers[0]
+
+
+def _side_bronze[T: IndexableMatch](index: BracketIndex[T], side: str, finalist_id: int | None) -> int | None:
+    if finalist_id is None:
+        return None
+    last_match = index.last_repechage_match(side)
+    if last_match is None:
+        return _direct_bronze(index, finalist_id)
+    if not index.is_finished(last_match):
+        return None
+    return last_match.winner_id
 
+
+def _podium(
+    place_1_id: int | None, place_2_id: int | None, place_3_a_id: int | None, place_3_b_id: int | None
+) -> BracketPlacements:
     occupied = {place_1_id, place_2_id}
     if place_3_a_id in occupied:
         place_3_a_id = None
@@ -91,3 +64,113 @@ def compute_bracket_placements(
         place_3_a_id=place_3_a_id,
         place_3_b_id=place_3_b_id,
     )
+
+
+def _decided_final[T: IndexableMatch](index: BracketIndex[T]) -> T | None:
+    final_match = index.final_match()
+    if final_match is None or not index.is_finished(final_match) or final_match.winner_id is None:
+        return None
+    return final_match
+
+
+def compute_bracket_placements[T: IndexableMatch](
+    rows: Iterable[T] = (),
+    *,
+    repechage_stage_value: str = "repechage",
+    finished_status_value: str = "finished",
+    index: BracketIndex[T] | None = None,
+) -> BracketPlacements:
+    if index is None:
+        index = BracketIndex(
+            rows,
+            repechage_stage_value=repechage_stage_value,
+            finished_status_value=finished_status_value,
+        )
+
+    final_match = _decided_final(index)
+    if final_match is None:
+        return _UNDECIDED
+
+    return _podium(
+        final_match.winner_id,
+        final_loser_id(final_match),
+        _side_bronze(index, "A", final_match.athlete1_id),
+        _side_bronze(index, "B", final_match.athlete2_id),
+    )
+
+
+def _changes_result(previous: IndexableMatch, changed: IndexableMatch, finished_status_value: str) -> bool:
+    return (
+        (previous.status == finished_status_value) != (changed.status == finished_status_value)
+        or previous.winner_id != changed.winner_id
+        or previous.athlete1_id != changed.athlete1_id
+        or previous.athlete2_id != changed.athlete2_id
+    )
+
+
+def advance_bracket_placements[T: IndexableMatch](
+    current: BracketPlacements,
+    previous: T | None,
+    changed: T,
+    index: BracketIndex[T] | None = None,
+    *,
+    finished_status_value: str = "finished",
+) -> BracketPlacements | None:
+    # ``index`` must already contain ``changed``. Returns None when only a full recompute can answer.
+    if previous is None or structural_key(previous) != structural_key(changed):
+        return None
+    if not _changes_result(previous, changed, finished_status_value):
+        return current
+    # An undecided final keeps the podium empty until a finished match could be the final itself.
+    if current.place_1_id is None and changed.status != finished_status_value:
+        return current
+    if index is None:
+        return None
+
+    final_match = index.final_match()
+    if final_match is None:
+        return _UNDECIDED
+    if structural_key(final_match) == structural_key(changed):
+        if changed.status != finished_status_value or changed.winner_id is None:
+            return _UNDECIDED
+        return _podium(
+            changed.winner_id,
+            final_loser_id(changed),
+            _side_bronze(index, "A", changed.athlete1_id),
+            _side_bronze(index, "B", changed.athlete2_id),
+        )
+
+    decided = _decided_final(index)
+    if decided is None:
+        return _UNDECIDED
+    finalist_a_id = decided.athlete1_id
+    finalist_b_id = decided.athlete2_id
+
+    if index.is_repechage(changed):
+        last_match = index.last_repechage_match(changed.repechage_side) if changed.repechage_side else None
+        if last_match is None or structural_key(last_match) != structural_key(changed):
+            return current
+        bronze = changed.winner_id if changed.status == finished_status_value else None
+        if changed.repechage_side == "A":
+            return _podium(
+                current.place_1_id,
+                current.place_2_id,
+                bronze if finalist_a_id is not None else None,
+                _side_bronze(index, "B", finalist_b_id),
+            )
+        return _podium(
+            current.place_1_id,
+            current.place_2_id,
+            _side_bronze(index, "A", finalist_a_id),
+            bronze if finalist_b_id is not None else None,
+        )
+
+    # Earlier main matches only matter for a direct bronze, i.e. a match won by a finalist.
+    if {previous.winner_id, changed.winner_id}.isdisjoint({finalist_a_id, finalist_b_id} - {None}):
+        return current
+    return _podium(
+        current.place_1_id,
+        current.place_2_id,
+        _side_bronze(index, "A", finalist_a_id),
+        _side_bronze(index, "B", finalist_b_id),
+    )
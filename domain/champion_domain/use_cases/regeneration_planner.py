@@ -1,7 +1,13 @@
+from collections.abc import Iterable
+from concurrent.futures import Executor
+from dataclasses import dataclass
+
 from champion_domain.use_cases.bracket_rebuild import PlannedMatch
 from champion_domain.use_cases.round_robin import SeededParticipant, plan_round_robin_bracket
 from champion_domain.use_cases.single_elimination import plan_single_elimination_bracket
 
+SUPPORTED_BRACKET_TYPES = frozenset({"single_elimination", "round_robin"})
+
 
 def plan_bracket_matches(bracket_type: str, participants: list[SeededParticipant]) -> list[PlannedMatch]:
     ordered = sorted(participants, key=lambda item: item.seed)
@@ -28,3 +34,39 @@ def plan_bracket_matches(bracket_type: str, participants: list[SeededParticipant
         ]
 
     raise ValueError("unsupported_bracket_type")
+
+
+@dataclass(frozen=True, slots=True)
+class BracketPlanRequest[K]:
+    key: K
+    bracket_type: str
+    participants: tuple[SeededParticipant, ...]
+
+
+@dataclass(frozen=True, slots=True)
+class BracketPlan[K]:
+    key: K
+    bracket_type: str
+    matches: tuple[PlannedMatch, ...]
+
+
+def _plan_request[K](request: BracketPlanRequest[K]) -> BracketPlan[K]:
+    if sum(1 for item in request.participants if item.athlete_id is not None) < 2:
+        return BracketPlan(key=request.key, bracket_type=request.bracket_type, matches=())
+    matches = plan_bracket_matches(request.bracket_type, list(request.participants))
+    return BracketPlan(key=request.key, bracket_type=request.bracket_type, matches=tuple(matches))
+
+
+def plan_tournament_brackets[K](
+    requests: Iterable[BracketPlanRequest[K]],
+    *,
+    executor: Executor | None = None,
+    chunksize: int = 16,
+) -> list[BracketPlan[K]]:
+    items = list(requests)
+    for item in items:
+        if item.bracket_type not in SUPPORTED_BRACKET_TYPES:
+            raise ValueError("unsupported_bracket_type")
+    if executor is None:
+        return [_plan_request(item) for item in items]
+    return list(executor.map(_plan_request, items, chunksize=chunksize))
@@ -1,9 +1,11 @@
 from dataclasses import dataclass
+from typing import Any, Protocol
 
 from champion_domain.match_results import match_loser_id
+from champion_domain.use_cases.bracket_index import BracketIndex
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class FinishedMainMatch:
     round_number: int
     winner_id: int | None
@@ -11,6 +13,20 @@ class FinishedMainMatch:
     athlete2_id: int | None
 
 
+class SupportsFinishedMainMatch(Protocol):
+    @property
+    def round_number(self) -> int: ...
+
+    @property
+    def winner_id(self) -> int | None: ...
+
+    @property
+    def athlete1_id(self) -> int | None: ...
+
+    @property
+    def athlete2_id(self) -> int | None: ...
+
+
 @dataclass(frozen=True)
 class PlannedRepechageMatch:
     side: str
@@ -47,20 +63,29 @@ def compute_repechage_advance_target(side: str | None, step: int | None) -> Repe
 def build_repechage_plan(
     finalist_a_id: int,
     finalist_b_id: int,
-    finished_main_matches: list[FinishedMainMatch],
-    base_round: int,
+    finished_main_matches: list[FinishedMainMatch] | None = None,
+    base_round: int = 1,
+    *,
+    index: BracketIndex[Any] | None = None,
 ) -> list[PlannedRepechageMatch]:
     plans: list[PlannedRepechageMatch] = []
 
+    wins_by_finalist: dict[int, list[SupportsFinishedMainMatch]] = {finalist_a_id: [], finalist_b_id: []}
+    if index is not None:
+        for finalist_id, wins in wins_by_finalist.items():
+            wins.extend(row for row in index.main_matches_won_by(finalist_id) if row.round_number < index.main_rounds)
+    else:
+        for item in finished_main_matches or []:
+            if item.winner_id in wins_by_finalist:
+                wins_by_finalist[item.winner_id].append(item)
+
     for side, finalist_id, position in (("A", finalist_a_id, 1), ("B", finalist_b_id, 2)):
         losses: list[tuple[int, int]] = []
-        for item in finished_main_matches:
-            if item.winner_id != finalist_id:
-                continue
-            loser_id = match_loser_id(item.winner_id, item.athlete1_id, item.athlete2_id)
+        for win in wins_by_finalist[finalist_id]:
+            loser_id = match_loser_id(win.winner_id, win.athlete1_id, win.athlete2_id)
             if loser_id is None:
                 continue
-            losses.append((item.round_number, loser_id))
+            losses.append((win.round_number, loser_id))
 
         losses.sort(key=lambda pair: pair[0])
         ordered_losers: list[int] = []
@@ -125,14 +150,17 @@ def should_publish_structure_after_match_finish(
 def plan_repechage_generation(
     finalist_a_id: int,
     finalist_b_id: int,
-    finished_main_matches: list[FinishedMainMatch],
-    base_round: int,
+    finished_main_matches: list[FinishedMainMatch] | None = None,
+    base_round: int = 1,
+    *,
+    index: BracketIndex[Any] | None = None,
 ) -> RepechageGenerationResult:
     plans = build_repechage_plan(
         finalist_a_id=finalist_a_id,
         finalist_b_id=finalist_b_id,
         finished_main_matches=finished_main_matches,
         base_round=base_round,
+        index=index,
     )
     max_step_by_side: dict[str, int] = {}
     for plan in plans:
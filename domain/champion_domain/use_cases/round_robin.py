@@ -1,3 +1,4 @@
+from collections.abc import Iterator
 from dataclasses import dataclass
 
 
@@ -16,9 +17,9 @@ class PlannedRoundRobinMatch:
     round_type: str = "group"
 
 
-def plan_round_robin_bracket(participants: list[SeededParticipant]) -> list[PlannedRoundRobinMatch]:
+def iter_round_robin_rounds(participants: list[SeededParticipant]) -> Iterator[list[PlannedRoundRobinMatch]]:
     if len(participants) < 2:
-        return []
+        return
 
     ordered = list(participants)
     participant_count = len(ordered)
@@ -26,30 +27,35 @@ def plan_round_robin_bracket(participants: list[SeededParticipant]) -> list[Plan
         ordered.append(SeededParticipant(seed=participant_count + 1, athlete_id=None))
         participant_count += 1
 
-    players = list(range(participant_count))
-    planned: list[PlannedRoundRobinMatch] = []
-    position = 1
+    rotating = participant_count - 1
+    mid = participant_count // 2
+
+    def player_at(slot: int, round_index: int) -> SeededParticipant:
+        if slot == 0:
+            return ordered[0]
+        return ordered[1 + (slot - 1 - round_index) % rotating]
 
-    for _ in range(participant_count - 1):
-        mid = participant_count // 2
+    position = 1
+    for round_index in range(rotating):
+        planned: list[PlannedRoundRobinMatch] = []
         for idx in range(mid):
-            p1_idx, p2_idx = players[idx], players[participant_count - 1 - idx]
-            p1 = ordered[p1_idx]
-            p2 = ordered[p2_idx]
+            p1 = player_at(idx, round_index)
+            p2 = player_at(participant_count - 1 - idx, round_index)
             if p1.athlete_id is None or p2.athlete_id is None:
                 continue
             athlete1_id = p1.athlete_id if p1.seed < p2.seed else p2.athlete_id
             athlete2_id = p2.athlete_id if p1.seed < p2.seed else p1.athlete_id
             planned.append(
                 PlannedRoundRobinMatch(
-                    round_number=1,
+                    round_number=round_index + 1,
                     position=position,
                     athlete1_id=athlete1_id,
                     athlete2_id=athlete2_id,
                 )
             )
             position += 1
+        yield planned
 
-        players = [players[0]] + [players[-1]] + players[1:-1]
 
-    return planned
+def plan_round_robin_bracket(participants: list[SeededParticipant]) -> list[PlannedRoundRobinMatch]:
+    return [match for round_items in iter_round_robin_rounds(participants) for match in round_items]
@@ -1,6 +1,7 @@
 from dataclasses import replace
 
-from champion_domain.use_cases.bracket_rebuild import PlannedMatch, plan_single_elimination
+from champion_domain.use_cases.bracket_rebuild import PlannedMatch, fill_template_rounds
+from champion_domain.use_cases.bracket_templates import single_elimination_template
 from champion_domain.use_cases.match_progression import compute_advancement_target
 
 
@@ -41,4 +42,4 @@ def resolve_bye_advancements(planned_rounds: list[list[PlannedMatch]]) -> list[l
 
 
 def plan_single_elimination_bracket(athlete_ids: list[int]) -> list[list[PlannedMatch]]:
-    return resolve_bye_advancements(plan_single_elimination(athlete_ids))
+    return fill_template_rounds(single_elimination_template(len(athlete_ids)).resolved_rounds, athlete_ids)
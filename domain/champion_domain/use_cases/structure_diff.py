@@ -0,0 +1,84 @@
+from dataclasses import dataclass
+from uuid import UUID
+
+from champion_domain.use_cases.structure_rebuild import StructureMatch, StructureParticipant
+
+
+@dataclass(frozen=True)
+class StructureSnapshot:
+    participants: tuple[StructureParticipant, ...]
+    matches: tuple[StructureMatch, ...]
+
+
+@dataclass(frozen=True)
+class StructurePatch:
+    added_matches: tuple[StructureMatch, ...] = ()
+    changed_matches: tuple[StructureMatch, ...] = ()
+    removed_match_ids: tuple[UUID, ...] = ()
+    added_participants: tuple[StructureParticipant, ...] = ()
+    changed_participants: tuple[StructureParticipant, ...] = ()
+    removed_participant_seeds: tuple[int, ...] = ()
+
+    @property
+    def is_empty(self) -> bool:
+        return not (
+            self.added_matches
+            or self.changed_matches
+            or self.removed_match_ids
+            or self.added_participants
+            or self.changed_participants
+            or self.removed_participant_seeds
+        )
+
+
+def diff_structure_snapshots(old: StructureSnapshot, new: StructureSnapshot) -> StructurePatch:
+    old_matches = {match.id: match for match in old.matches}
+    new_match_ids = {match.id for match in new.matches}
+    old_participants = {participant.seed: participant for participant in old.participants}
+    new_seeds = {participant.seed for participant in new.participants}
+
+    return StructurePatch(
+        added_matches=tuple(match for match in new.matches if match.id not in old_matches),
+        changed_matches=tuple(
+            match for match in new.matches if match.id in old_matches and old_matches[match.id] != match
+        ),
+        removed_match_ids=tuple(match.id for match in old.matches if match.id not in new_match_ids),
+        added_participants=tuple(item for item in new.participants if item.seed not in old_participants),
+        changed_participants=tuple(
+            item for item in new.participants if item.seed in old_participants and old_participants[item.seed] != item
+        ),
+        removed_participant_seeds=tuple(item.seed for item in old.participants if item.seed not in new_seeds),
+    )
+
+
+def apply_structure_patch(snapshot: StructureSnapshot, patch: StructurePatch) -> StructureSnapshot:
+    matches = {match.id: match for match in snapshot.matches}
+    for match_id in patch.removed_match_ids:
+        if matches.pop(match_id, None) is None:
+            raise ValueError("unknown_match")
+    for match in patch.changed_matches:
+        if match.id not in matches:
+            raise ValueError("unknown_match")
+        matches[match.id] = match
+    for match in patch.added_matches:
+        if match.id in matches:
+            raise ValueError("duplicate_match")
+        matches[match.id] = match
+
+    participants = {participant.seed: participant for participant in snapshot.participants}
+    for seed in patch.removed_participant_seeds:
+        if participants.pop(seed, None) is None:
+            raise ValueError("unknown_participant")
+    for participant in patch.changed_participants:
+        if participant.seed not in participants:
+            raise ValueError("unknown_participant")
+        participants[participant.seed] = participant
+    for participant in patch.added_participants:
+        if participant.seed in participants:
+            raise ValueError("duplicate_participant")
+        participants[participant.seed] = participant
+
+    return StructureSnapshot(
+        participants=tuple(sorted(participants.values(), key=lambda item: item.seed)),
+        matches=tuple(sorted(matches.values(), key=lambda item: (item.round_number, item.position))),
+    )
@@ -9,7 +9,7 @@ class StructureParticipant:
     seed: int
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class StructureMatch:
     id: UUID
     round_number: int
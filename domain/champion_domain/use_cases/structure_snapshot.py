@@ -40,11 +40,16 @@ def build_structure_participants(items: Iterable[StructureParticipantInput]) ->
     return [build_structure_participant(item) for item in items]
 
 
-def build_structure_match(input_data: StructureMatchInput, main_rounds: int) -> StructureMatch:
+def build_structure_match(
+    input_data: StructureMatchInput,
+    main_rounds: int,
+    bracket_type: str | None = None,
+) -> StructureMatch:
     classification = classify_bracket_match(
         round_number=input_data.round_number,
         position=input_data.position,
         main_rounds=main_rounds,
+        bracket_type=bracket_type,
     )
     return StructureMatch(
         id=UUID(str(input_data.id)),
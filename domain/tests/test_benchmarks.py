@@ -0,0 +1,45 @@
+import platform
+import unittest
+
+from benchmarks.cases import build_cases
+from benchmarks.runner import Baseline, BenchmarkResult, find_regressions
+
+
+class BenchmarkRunnerTests(unittest.TestCase):
+    def test_case_names_are_unique(self) -> None:
+        names = [case.name for case in build_cases()]
+        self.assertEqual(len(names), len(set(names)))
+
+    def test_find_regressions_uses_threshold(self) -> None:
+        results = [
+            BenchmarkResult(name="fast", number=1, repeat=1, best_ns=110.0, mean_ns=110.0),
+            BenchmarkResult(name="slow", number=1, repeat=1, best_ns=150.0, mean_ns=150.0),
+            BenchmarkResult(name="new", number=1, repeat=1, best_ns=500.0, mean_ns=500.0),
+        ]
+        regressions = find_regressions(results, {"fast": 100.0, "slow": 100.0}, max_regression_percent=25.0)
+        self.assertEqual([item.name for item in regressions], ["slow"])
+        self.assertAlmostEqual(regressions[0].percent, 50.0)
+
+    def test_find_regressions_scales_by_calibration_and_ignores_noise(self) -> None:
+        results = [
+            BenchmarkResult(name="tiny", number=1, repeat=1, best_ns=2_000.0, mean_ns=2_000.0),
+            BenchmarkResult(name="large", number=1, repeat=1, best_ns=180_000.0, mean_ns=180_000.0),
+        ]
+        baseline = {"tiny": 1_000.0, "large": 100_000.0}
+
+        self.assertEqual(
+            [item.name for item in find_regressions(results, baseline, 25.0, noise_floor_ns=5_000.0)], ["large"]
+        )
+        self.assertEqual(find_regressions(results, baseline, 25.0, scale=2.0, noise_floor_ns=5_000.0), [])
+
+    def test_baseline_from_other_environment_is_reported(self) -> None:
+        current = Baseline(platform.python_version(), platform.machine(), 1_000.0, {})
+        other = Baseline("2.7.18", platform.machine(), 1_000.0, {})
+
+        self.assertIsNone(current.environment_mismatch())
+        self.assertIsNotNone(other.environment_mismatch())
+        self.assertAlmostEqual(current.scale_for(1_500.0), 1.5)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,70 @@
+import unittest
+
+from champion_domain.use_cases import (
+    BracketIndex,
+    PlacementMatchInput,
+    ProgressionAction,
+    compute_bracket_placements,
+    plan_repechage_generation,
+)
+
+
+def _rows() -> list[PlacementMatchInput]:
+    return [
+        PlacementMatchInput(1, "main", "finished", 10, 10, 11, None, None, position=1),
+        PlacementMatchInput(1, "main", "finished", 12, 12, 13, None, None, position=2),
+        PlacementMatchInput(1, "main", "finished", 20, 20, 21, None, None, position=3),
+        PlacementMatchInput(1, "main", "finished", 22, 22, 23, None, None, position=4),
+        PlacementMatchInput(2, "main", "finished", 10, 10, 12, None, None, position=1),
+        PlacementMatchInput(2, "main", "finished", 20, 20, 22, None, None, position=2),
+        PlacementMatchInput(3, "main", "finished", 10, 10, 20, None, None, position=1),
+    ]
+
+
+class BracketIndexTests(unittest.TestCase):
+    def test_lookups(self) -> None:
+        rows = _rows()
+        rows.append(PlacementMatchInput(4, "repechage", "not_started", None, 11, 12, "A", 1, position=1))
+        index = BracketIndex(rows)
+
+        self.assertEqual(index.main_rounds, 3)
+        self.assertEqual(index.max_round, 4)
+        self.assertTrue(index.has_repechage_matches)
+        self.assertEqual(index.final_match(), rows[6])
+        self.assertEqual(index.match_at(2, 2), rows[5])
+        self.assertIsNone(index.match_at(4, 1))
+        self.assertEqual(index.repechage_match_at("A", 1), rows[7])
+        self.assertEqual(index.last_repechage_match("A"), rows[7])
+        self.assertIsNone(index.last_repechage_match("B"))
+        self.assertEqual([row.round_number for row in index.main_matches_won_by(10)], [1, 2, 3])
+        self.assertEqual(index.main_matches_won_by(99), [])
+
+    def test_progression_target(self) -> None:
+        rows = _rows()
+        rows.append(PlacementMatchInput(5, "repechage", "not_started", None, None, 13, "A", 2, position=1))
+        index = BracketIndex(rows)
+
+        main_action = ProgressionAction(kind="main", slot=1, main_round_number=2, main_position=1)
+        self.assertEqual(index.progression_target(main_action), rows[4])
+        repechage_action = ProgressionAction(kind="repechage", repechage_side="A", repechage_step=2)
+        self.assertEqual(index.progression_target(repechage_action), rows[7])
+
+    def test_placements_and_repechage_accept_index(self) -> None:
+        index = BracketIndex(_rows())
+
+        self.assertEqual(compute_bracket_placements(index=index), compute_bracket_placements(_rows()))
+        placements = compute_bracket_placements(index=index)
+        self.assertEqual(placements.place_1_id, 10)
+        self.assertEqual(placements.place_2_id, 20)
+        self.assertIsNone(placements.place_3_a_id)
+        self.assertIsNone(placements.place_3_b_id)
+
+        generation = plan_repechage_generation(finalist_a_id=10, finalist_b_id=20, base_round=4, index=index)
+        self.assertEqual(
+            [(plan.side, plan.athlete1_id, plan.athlete2_id) for plan in generation.plans],
+            [("A", 11, 12), ("B", 21, 22)],
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -27,6 +27,13 @@ class BracketLabelsTests(unittest.TestCase):
         self.assertEqual(item.repechage_side, "B")
         self.assertEqual(item.repechage_step, 1)
 
+    def test_classify_round_robin_never_repechage(self) -> None:
+        item = classify_bracket_match(round_number=5, position=9, main_rounds=3, bracket_type="round_robin")
+        self.assertFalse(item.is_repechage)
+        self.assertEqual(item.stage, "main")
+        self.assertEqual(item.round_type, "group")
+        self.assertIsNone(item.repechage_side)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -2,6 +2,7 @@ import unittest
 
 from champion_domain.use_cases import (
     SeededParticipant,
+    iter_round_robin_rounds,
     plan_round_robin_bracket,
     plan_single_elimination,
     plan_single_elimination_bracket,
@@ -35,6 +36,18 @@ class BracketRegenerationTests(unittest.TestCase):
         )
         self.assertEqual(len(planned), 3)
 
+    def test_iter_round_robin_rounds_numbers_rounds(self) -> None:
+        participants = [SeededParticipant(seed=seed, athlete_id=100 + seed) for seed in range(1, 6)]
+        rounds = list(iter_round_robin_rounds(participants))
+        self.assertEqual(len(rounds), 5)
+        for round_number, round_items in enumerate(rounds, start=1):
+            self.assertEqual(len(round_items), 2)
+            self.assertTrue(all(item.round_number == round_number for item in round_items))
+            athletes = [athlete for item in round_items for athlete in (item.athlete1_id, item.athlete2_id)]
+            self.assertEqual(len(athletes), len(set(athletes)))
+        positions = [item.position for round_items in rounds for item in round_items]
+        self.assertEqual(positions, list(range(1, 11)))
+
     def test_resolve_bye_advancements(self) -> None:
         rounds = plan_single_elimination([101, 102, 103])
         updated = resolve_bye_advancements(rounds)
@@ -0,0 +1,91 @@
+import itertools
+import unittest
+
+from champion_domain.use_cases import (
+    BracketRuntime,
+    RuntimeMatch,
+    compute_bracket_placements,
+    plan_single_elimination_bracket,
+)
+
+
+def _runtime(athlete_count: int) -> BracketRuntime[str]:
+    keys = (f"new-{number}" for number in itertools.count(1))
+    matches = [
+        RuntimeMatch(
+            key=f"{planned.round_number}-{planned.position}",
+            round_number=planned.round_number,
+            position=planned.position,
+            stage="main",
+            status=planned.status,
+            athlete1_id=planned.athlete1_id,
+            athlete2_id=planned.athlete2_id,
+            winner_id=planned.winner_id,
+            next_slot=planned.next_slot,
+        )
+        for round_items in plan_single_elimination_bracket(list(range(1, athlete_count + 1)))
+        for planned in round_items
+    ]
+    return BracketRuntime("single_elimination", "started", matches, new_key=lambda: next(keys))
+
+
+def _finish_with_athlete1(runtime: BracketRuntime[str], key: str) -> None:
+    match = runtime.get(key)
+    assert match is not None
+    runtime.apply_result(key, match.athlete1_id)
+
+
+class BracketRuntimeTests(unittest.TestCase):
+    def test_progression_updates_next_match(self) -> None:
+        runtime = _runtime(4)
+        changes = runtime.apply_result("1-2", 4)
+
+        self.assertEqual([match.key for match in changes.updated], ["1-2", "2-1"])
+        self.assertEqual(changes.updated[1].athlete2_id, 4)
+        self.assertEqual(changes.inserted, [])
+        self.assertFalse(changes.finish_bracket)
+
+    def test_repechage_generated_once_finalists_known(self) -> None:
+        runtime = _runtime(8)
+        for key in ("1-1", "1-2", "1-3", "1-4", "2-1"):
+            _finish_with_athlete1(runtime, key)
+        changes = runtime.apply_result("2-2", 5)
+
+        self.assertTrue(changes.generated_repechage)
+        self.assertTrue(changes.publish_structure)
+        inserted = [
+            (match.key, match.round_number, match.repechage_side, match.athlete1_id, match.athlete2_id)
+            for match in changes.inserted
+        ]
+        self.assertEqual(inserted, [("new-1", 4, "A", 2, 3), ("new-2", 4, "B", 6, 7)])
+
+    def test_bracket_finishes_with_placements(self) -> None:
+        runtime = _runtime(8)
+        for key in ("1-1", "1-2", "1-3", "1-4", "2-1", "2-2", "new-1", "new-2"):
+            _finish_with_athlete1(runtime, key)
+        changes = runtime.apply_result("3-1", 5)
+
+        self.assertTrue(changes.finish_bracket)
+        self.assertEqual(changes.bracket_status, "finished")
+        self.assertEqual(changes.placements.place_1_id, 5)
+        self.assertEqual(changes.placements.place_2_id, 1)
+        self.assertEqual(changes.placements.place_3_a_id, 2)
+        self.assertEqual(changes.placements.place_3_b_id, 6)
+
+    def test_corrected_final_advances_cached_placements(self) -> None:
+        runtime = _runtime(4)
+        for key in ("1-1", "1-2", "2-1"):
+            _finish_with_athlete1(runtime, key)
+        changes = runtime.apply_result("2-1", 3)
+
+        self.assertEqual(changes.placements.place_1_id, 3)
+        self.assertEqual(changes.placements.place_2_id, 1)
+        self.assertEqual(changes.placements, compute_bracket_placements(runtime.matches))
+
+    def test_unknown_match_is_rejected(self) -> None:
+        with self.assertRaises(ValueError):
+            _runtime(4).apply_result("9-9", 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
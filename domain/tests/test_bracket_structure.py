@@ -0,0 +1,102 @@
+import unittest
+from uuid import uuid4
+
+from champion_domain.use_cases import (
+    BracketIndex,
+    BracketStructure,
+    PlacementMatchInput,
+    StructureMatchInput,
+    build_structure_match,
+    compute_bracket_placements,
+    plan_repechage_generation,
+    plan_single_elimination_bracket,
+)
+
+
+def _finished_structure() -> BracketStructure:
+    structure = BracketStructure()
+    for round_number, position, athlete1_id, athlete2_id in (
+        (1, 1, 10, 11),
+        (1, 2, 12, 13),
+        (1, 3, 20, 21),
+        (1, 4, 22, 23),
+        (2, 1, 10, 12),
+        (2, 2, 20, 22),
+        (3, 1, 10, 20),
+    ):
+        structure.append(
+            id=uuid4(),
+            round_number=round_number,
+            position=position,
+            status="finished",
+            athlete1_id=athlete1_id,
+            athlete2_id=athlete2_id,
+            winner_id=athlete1_id,
+            score_athlete1=0,
+            score_athlete2=0,
+        )
+    return structure
+
+
+class BracketStructureTests(unittest.TestCase):
+    def test_from_planned_round_trips_rows(self) -> None:
+        planned = [match for round_items in plan_single_elimination_bracket([1, 2, 3]) for match in round_items]
+        structure = BracketStructure.from_planned(planned, [uuid4() for _ in planned])
+
+        self.assertEqual(len(structure), 3)
+        first = structure.row(0)
+        self.assertEqual((first.round_number, first.position, first.status), (1, 1, "finished"))
+        self.assertEqual((first.athlete1_id, first.athlete2_id, first.winner_id, first.next_slot), (1, None, 1, 1))
+        final = structure.row(2)
+        self.assertEqual((final.athlete1_id, final.winner_id, final.next_slot), (1, None, None))
+        self.assertEqual(final.stage, "main")
+        self.assertIsNone(final.repechage_side)
+
+    def test_rows_feed_placements_and_repechage(self) -> None:
+        structure = _finished_structure()
+        inputs = [
+            PlacementMatchInput(
+                row.round_number,
+                row.stage,
+                row.status,
+                row.winner_id,
+                row.athlete1_id,
+                row.athlete2_id,
+                row.repechage_side,
+                row.repechage_step,
+                row.position,
+            )
+            for row in structure
+        ]
+
+        self.assertEqual(compute_bracket_placements(structure), compute_bracket_placements(inputs))
+        generation = plan_repechage_generation(10, 20, base_round=4, index=BracketIndex(structure))
+        self.assertEqual([(plan.athlete1_id, plan.athlete2_id) for plan in generation.plans], [(11, 12), (21, 22)])
+
+    def test_to_structure_matches_matches_builder(self) -> None:
+        structure = _finished_structure()
+        expected = [
+            build_structure_match(
+                StructureMatchInput(
+                    id=row.id,
+                    round_number=row.round_number,
+                    position=row.position,
+                    next_slot=row.next_slot,
+                    status=row.status,
+                    athlete1_id=row.athlete1_id,
+                    athlete2_id=row.athlete2_id,
+                    winner_id=row.winner_id,
+                    score_athlete1=0,
+                    score_athlete2=0,
+                    started_at=None,
+                    ended_at=None,
+                ),
+                main_rounds=3,
+            )
+            for row in structure
+        ]
+        self.assertEqual(structure.to_structure_matches(main_rounds=3), expected)
+
+
+if __name__ == "__main__":
+    unittest.main()
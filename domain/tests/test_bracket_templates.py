@@ -0,0 +1,35 @@
+import unittest
+
+from champion_domain.use_cases import (
+    plan_single_elimination,
+    plan_single_elimination_bracket,
+    resolve_bye_advancements,
+    single_elimination_template,
+)
+
+
+class BracketTemplateTests(unittest.TestCase):
+    def test_template_is_cached_per_participant_count(self) -> None:
+        self.assertIs(single_elimination_template(6), single_elimination_template(6))
+        self.assertIsNot(single_elimination_template(6), single_elimination_template(7))
+
+    def test_template_layout(self) -> None:
+        template = single_elimination_template(3)
+        self.assertEqual(template.total_rounds, 2)
+        first_round = template.rounds[0]
+        self.assertEqual([(slot.athlete1_index, slot.athlete2_index) for slot in first_round], [(0, None), (1, 2)])
+        self.assertEqual([slot.next_slot for slot in first_round], [1, 2])
+        self.assertEqual(template.rounds[1][0].round_type, "final")
+        self.assertEqual(template.resolved_rounds[1][0].athlete1_index, 0)
+
+    def test_bracket_plan_matches_explicit_bye_resolution(self) -> None:
+        for count in range(0, 33):
+            athlete_ids = list(range(100, 100 + count))
+            self.assertEqual(
+                plan_single_elimination_bracket(athlete_ids),
+                resolve_bye_advancements(plan_single_elimination(athlete_ids)),
+            )
+
+
+if __name__ == "__main__":
+    unittest.main()
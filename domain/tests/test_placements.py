@@ -1,6 +1,13 @@
 import unittest
+from dataclasses import replace
 
-from champion_domain.use_cases import PlacementMatchInput, compute_bracket_placements
+from champion_domain.use_cases import (
+    BracketIndex,
+    BracketPlacements,
+    PlacementMatchInput,
+    advance_bracket_placements,
+    compute_bracket_placements,
+)
 
 
 class PlacementsTests(unittest.TestCase):
@@ -49,5 +56,78 @@ class PlacementsTests(unittest.TestCase):
         self.assertIsNone(placements.place_3_a_id)
 
 
+class AdvancePlacementsTests(unittest.TestCase):
+    def _rows(self) -> list[PlacementMatchInput]:
+        return [
+            PlacementMatchInput(1, "main", "finished", 10, 10, 11, None, None, position=1),
+            PlacementMatchInput(1, "main", "finished", 20, 20, 21, None, None, position=2),
+            PlacementMatchInput(2, "main", "in_progress", None, 10, 20, None, None, position=1),
+        ]
+
+    def _advance(
+        self, rows: list[PlacementMatchInput], previous: PlacementMatchInput, changed: PlacementMatchInput
+    ) -> tuple[BracketPlacements, BracketPlacements]:
+        updated = [changed if row is previous else row for row in rows]
+        advanced = advance_bracket_placements(
+            compute_bracket_placements(rows), previous, changed, BracketIndex(updated)
+        )
+        assert advanced is not None
+        return advanced, compute_bracket_placements(updated)
+
+    def test_unfinished_change_keeps_placements(self) -> None:
+        rows = self._rows()
+        current = compute_bracket_placements(rows)
+        changed = replace(rows[2], athlete2_id=21)
+        self.assertIs(advance_bracket_placements(current, rows[2], changed), current)
+
+    def test_structural_change_requires_recompute(self) -> None:
+        rows = self._rows()
+        current = compute_bracket_placements(rows)
+        moved = replace(rows[2], position=2)
+        self.assertIsNone(advance_bracket_placements(current, rows[2], moved, BracketIndex(rows)))
+        self.assertIsNone(advance_bracket_placements(current, None, rows[2], BracketIndex(rows)))
+
+    def test_finished_final_sets_podium(self) -> None:
+        rows = self._rows()
+        finished = replace(rows[2], status="finished", winner_id=20)
+        advanced, expected = self._advance(rows, rows[2], finished)
+        self.assertEqual(advanced, expected)
+        self.assertEqual(advanced, BracketPlacements(20, 10, 11, 21))
+
+    def test_reopened_final_clears_podium(self) -> None:
+        rows = self._rows()
+        rows[2] = replace(rows[2], status="finished", winner_id=10)
+        reopened = replace(rows[2], status="in_progress", winner_id=None)
+        advanced, expected = self._advance(rows, rows[2], reopened)
+        self.assertEqual(advanced, expected)
+        self.assertEqual(advanced, BracketPlacements(None, None, None, None))
+
+    def test_last_repechage_match_sets_its_side_bronze(self) -> None:
+        rows = [
+            *self._rows()[:2],
+            PlacementMatchInput(2, "main", "finished", 10, 10, 20, None, None, position=1),
+            PlacementMatchInput(3, "repechage", "finished", 31, 11, 31, "A", 1),
+            PlacementMatchInput(3, "repechage", "in_progress", None, 21, 41, "B", 1),
+        ]
+        finished = replace(rows[4], status="finished", winner_id=41)
+        advanced, expected = self._advance(rows, rows[4], finished)
+        self.assertEqual(advanced, expected)
+        self.assertEqual(advanced, BracketPlacements(10, 20, 31, 41))
+
+        reopened = replace(rows[3], status="in_progress", winner_id=None)
+        advanced, expected = self._advance(rows, rows[3], reopened)
+        self.assertEqual(advanced, expected)
+        self.assertIsNone(advanced.place_3_a_id)
+
+    def test_corrected_semifinal_updates_direct_bronze(self) -> None:
+        rows = self._rows()
+        rows[2] = replace(rows[2], status="finished", winner_id=10)
+        corrected = replace(rows[0], winner_id=None, status="in_progress")
+        advanced, expected = self._advance(rows, rows[0], corrected)
+        self.assertEqual(advanced, expected)
+        self.assertIsNone(advanced.place_3_a_id)
+        self.assertEqual(advanced.place_3_b_id, 21)
+
+
 if __name__ == "__main__":
     unittest.main()
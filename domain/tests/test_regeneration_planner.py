@@ -1,6 +1,28 @@
 import unittest
+from concurrent.futures import ProcessPoolExecutor
 
-from champion_domain.use_cases import SeededParticipant, plan_bracket_matches
+from champion_domain.use_cases import (
+    BracketPlanRequest,
+    SeededParticipant,
+    plan_bracket_matches,
+    plan_tournament_brackets,
+)
+
+
+def _requests() -> list[BracketPlanRequest[int]]:
+    return [
+        BracketPlanRequest(
+            key=key,
+            bracket_type=bracket_type,
+            participants=tuple(SeededParticipant(seed, key * 100 + seed) for seed in range(1, size + 1)),
+        )
+        for key, bracket_type, size in (
+            (1, "single_elimination", 5),
+            (2, "round_robin", 4),
+            (3, "single_elimination", 1),
+            (4, "single_elimination", 5),
+        )
+    ]
 
 
 class RegenerationPlannerTests(unittest.TestCase):
@@ -35,6 +57,26 @@ class RegenerationPlannerTests(unittest.TestCase):
         with self.assertRaises(ValueError):
             plan_bracket_matches("swiss", [SeededParticipant(seed=1, athlete_id=101)])
 
+    def test_plan_tournament_brackets_matches_per_bracket_planning(self) -> None:
+        requests = _requests()
+        plans = plan_tournament_brackets(requests)
+
+        self.assertEqual([plan.key for plan in plans], [1, 2, 3, 4])
+        self.assertEqual(plans[2].matches, ())
+        for request, plan in zip(requests, plans, strict=True):
+            if plan.matches:
+                expected = plan_bracket_matches(request.bracket_type, list(request.participants))
+                self.assertEqual(list(plan.matches), expected)
+
+    def test_plan_tournament_brackets_with_process_pool(self) -> None:
+        with ProcessPoolExecutor(max_workers=2) as executor:
+            pooled = plan_tournament_brackets(_requests(), executor=executor, chunksize=1)
+        self.assertEqual(pooled, plan_tournament_brackets(_requests()))
+
+    def test_plan_tournament_brackets_rejects_unsupported_type(self) -> None:
+        with self.assertRaises(ValueError):
+            plan_tournament_brackets([BracketPlanRequest(key=1, bracket_type="swiss", participants=())])
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,73 @@
+import unittest
+from dataclasses import replace
+from uuid import uuid4
+
+from champion_domain.use_cases import (
+    StructureMatch,
+    StructureParticipant,
+    StructurePatch,
+    StructureSnapshot,
+    apply_structure_patch,
+    diff_structure_snapshots,
+)
+
+
+def _match(round_number: int, position: int) -> StructureMatch:
+    return StructureMatch(
+        id=uuid4(),
+        round_number=round_number,
+        position=position,
+        next_slot=None,
+        round_type="round",
+        stage="main",
+        status="not_started",
+        athlete1_id=None,
+        athlete2_id=None,
+        winner_id=None,
+        score_athlete1=None,
+        score_athlete2=None,
+        repechage_side=None,
+        repechage_step=None,
+        started_at=None,
+        ended_at=None,
+    )
+
+
+def _snapshot() -> StructureSnapshot:
+    return StructureSnapshot(
+        participants=(StructureParticipant(athlete_id=1, seed=1), StructureParticipant(athlete_id=2, seed=2)),
+        matches=(_match(1, 1), _match(1, 2), _match(2, 1)),
+    )
+
+
+class StructureDiffTests(unittest.TestCase):
+    def test_identical_snapshots_produce_empty_patch(self) -> None:
+        snapshot = _snapshot()
+        self.assertTrue(diff_structure_snapshots(snapshot, snapshot).is_empty)
+
+    def test_diff_reports_only_changes(self) -> None:
+        old = _snapshot()
+        finished = replace(old.matches[0], status="finished", winner_id=1)
+        added = _match(3, 1)
+        new = StructureSnapshot(
+            participants=(StructureParticipant(athlete_id=3, seed=2), StructureParticipant(athlete_id=4, seed=3)),
+            matches=(finished, old.matches[2], added),
+        )
+
+        patch = diff_structure_snapshots(old, new)
+
+        self.assertEqual(patch.added_matches, (added,))
+        self.assertEqual(patch.changed_matches, (finished,))
+        self.assertEqual(patch.removed_match_ids, (old.matches[1].id,))
+        self.assertEqual(patch.added_participants, (StructureParticipant(athlete_id=4, seed=3),))
+        self.assertEqual(patch.changed_participants, (StructureParticipant(athlete_id=3, seed=2),))
+        self.assertEqual(patch.removed_participant_seeds, (1,))
+        self.assertEqual(apply_structure_patch(old, patch), new)
+
+    def test_apply_rejects_unknown_match(self) -> None:
+        with self.assertRaises(ValueError):
+            apply_structure_patch(_snapshot(), StructurePatch(changed_matches=(_match(1, 1),)))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -2,7 +2,7 @@ from champion_domain import compute_main_rounds
 from fastapi import APIRouter, Depends, HTTPException, Query
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
+from sqlalchemy.orm import contains_eager, selectinload
 
 from src.database import get_db
 from src.models import Bracket, BracketMatch, Match
@@ -37,6 +37,7 @@ async def get_bracket_matches(bracket_id: int, db: AsyncSession = Depends(get_db
         .join(Bracket, BracketMatch.bracket_id == Bracket.id)
         .where(Bracket.external_id == bracket_id)
         .options(
+            contains_eager(BracketMatch.bracket),
             selectinload(BracketMatch.match).selectinload(Match.athlete1),
             selectinload(BracketMatch.match).selectinload(Match.athlete2),
         )
@@ -4,7 +4,13 @@ from datetime import datetime, timezone
 from typing import Sequence
 from uuid import uuid4
 
-from champion_domain import SeededParticipant, is_bracket_structurally_mutable, plan_bracket_matches
+from champion_domain import (
+    BracketPlanRequest,
+    SeededParticipant,
+    is_bracket_structurally_mutable,
+    plan_tournament_brackets,
+)
+from champion_domain.use_cases import PlannedMatch
 from fastapi import HTTPException
 from sqlalchemy import delete, select
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -82,33 +88,23 @@ async def _clear_bracket_matches(db: AsyncSession, bracket_id: int) -> None:
     await db.execute(delete(BracketMatch).where(BracketMatch.bracket_id == bracket_id))
 
 
-async def regenerate_bracket(db: AsyncSession, bracket: Bracket) -> None:
-    _ensure_bracket_editable(bracket)
-    bracket.version = max(1, bracket.version + 1)
-
-    await _clear_bracket_matches(db, bracket.id)
-
+async def _load_plan_request(db: AsyncSession, bracket: Bracket) -> BracketPlanRequest[int]:
     result = await db.execute(
-        select(BracketParticipant)
-        .where(BracketParticipant.bracket_id == bracket.id)
+        select(BracketParticipant.seed, BracketParticipant.athlete_id)
+        .where(BracketParticipant.bracket_id == bracket.id, BracketParticipant.athlete_id.is_not(None))
         .order_by(BracketParticipant.seed.asc())
     )
-    participants = result.scalars().all()
-    seeded = [
-        SeededParticipant(seed=participant.seed, athlete_id=participant.athlete_id)
-        for participant in participants
-        if participant.athlete_id is not None
-    ]
-
-    if len(seeded) < 2:
-        await db.flush()
-        return
-
-    planned_matches = plan_bracket_matches(
+    return BracketPlanRequest(
+        key=bracket.id,
         bracket_type=bracket.type,
-        participants=seeded,
+        participants=tuple(SeededParticipant(seed=seed, athlete_id=athlete_id) for seed, athlete_id in result.all()),
     )
 
+
+async def _write_planned_matches(db: AsyncSession, bracket: Bracket, planned_matches: Sequence[PlannedMatch]) -> None:
+    bracket.version = max(1, bracket.version + 1)
+    await _clear_bracket_matches(db, bracket.id)
+
     for planned in planned_matches:
         is_bye_win = planned.status == "finished" and planned.winner_id is not None
         match = Match(
@@ -138,9 +134,22 @@ async def regenerate_bracket(db: AsyncSession, bracket: Bracket) -> None:
     await db.flush()
 
 
-async def regenerate_brackets_and_enqueue_upserts(db: AsyncSession, brackets: Sequence[Bracket]) -> None:
+async def regenerate_brackets(db: AsyncSession, brackets: Sequence[Bracket]) -> None:
     for bracket in brackets:
-        await regenerate_bracket(db, bracket)
+        _ensure_bracket_editable(bracket)
+
+    requests = [await _load_plan_request(db, bracket) for bracket in brackets]
+    plans = plan_tournament_brackets(requests)
+    for bracket, plan in zip(brackets, plans, strict=True):
+        await _write_planned_matches(db, bracket, plan.matches)
+
+
+async def regenerate_bracket(db: AsyncSession, bracket: Bracket) -> None:
+    await regenerate_brackets(db, [bracket])
+
+
+async def regenerate_brackets_and_enqueue_upserts(db: AsyncSession, brackets: Sequence[Bracket]) -> None:
+    await regenerate_brackets(db, brackets)
     for bracket in brackets:
         await create_bracket_upsert_outbox(bracket, db)
 
@@ -2,14 +2,11 @@ from datetime import datetime, timezone
 from uuid import uuid4
 
 from champion_domain import (
-    FinishedMainMatch,
-    ProgressionAction,
+    BracketChangeSet,
+    BracketRuntime,
+    RuntimeMatch,
     classify_bracket_match,
     compute_main_rounds,
-    decide_finish_flow_post,
-    decide_finish_flow_runtime,
-    plan_repechage_generation,
-    should_generate_repechage,
 )
 from fastapi import HTTPException
 from sqlalchemy import func, select
@@ -40,54 +37,6 @@ async def _load_match_by_external_id_or_404(db: AsyncSession, match_id: str) ->
     return match
 
 
-async def _apply_winner_to_next_match(
-    db: AsyncSession,
-    bm: BracketMatch,
-    winner_id: int,
-    action: ProgressionAction,
-) -> None:
-    if action.kind == "repechage":
-        if action.repechage_round_number is None or action.repechage_position is None:
-            return
-        next_bm = (
-            await db.execute(
-                select(BracketMatch).where(
-                    BracketMatch.bracket_id == bm.bracket_id,
-                    BracketMatch.round_number == action.repechage_round_number,
-                    BracketMatch.position == action.repechage_position,
-                )
-            )
-        ).scalar_one_or_none()
-        if next_bm is None:
-            return
-        next_match = await db.get(Match, next_bm.match_id)
-        if next_match is not None:
-            next_match.athlete1_id = winner_id
-        return
-
-    if action.kind == "main":
-        if action.main_round_number is None or action.main_position is None:
-            return
-        next_bm = (
-            await db.execute(
-                select(BracketMatch).where(
-                    BracketMatch.bracket_id == bm.bracket_id,
-                    BracketMatch.round_number == action.main_round_number,
-                    BracketMatch.position == action.main_position,
-                )
-            )
-        ).scalar_one_or_none()
-        if next_bm is None:
-            return
-        next_match = await db.get(Match, next_bm.match_id)
-        if next_match is None or next_match.stage != "main":
-            return
-        if action.slot == 1:
-            next_match.athlete1_id = winner_id
-        else:
-            next_match.athlete2_id = winner_id
-
-
 async def _get_bracket_for_match(match_id: int, db: AsyncSession) -> Bracket | None:
     result = await db.execute(
         select(Bracket)
@@ -107,116 +56,85 @@ async def _get_main_rounds_count(bracket_id: int, db: AsyncSession) -> int:
     return int(compute_main_rounds(count))
 
 
-async def _ensure_repechage_generated(bracket_id: int, db: AsyncSession) -> bool:
-    bracket = await db.get(Bracket, bracket_id)
-    if bracket is None:
-        return False
-
-    main_rounds = await _get_main_rounds_count(bracket_id, db)
-
-    has_repechage_matches = bool(
-        await db.scalar(
-            select(func.count())
-            .select_from(BracketMatch)
-            .where(
-                BracketMatch.bracket_id == bracket_id,
-                BracketMatch.round_number > main_rounds,
-            )
-        )
-    )
-
-    final_bm = (
-        await db.execute(
-            select(BracketMatch).where(
-                BracketMatch.bracket_id == bracket_id,
-                BracketMatch.round_number == main_rounds,
-                BracketMatch.position == 1,
-            )
-        )
-    ).scalar_one_or_none()
-    if final_bm is None:
-        return False
-
-    final_match = await db.get(Match, final_bm.match_id)
-    finalist_a_id = final_match.athlete1_id if final_match is not None else None
-    finalist_b_id = final_match.athlete2_id if final_match is not None else None
-    if not should_generate_repechage(
-        bracket_type=bracket.type,
-        main_rounds=main_rounds,
-        has_repechage_matches=has_repechage_matches,
-        finalist_a_id=finalist_a_id,
-        finalist_b_id=finalist_b_id,
-    ):
-        return False
-
-    finished_main_rows = (
+async def _load_bracket_runtime(bracket: Bracket, db: AsyncSession) -> tuple[BracketRuntime[str], dict[str, Match]]:
+    main_rounds = await _get_main_rounds_count(bracket.id, db)
+    rows = (
         await db.execute(
             select(BracketMatch, Match)
             .join(Match, Match.id == BracketMatch.match_id)
-            .where(
-                BracketMatch.bracket_id == bracket_id,
-                BracketMatch.round_number < main_rounds,
-                Match.status == "finished",
-            )
+            .where(BracketMatch.bracket_id == bracket.id)
         )
     ).all()
 
-    finished_main_matches = [
-        FinishedMainMatch(
+    def to_runtime_match(bm_row: BracketMatch, match: Match) -> RuntimeMatch[str]:
+        classification = classify_bracket_match(
             round_number=bm_row.round_number,
-            winner_id=match.winner_id,
+            position=bm_row.position,
+            main_rounds=main_rounds,
+            bracket_type=bracket.type,
+        )
+        return RuntimeMatch(
+            key=match.external_id,
+            round_number=bm_row.round_number,
+            position=bm_row.position,
+            stage=match.stage or classification.stage,
+            status=match.status,
             athlete1_id=match.athlete1_id,
             athlete2_id=match.athlete2_id,
+            winner_id=match.winner_id,
+            next_slot=bm_row.next_slot,
+            repechage_side=match.repechage_side or classification.repechage_side,
+            repechage_step=(
+                match.repechage_step if match.repechage_step is not None else classification.repechage_step
+            ),
         )
-        for bm_row, match in finished_main_rows
-    ]
 
-    max_round = await db.scalar(
-        select(func.max(BracketMatch.round_number)).where(BracketMatch.bracket_id == bracket_id)
-    )
-    base_round = int(max_round or main_rounds) + 1
-
-    generation = plan_repechage_generation(
-        finalist_a_id=finalist_a_id,
-        finalist_b_id=finalist_b_id,
-        finished_main_matches=finished_main_matches,
-        base_round=base_round,
-    )
-    logger.info(
-        "repechage_plan bracket_id=%s main_rounds=%s finished_main=%s plans=%s",
-        bracket_id,
-        main_rounds,
-        len(finished_main_matches),
-        len(generation.plans),
+    runtime = BracketRuntime(
+        bracket.type,
+        bracket.status,
+        (to_runtime_match(bm_row, match) for bm_row, match in rows),
+        new_key=lambda: str(uuid4()),
     )
+    return runtime, {match.external_id: match for _, match in rows}
 
-    if not generation.plans:
-        return False
 
-    for plan in generation.plans:
+def _apply_bracket_changes(
+    bracket: Bracket,
+    matches_by_key: dict[str, Match],
+    changes: BracketChangeSet[str],
+    db: AsyncSession,
+) -> None:
+    for item in changes.updated:
+        loaded = matches_by_key.get(item.key)
+        if loaded is None:
+            continue
+        loaded.athlete1_id = item.athlete1_id
+        loaded.athlete2_id = item.athlete2_id
+
+    for item in changes.inserted:
         rep_match = Match(
-            external_id=str(uuid4()),
-            athlete1_id=plan.athlete1_id,
-            athlete2_id=plan.athlete2_id,
+            external_id=item.key,
+            athlete1_id=item.athlete1_id,
+            athlete2_id=item.athlete2_id,
             round_type="round",
-            stage="repechage",
-            repechage_side=plan.side,
-            repechage_step=plan.step,
-            status="not_started",
+            stage=item.stage,
+            repechage_side=item.repechage_side,
+            repechage_step=item.repechage_step,
+            status=item.status,
         )
         db.add(rep_match)
-        await db.flush()
         db.add(
             BracketMatch(
                 external_id=str(uuid4()),
-                bracket_id=bracket_id,
-                round_number=plan.round_number,
-                position=plan.position,
-                match_id=rep_match.id,
-                next_slot=1 if plan.step < generation.max_step_by_side.get(plan.side, plan.step) else None,
+                bracket_id=bracket.id,
+                round_number=item.round_number,
+                position=item.position,
+                match=rep_match,
+                next_slot=item.next_slot,
             )
         )
-    return True
+    if changes.inserted:
+        logger.info("repechage_generated bracket_id=%s matches=%s", bracket.id, len(changes.inserted))
 
 
 def _touch_bracket(bracket: Bracket) -> int:
@@ -298,70 +216,16 @@ async def finish_match(match_id: str, finish_data: FinishMatchSchema, db: AsyncS
     match.status = "finished"
     match.ended_at = datetime.now(timezone.utc)
 
-    bm_result = await db.execute(select(BracketMatch).where(BracketMatch.match_id == match.id))
-    bm = bm_result.scalar_one_or_none()
-
     bracket = await _get_bracket_for_match(match.id, db)
     aggregate_version = 1
     if bracket is not None:
         aggregate_version = _touch_bracket(bracket)
-
-    if bm:
-        main_rounds = await _get_main_rounds_count(bm.bracket_id, db)
-        classification = classify_bracket_match(
-            round_number=bm.round_number,
-            position=bm.position,
-            main_rounds=main_rounds,
-        )
-        stage = match.stage or ("repechage" if classification.is_repechage else "main")
-        is_repechage_match = stage == "repechage"
-        repechage_side = match.repechage_side or classification.repechage_side
-        repechage_step = match.repechage_step if match.repechage_step is not None else classification.repechage_step
-
-        runtime = decide_finish_flow_runtime(
-            origin="local",
-            stage=stage,
-            current_round_number=bm.round_number,
-            current_position=bm.position,
-            explicit_next_slot=bm.next_slot,
-            repechage_side=repechage_side,
-            repechage_step=repechage_step,
-            allow_implicit_main_slot=False,
-            main_rounds=main_rounds,
-        )
-        action = runtime.progression_action
-        if action is not None:
-            await _apply_winner_to_next_match(
-                db,
-                bm,
-                match.winner_id,
-                action,
-            )
-
-        generated_repechage = False
-        if runtime.attempt_generate_repechage:
-            generated_repechage = await _ensure_repechage_generated(bm.bracket_id, db)
-
-        if bracket is not None:
-            total_matches = await db.scalar(
-                select(func.count()).select_from(BracketMatch).where(BracketMatch.bracket_id == bm.bracket_id)
-            )
-            finished_matches = await db.scalar(
-                select(func.count())
-                .select_from(Match)
-                .join(BracketMatch, BracketMatch.match_id == Match.id)
-                .where(BracketMatch.bracket_id == bm.bracket_id, Match.status == "finished")
-            )
-            post = decide_finish_flow_post(
-                is_repechage_match=is_repechage_match,
-                generated_repechage=generated_repechage,
-                total_matches=total_matches,
-                finished_matches=finished_matches,
-                current_bracket_status=bracket.status,
-            )
-            if post.completion.should_finish_bracket:
-                bracket.status = "finished"
-                bracket.state = "finished"
+        runtime, matches_by_key = await _load_bracket_runtime(bracket, db)
+        changes = runtime.apply_result(match.external_id, match.winner_id)
+        _apply_bracket_changes(bracket, matches_by_key, changes, db)
+        if changes.finish_bracket:
+            bracket.status = "finished"
+            bracket.state = "finished"
 
     await create_match_finish_outbox(
         match,
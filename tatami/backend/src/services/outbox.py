@@ -4,15 +4,14 @@ from typing import Any, Optional
 from uuid import uuid4
 
 from champion_domain import (
-    StructureMatchInput,
+    BracketStructure,
     StructureParticipantInput,
-    build_structure_match,
     build_structure_participants,
     compute_main_rounds,
 )
-from sqlalchemy import func, select
+from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
+from sqlalchemy.orm import aliased, selectinload
 
 from src.config import EDGE_ID, EXTERNAL_API_URL
 from src.models import Athlete, Bracket, BracketMatch, BracketParticipant, Match, OutboxItem
@@ -207,24 +206,49 @@ async def create_bracket_upsert_outbox(bracket: Bracket, db: AsyncSession) -> Ou
     )
     participants = participants_result.scalars().all()
 
+    athlete1 = aliased(Athlete)
+    athlete2 = aliased(Athlete)
+    winner = aliased(Athlete)
     matches_result = await db.execute(
-        select(BracketMatch)
-        .where(BracketMatch.bracket_id == bracket.id)
-        .options(
-            selectinload(BracketMatch.match).selectinload(Match.athlete1),
-            selectinload(BracketMatch.match).selectinload(Match.athlete2),
+        select(
+            Match.external_id.label("match_external_id"),
+            BracketMatch.round_number,
+            BracketMatch.position,
+            BracketMatch.next_slot,
+            Match.status,
+            athlete1.external_id.label("athlete1_external_id"),
+            athlete2.external_id.label("athlete2_external_id"),
+            winner.external_id.label("winner_external_id"),
+            Match.score_athlete1,
+            Match.score_athlete2,
+            Match.started_at,
+            Match.ended_at,
         )
+        .join(Match, Match.id == BracketMatch.match_id)
+        .outerjoin(athlete1, athlete1.id == Match.athlete1_id)
+        .outerjoin(athlete2, athlete2.id == Match.athlete2_id)
+        .outerjoin(winner, winner.id == Match.winner_id)
+        .where(BracketMatch.bracket_id == bracket.id)
         .order_by(BracketMatch.round_number.asc(), BracketMatch.position.asc())
     )
-    bracket_matches = matches_result.scalars().all()
+    structure = BracketStructure()
+    for row in matches_result.all():
+        structure.append(
+            id=row.match_external_id,
+            round_number=row.round_number,
+            position=row.position,
+            next_slot=row.next_slot,
+            status=row.status,
+            athlete1_id=row.athlete1_external_id,
+            athlete2_id=row.athlete2_external_id,
+            winner_id=row.winner_external_id,
+            score_athlete1=row.score_athlete1,
+            score_athlete2=row.score_athlete2,
+            started_at=row.started_at,
+            ended_at=row.ended_at,
+        )
 
-    participants_count = await db.scalar(
-        select(func.count())
-        .select_from(BracketParticipant)
-        .where(BracketParticipant.bracket_id == bracket.id, BracketParticipant.athlete_id.is_not(None))
-    )
-    count = int(participants_count) if participants_count is not None else None
-    main_rounds = compute_main_rounds(count)
+    main_rounds = compute_main_rounds(sum(1 for participant in participants if participant.athlete_id is not None))
 
     payload_participants = build_structure_participants(
         StructureParticipantInput(
@@ -233,37 +257,7 @@ async def create_bracket_upsert_outbox(bracket: Bracket, db: AsyncSession) -> Ou
         )
         for participant in participants
     )
-
-    payload_matches = []
-    for bm in bracket_matches:
-        match = bm.match
-        if match is None:
-            continue
-
-        winner_external_id: int | None = None
-        if match.winner_id is not None:
-            winner = await db.get(Athlete, match.winner_id)
-            winner_external_id = winner.external_id if winner else None
-
-        payload_matches.append(
-            build_structure_match(
-                input_data=StructureMatchInput(
-                    id=match.external_id,
-                    round_number=bm.round_number,
-                    position=bm.position,
-                    next_slot=bm.next_slot,
-                    status=match.status,
-                    athlete1_id=match.athlete1.external_id if match.athlete1 else None,
-                    athlete2_id=match.athlete2.external_id if match.athlete2 else None,
-                    winner_id=winner_external_id,
-                    score_athlete1=match.score_athlete1,
-                    score_athlete2=match.score_athlete2,
-                    started_at=match.started_at,
-                    ended_at=match.ended_at,
-                ),
-                main_rounds=main_rounds,
-            )
-        )
+    payload_matches = structure.to_structure_matches(main_rounds, bracket.type)
 
     payload = make_bracket_upsert_payload(
         bracket_type=bracket.type,
@@ -47,6 +47,7 @@ def to_bracket_match_schema(bracket_match: BracketMatch, main_rounds: int) -> Br
             round_number=bracket_match.round_number,
             position=bracket_match.position,
             main_rounds=main_rounds,
+            bracket_type=bracket_match.bracket.type,
         ).round_type
     return BracketMatchSchema(
         id=bracket_match.id,